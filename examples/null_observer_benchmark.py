@@ -0,0 +1,83 @@
+# Copyright 2017 SrMouraSilva
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Compares the cost of the model objects observing changes with
+:class:`.NullObserver` against the previous ``unittest.mock.MagicMock``
+placeholder, building large banks and changing the params of detached effects.
+
+Run with ``python examples/null_observer_benchmark.py``.
+"""
+
+import timeit
+from contextlib import ExitStack
+from unittest.mock import MagicMock, patch
+
+from pluginsmanager.model.bank import Bank
+from pluginsmanager.model.lv2.lv2_effect_builder import Lv2EffectBuilder
+from pluginsmanager.model.pedalboard import Pedalboard
+
+
+PEDALBOARDS = 10
+EFFECTS = 10
+REPEAT = 3
+
+MODULES = [
+    'pluginsmanager.banks_manager',
+    'pluginsmanager.model.bank',
+    'pluginsmanager.model.effect',
+    'pluginsmanager.model.param',
+    'pluginsmanager.model.pedalboard',
+    'pluginsmanager.model.port',
+]
+
+builder = Lv2EffectBuilder(ignore_unsupported_plugins=False, use_cache=False)
+uris = sorted(uri for uri, plugin in builder.all.items() if plugin['ports']['control']['input'])[:EFFECTS]
+
+
+def build_bank():
+    bank = Bank('Benchmark')
+    for i in range(PEDALBOARDS):
+        pedalboard = Pedalboard('Pedalboard {}'.format(i))
+        bank.append(pedalboard)
+        for uri in uris:
+            pedalboard.append(builder.build(uri))
+
+    return bank
+
+
+def change_params():
+    for uri in uris:
+        effect = builder.build(uri)
+        for param in effect.params:
+            for _ in range(100):
+                param.value = param.default
+
+
+def measure(label):
+    construction = min(timeit.repeat(build_bank, number=1, repeat=REPEAT))
+    notification = min(timeit.repeat(change_params, number=1, repeat=REPEAT))
+
+    print('{:<12} bank with {} effects: {:8.2f} ms    detached param changes: {:8.2f} ms'.format(
+        label, PEDALBOARDS * EFFECTS, construction * 1000, notification * 1000
+    ))
+
+
+if __name__ == '__main__':
+    measure('NullObserver')
+
+    with ExitStack() as stack:
+        for module in MODULES:
+            stack.enter_context(patch(module + '.NullObserver', MagicMock))
+        measure('MagicMock')
@@ -12,11 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from unittest.mock import MagicMock
+from pluginsmanager.observer.null_observer import NullObserver
 
 from pluginsmanager.observer.update_type import UpdateType
 from pluginsmanager.observer.observer_manager import ObserverManager
 from pluginsmanager.observer.observable_list import ObservableList
+from pluginsmanager.observer.subscription import Subscription
 
 
 class BanksManager(object):
@@ -28,17 +29,27 @@ class BanksManager(object):
 
     For use details, view Readme.rst example documentation.
 
+    Param changes can be coalesced, for reduce the host and persistence work
+    when a controller (like an expression pedal) changes many times a param value::
+
+        >>> # The observers will be notified at most every 50ms about a param
+        >>> manager = BanksManager(param_flush_interval=0.05)
+
     :param list[Bank] banks: Banks that will be added in this. Useful
                              for loads banks previously loaded, like
                              banks persisted and recovered.
+    :param float param_flush_interval: Seconds for coalesce the param changes
+                                       (only the last value of a param is notified).
+                                       ``None`` (default) notifies all param changes immediately.
+                                       See :class:`.ObserverManager`
     """
 
-    def __init__(self, banks=None):
+    def __init__(self, banks=None, param_flush_interval=None):
         self.banks = ObservableList()
         self.banks.observer = self._banks_observer
 
         banks = [] if banks is None else banks
-        self.observer_manager = ObserverManager()
+        self.observer_manager = ObserverManager(param_flush_interval)
 
         for bank in banks:
             self.append(bank)
@@ -55,15 +66,33 @@ class BanksManager(object):
         """
         return self.banks.__iter__()
 
-    def register(self, observer):
+    def register(self, observer, asynchronous=False, priority=0, events=None, bank=None, pedalboard=None):
         """
         Register an observer for it be notified when occurs changes.
 
         For more details, see :class:`.UpdatesObserver`
 
+        Slow observers (like disk or network based) can be notified in a worker thread,
+        so they don't delay the other observers (like the host)::
+
+            >>> banks_manager.register(mod_host, priority=10)
+            >>> banks_manager.register(autosaver, asynchronous=True)
+
         :param UpdatesObserver observer: Observer that will be notified then occurs changes
+        :param bool asynchronous: Notifies the observer in a worker thread, in the changes order.
+                                  See :class:`.QueuedDispatcher`
+        :param int priority: Synchronous observers with greater priority are notified first
+        :param list[string] events: :class:`.UpdatesObserver` methods that the observer is interested,
+                                    like ``['on_effect_status_toggled']``. ``None`` (default) for all.
+                                    See :class:`.Subscription`
+        :param Bank bank: Notifies only the changes of this bank
+        :param Pedalboard pedalboard: Notifies only the changes of this pedalboard
         """
-        self.observer_manager.append(observer)
+        subscription = None
+        if events is not None or bank is not None or pedalboard is not None:
+            subscription = Subscription(events, bank, pedalboard)
+
+        self.observer_manager.append(observer, asynchronous=asynchronous, priority=priority, subscription=subscription)
         observer.manager = self
 
     def unregister(self, observer):
@@ -74,7 +103,7 @@ class BanksManager(object):
         :param UpdatesObserver observer: Observer you will not receive any more notifications then
                                          occurs changes.
         """
-        self.observer_manager.observers.remove(observer)
+        self.observer_manager.remove(observer)
         observer.manager = None
 
     def append(self, bank):
@@ -108,7 +137,41 @@ class BanksManager(object):
 
     def _clear_bank(self, bank):
         bank.manager = None
-        bank.observer_manager = MagicMock()
+        bank.observer = NullObserver()
+
+    def batch(self):
+        """
+        Groups the changes made inside the ``with`` block. The observers are notified
+        once, when the block finishes, by :meth:`.UpdatesObserver.on_batch`::
+
+            >>> with banks_manager.batch():
+            ...     for effect in effects:
+            ...         pedalboard.append(effect)
+            ...     pedalboard.connect(effects[0].outputs[0], effects[1].inputs[0])
+
+        So, observers like :class:`.Autosaver` and :class:`.ModHost` can save and
+        send the changes once. See :meth:`.ObserverManager.batch`
+        """
+        return self.observer_manager.batch()
+
+    def flush(self):
+        """
+        Notifies the observers immediately about the param changes
+        not yet notified (when ``param_flush_interval`` is used)
+        """
+        self.observer_manager.flush()
+
+    def join(self):
+        """
+        Waits until the asynchronous observers are notified about all changes occurred
+        """
+        self.observer_manager.join()
+
+    def close(self):
+        """
+        Notifies the pending changes and stops the asynchronous observers threads
+        """
+        self.observer_manager.close()
 
     def enter_scope(self, observer):
         """
@@ -15,7 +15,7 @@
 from pluginsmanager.observer.observable_list import ObservableList
 from pluginsmanager.observer.update_type import UpdateType, CustomChange
 
-from unittest.mock import MagicMock
+from pluginsmanager.observer.null_observer import NullObserver
 from pluginsmanager.observer.autosaver.indexable import Indexable
 
 
@@ -72,7 +72,7 @@ class Bank(Indexable):
 
         self.manager = None
 
-        self._observer = MagicMock()
+        self._observer = NullObserver()
 
     @property
     def observer(self):
@@ -109,7 +109,7 @@ class Bank(Indexable):
 
     def _clear_pedalboard(self, pedalboard):
         pedalboard.bank = None
-        pedalboard.observer = MagicMock()
+        pedalboard.observer = NullObserver()
 
     @property
     def json(self):
@@ -181,3 +181,10 @@ class Bank(Indexable):
     @property
     def simple_identifier(self):
         return self.name
+
+    @property
+    def header(self):
+        return {
+            'name': self.name,
+            'pedalboards': [pedalboard.name for pedalboard in self.pedalboards]
+        }
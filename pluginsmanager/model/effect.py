@@ -13,7 +13,7 @@
 # limitations under the License.
 
 from abc import ABCMeta, abstractmethod
-from unittest.mock import MagicMock
+from pluginsmanager.observer.null_observer import NullObserver
 
 from pluginsmanager.util.dict_tuple import DictTuple
 
@@ -59,7 +59,7 @@ class Effect(metaclass=ABCMeta):
         self._midi_inputs = DictTuple([], lambda: None)
         self._midi_outputs = DictTuple([], lambda: None)
 
-        self._observer = MagicMock()
+        self._observer = NullObserver()
 
     @property
     def observer(self):
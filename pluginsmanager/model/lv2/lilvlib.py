@@ -11,6 +11,7 @@ import json
 import lilv
 import os
 
+from concurrent.futures import ProcessPoolExecutor
 from math import fmod
 
 # ------------------------------------------------------------------------------------------------------------
@@ -1389,22 +1390,74 @@ def get_plugin_info(world, plugin, useAbsolutePath = True):
 
 # Get info from a simple URI, without the need of your own lilv world
 # This is used by get_plugins_info in MOD-SDK
-def get_plugin_info_helper(uri):
+# @a workers is the number of processes (None uses the number of cpus). With more than one,
+#   the installed bundles are read in parallel (see get_plugins_info)
+def get_plugin_info_helper(uri, workers=1):
     world = lilv.World()
     world.load_all()
     plugins = world.get_all_plugins()
-    return [get_plugin_info(world, p, False) for p in plugins]
+
+    if workers == 1:
+        return [get_plugin_info(world, p, False) for p in plugins]
+
+    bundles = []
+    for p in plugins:
+        bundle = lilv.lilv_uri_to_path(p.get_bundle_uri().as_string())
+        if bundle not in bundles:
+            bundles.append(bundle)
+
+    return get_plugins_info(bundles, workers)
 
 # ------------------------------------------------------------------------------------------------------------
 # get_plugins_info
 
 # Get plugin-related info from a list of lv2 bundles
 # @a bundles is a list of strings, consisting of directories in the filesystem (absolute pathnames).
-def get_plugins_info(bundles):
+# @a workers is the number of processes (None uses the number of cpus). With more than one,
+#   the bundles are partitioned across the processes (each one with its own lilv world)
+#   and the plugins are returned sorted by uri
+def get_plugins_info(bundles, workers=1):
     # if empty, do nothing
     if len(bundles) == 0:
         raise Exception('get_plugins_info() - no bundles provided')
 
+    if workers != 1 and len(bundles) > 1:
+        plugins = get_plugins_info_parallel(bundles, workers)
+    else:
+        plugins = get_bundles_plugins_info(bundles)
+
+    # make sure the bundles include something
+    if len(plugins) == 0:
+        raise Exception('get_plugins_info() - selected bundles have no plugins')
+
+    return plugins
+
+# ------------------------------------------------------------------------------------------------------------
+# get_plugins_info_parallel
+
+# Partitions the bundles across @a workers processes and merges the plugins info sorted by uri
+def get_plugins_info_parallel(bundles, workers=None):
+    workers = min(workers or os.cpu_count() or 1, len(bundles))
+
+    # round-robin, so the slow bundles tend to be distributed
+    partitions = [bundles[i::workers] for i in range(workers)]
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(get_bundles_plugins_info, partitions))
+
+    plugins = {}
+    for result in results:
+        for info in result:
+            plugins.setdefault(info['uri'], info)
+
+    return [plugins[uri] for uri in sorted(plugins)]
+
+# ------------------------------------------------------------------------------------------------------------
+# get_bundles_plugins_info
+
+# Get plugin-related info from a list of lv2 bundles, in a new lilv world
+# Unlike get_plugins_info, returns an empty list if the bundles have no plugins
+def get_bundles_plugins_info(bundles):
     # Create our own unique lilv world
     # We'll load the selected bundles and get all plugins from it
     world = lilv.World()
@@ -1433,10 +1486,6 @@ def get_plugins_info(bundles):
     # get all plugins available in the selected bundles
     plugins = world.get_all_plugins()
 
-    # make sure the bundles include something
-    if plugins.size() == 0:
-        raise Exception('get_plugins_info() - selected bundles have no plugins')
-
     # return all the info
     return [get_plugin_info(world, p, False) for p in plugins]
 
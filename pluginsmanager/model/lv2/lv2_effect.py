@@ -43,22 +43,22 @@ class Lv2Effect(Effect):
 
         self.plugin = plugin
 
-        params = [Lv2Param(self, param) for param in plugin["ports"]["control"]["input"]]
-        self._params = DictTuple(params, lambda param: param.symbol)
+        self._params = self._generate(Lv2Param, 'control', 'input')
+        self._inputs = self._generate(Lv2Input, 'audio', 'input')
+        self._outputs = self._generate(Lv2Output, 'audio', 'output')
+        self._midi_inputs = self._generate(Lv2MidiInput, 'midi', 'input')
+        self._midi_outputs = self._generate(Lv2MidiOutput, 'midi', 'output')
 
-        inputs = [Lv2Input(self, effect_input) for effect_input in plugin['ports']['audio']['input']]
-        self._inputs = DictTuple(inputs, lambda _input: _input.symbol)
-
-        outputs = [Lv2Output(self, effect_output) for effect_output in plugin['ports']['audio']['output']]
-        self._outputs = DictTuple(outputs, lambda _output: _output.symbol)
-
-        midi_inputs = [Lv2MidiInput(self, midi_input) for midi_input in plugin['ports']['midi']['input']]
-        self._midi_inputs = DictTuple(midi_inputs, lambda _output: _output.symbol)
+        self.instance = None
 
-        midi_outputs = [Lv2MidiOutput(self, midi_output) for midi_output in plugin['ports']['midi']['output']]
-        self._midi_outputs = DictTuple(midi_outputs, lambda _output: _output.symbol)
+    def _generate(self, port_class, port_type, direction):
+        """
+        The ports data and the symbols index are shared by the effects of the plugin
+        (see :meth:`.Lv2Plugin.ports_template`). Only the port objects are created
+        """
+        ports, index = self.plugin.ports_template(port_type, direction)
 
-        self.instance = None
+        return DictTuple([port_class(self, data) for data in ports], index=index)
 
     def __str__(self):
         return str(self.plugin)
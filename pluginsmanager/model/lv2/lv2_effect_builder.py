@@ -14,9 +14,13 @@
 
 import os
 import json
-import subprocess
+from collections import OrderedDict
+from pathlib import Path
 
+from pluginsmanager.model.lv2.lv2_installed_plugins import Lv2InstalledPlugins
 from pluginsmanager.model.lv2.lv2_plugin import Lv2Plugin
+from pluginsmanager.model.lv2.lv2_plugins_cache import Lv2PluginsCache
+from pluginsmanager.model.lv2.lv2_plugins_index import Lv2PluginsIndex
 from pluginsmanager.model.lv2.lv2_effect import Lv2Effect
 
 
@@ -35,6 +39,13 @@ class Lv2EffectBuilder(object):
 
     :param Path plugins_json: Plugins json path file
     :param bool ignore_unsupported_plugins: Not allows instantiation of uninstalled or unrecognized audio plugins?
+    :param bool use_cache: Loads the plugins metadata from a precompiled cache (see :class:`.Lv2PluginsCache`)
+                           instead of parse the plugins json file. The complete metadata of a plugin
+                           is loaded only when requested (:attr:`.Lv2Plugin.json`)
+    :param bool lazy: Only the cache index is loaded. Each plugin metadata is decoded
+                      in the first :meth:`build` and kept in a bounded cache. Requires ``use_cache``
+    :param int max_loaded_plugins: Lazy mode: maximum of decoded plugins kept in memory.
+                                   The least recently used are discarded
     """
 
     plugins_json_file = os.path.dirname(os.path.abspath(__file__)) + '/plugins.json'
@@ -42,42 +53,158 @@ class Lv2EffectBuilder(object):
     Informs the path of the `plugins.json` file. This file contains the lv2 plugins metadata info
     """
 
-    def __init__(self, plugins_json=None, ignore_unsupported_plugins=True):
+    installed_plugins = Lv2InstalledPlugins()
+    """
+    Discovers the installed plugins (used by ``ignore_unsupported_plugins``).
+    It's shared by the builders, so the bundles manifests are only parsed again when they change
+    """
+
+    def __init__(self, plugins_json=None, ignore_unsupported_plugins=True, use_cache=True, lazy=False, max_loaded_plugins=32):
         self._plugins = {}
 
         if plugins_json is None:
             plugins_json = Lv2EffectBuilder.plugins_json_file
 
-        with open(str(plugins_json)) as data_file:
-            data = json.load(data_file)
+        self._plugins_json = plugins_json
+
+        self._cache = None
+        self._index = None
+        self._lazy_plugins = OrderedDict()
+        self._lazy_uris = set()
+        self.max_loaded_plugins = max_loaded_plugins
+
+        if lazy and not use_cache:
+            raise Lv2EffectBuilderError('Lazy mode requires use_cache')
 
-        self.reload(data, ignore_unsupported_plugins=ignore_unsupported_plugins)
+        if lazy:
+            self._cache = Lv2PluginsCache(plugins_json)
+            uris = self._cache.index.keys()
+            if ignore_unsupported_plugins:
+                uris = uris & self._supported_plugins
+            self._lazy_uris = set(uris)
+
+        elif use_cache:
+            self._cache = Lv2PluginsCache(plugins_json)
+            self._reload(self._cache.load(), ignore_unsupported_plugins, self._cache)
+        else:
+            self.reload(self._load_plugins_json(), ignore_unsupported_plugins=ignore_unsupported_plugins)
+
+    def _load_plugins_json(self):
+        with open(str(self._plugins_json)) as data_file:
+            return json.load(data_file)
 
     def reload(self, metadata, ignore_unsupported_plugins=True):
         """
         Loads the metadata. They will be used so that it is possible to generate lv2 audio plugins.
 
+        The plugins keep only a compact record (see :meth:`.Lv2PluginsCache.record`).
+        The complete metadata is kept serialized (see :meth:`.Lv2PluginsCache.from_metadata`)
+        and is decoded on demand (:attr:`.Lv2Plugin.json`).
+
         :param list metadata: lv2 audio plugins metadata
         :param bool ignore_unsupported_plugins: Not allows instantiation of uninstalled or unrecognized audio plugins?
         """
+        if ignore_unsupported_plugins:
+            supported_plugins = self._supported_plugins
+            metadata = [plugin for plugin in metadata if plugin['uri'] in supported_plugins]
+
+        cache = Lv2PluginsCache.from_metadata(metadata)
+        self._reload(cache.load(), False, cache)
+
+    def _reload(self, records, ignore_unsupported_plugins, cache):
+        """
+        :param list[dict] records: Compact records of the plugins (see :meth:`.Lv2PluginsCache.record`)
+        :param bool ignore_unsupported_plugins: Not allows instantiation of uninstalled or unrecognized audio plugins?
+        :param Lv2PluginsCache cache: Cache that reads the complete metadata of the plugins on demand
+        """
         supported_plugins = self._supported_plugins
+        self._index = None
 
-        for plugin in metadata:
+        for record in records:
             if not ignore_unsupported_plugins \
-            or plugin['uri'] in supported_plugins:
-                self._plugins[plugin['uri']] = Lv2Plugin(plugin)
+            or record['uri'] in supported_plugins:
+                self._plugins[record['uri']] = Lv2Plugin(record, self._json_loader(cache, record['uri']))
+
+    @staticmethod
+    def _json_loader(cache, uri):
+        return lambda: cache.read_json(uri)
 
     @property
     def _supported_plugins(self):
-        return str(subprocess.check_output(['lv2ls'])).split('\\n')
+        return self.installed_plugins.uris
+
+    def _plugin(self, uri):
+        try:
+            return self._plugins[uri]
+        except KeyError:
+            if uri not in self._lazy_uris:
+                raise
+
+        try:
+            self._lazy_plugins.move_to_end(uri)
+            return self._lazy_plugins[uri]
+        except KeyError:
+            pass
+
+        plugin = Lv2Plugin(self._cache.read(uri), self._json_loader(self._cache, uri))
+
+        self._lazy_plugins[uri] = plugin
+        while len(self._lazy_plugins) > self.max_loaded_plugins:
+            self._lazy_plugins.popitem(last=False)
+
+        return plugin
 
     @property
     def all(self):
-        return self._plugins
+        """
+        .. note::
+
+            In the lazy mode, all plugins metadata will be decoded
+
+        :return dict: Plugins uri -> :class:`.Lv2Plugin`
+        """
+        if not self._lazy_uris:
+            return self._plugins
+
+        plugins = {uri: self._plugin(uri) for uri in self._lazy_uris}
+        plugins.update(self._plugins)
+        return plugins
 
     @property
     def plugins(self):
-        return self._plugins.keys()
+        """
+        :return: Plugins uri
+        """
+        if not self._lazy_uris:
+            return self._plugins.keys()
+
+        return self._lazy_uris | self._plugins.keys()
+
+    @property
+    def index(self):
+        """
+        :return Lv2PluginsIndex: Search index of the plugins. It's generated in the first use
+        """
+        if self._index is None:
+            self._index = Lv2PluginsIndex(self.all.values())
+
+        return self._index
+
+    def search(self, text='', **facets):
+        """
+        Searches the plugins by name, brand, label and category and by the number of ports::
+
+            >>> # Stereo reverbs
+            >>> builder.search('reverb', audio_inputs=2, audio_outputs=2)
+            [<Lv2Plugin object as Reverb at 0x7f8f6c0d0e48>, ...]
+
+        See :meth:`.Lv2PluginsIndex.search`
+
+        :param string text: Query
+        :param int facets: Number of ports required. See :attr:`.Lv2PluginsIndex.FACETS`
+        :return list[Lv2Plugin]: Plugins found, ordered by name
+        """
+        return [self._plugin(uri) for uri in self.index.search(text, **facets)]
 
     def build(self, lv2_uri):
         """
@@ -87,7 +214,7 @@ class Lv2EffectBuilder(object):
         :return Lv2Effect: Effect created
         """
         try:
-            plugin = self._plugins[lv2_uri]
+            plugin = self._plugin(lv2_uri)
         except KeyError:
             raise Lv2EffectBuilderError(
                 "Lv2EffectBuilder not contains metadata information about the plugin '{}'. \n"
@@ -96,7 +223,7 @@ class Lv2EffectBuilder(object):
 
         return Lv2Effect(plugin)
 
-    def lv2_plugins_data(self):
+    def lv2_plugins_data(self, incremental=False, scan_path=None, workers=1):
         """
         Generates a file with all plugins data info. It uses the `lilvlib`_ library.
 
@@ -148,15 +275,113 @@ class Lv2EffectBuilder(object):
             a script to generate the package.
             Go to https://github.com/moddevices/lilvlib to get the script in its most up-to-date version.
 
+        Get the information of all plugins is slow. With ``incremental``, only the bundles
+        installed or changed since the last incremental scan are read (see :meth:`.Lv2InstalledPlugins.fingerprint`).
+        Each scan persists the bundles metadata with their fingerprints in the ``scan_path`` file (in a
+        single atomic write), and the metadata of the bundles not changed is obtained from it::
+
+            >>> builder.reload(builder.lv2_plugins_data(incremental=True))
+
         .. _lilvlib: https://github.com/moddevices/lilvlib
         .. _0.22.0: http://git.drobilla.net/cgit.cgi/lilv.git/tag/?id=v0.22.0
         .. _lilv: http://drobilla.net/software/lilv
 
+        :param bool incremental: Reads only the new or changed bundles?
+        :param Path scan_path: File that persists the bundles metadata and fingerprints of the last incremental scan.
+                               Default is in the :meth:`.Lv2PluginsCache.default_directory`
+        :param int workers: Number of processes that reads the bundles. ``None`` uses the number of processors.
+                            Requires a lilvlib version with parallel extraction
         :return list: lv2 audio plugins metadata
         """
         import lilvlib
 
-        return lilvlib.get_plugin_info_helper('')
+        options = {} if workers == 1 else {'workers': workers}
+
+        if not incremental:
+            return lilvlib.get_plugin_info_helper('', **options)
+
+        if scan_path is None:
+            scan_path = Lv2PluginsCache.default_directory() / 'lv2_scan.json'
+
+        return self._incremental_plugins_data(lilvlib, Path(scan_path), options)
+
+    def _incremental_plugins_data(self, lilvlib, scan_path, options):
+        previous = self._read_scan(scan_path)
+
+        # bundle -> {'fingerprint': ..., 'plugins': [plugin metadata]}
+        scan = {}
+        changed = []
+        bundles = self.installed_plugins.bundles
+
+        for bundle, uris in sorted(bundles.items()):
+            if not uris:
+                continue
+
+            fingerprint = Lv2InstalledPlugins.fingerprint(bundle)
+            scanned = previous.get(bundle)
+
+            if scanned is not None and scanned['fingerprint'] == fingerprint:
+                scan[bundle] = scanned
+            else:
+                changed.append(bundle)
+                scan[bundle] = {'fingerprint': fingerprint, 'plugins': []}
+
+        # Plugins not declared in the manifests of the changed bundles
+        unknown = []
+        if changed:
+            uri_bundle = {uri: bundle for bundle in changed for uri in bundles[bundle]}
+
+            for plugin in self._bundles_plugins_info(lilvlib, changed, options):
+                bundle = uri_bundle.get(plugin['uri'])
+                if bundle is None:
+                    unknown.append(plugin)
+                else:
+                    scan[bundle]['plugins'].append(plugin)
+
+        # With unknown plugins, the scan isn't persisted: the next scan reads the changed bundles again
+        if not unknown:
+            self._write_scan(scan_path, scan)
+
+        plugins = [plugin for scanned in scan.values() for plugin in scanned['plugins']] + unknown
+        metadata = {plugin['uri']: plugin for plugin in plugins}
+        return [metadata[uri] for uri in sorted(metadata)]
+
+    @staticmethod
+    def _bundles_plugins_info(lilvlib, bundles, options):
+        try:
+            return lilvlib.get_plugins_info(bundles, **options)
+        except Exception as e:
+            # lilvlib raises when the bundles have no (supported) plugins
+            if 'have no plugins' not in str(e):
+                raise
+
+            return []
+
+    @staticmethod
+    def _read_scan(path):
+        try:
+            with open(str(path)) as data_file:
+                return json.load(data_file)
+        except (OSError, ValueError):
+            return {}
+
+    @staticmethod
+    def _write_scan(path, scan):
+        """
+        The fingerprints are persisted with the metadata that they describe,
+        so a bundle is never considered scanned without its metadata
+        """
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+
+            temporary = path.with_name(path.name + '.tmp')
+            with open(str(temporary), 'w') as data_file:
+                json.dump(scan, data_file)
+
+            os.replace(str(temporary), str(path))
+        except OSError:
+            # Without the scan file, the next incremental scan reads all bundles
+            pass
 
 if __name__ == '__main__':
     builder = Lv2EffectBuilder()
@@ -0,0 +1,97 @@
+# Copyright 2017 SrMouraSilva
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from threading import RLock
+
+from pluginsmanager.model.lv2.lv2_effect_builder import Lv2EffectBuilder
+
+
+class Lv2EffectBuilderRegistry(object):
+    """
+    Shares a :class:`.Lv2EffectBuilder` between the objects that generates lv2 effects
+    (like :class:`.PersistenceDecoder`, :class:`.Autosaver` and :class:`.ModPedalboardConverter`).
+
+    Creating a builder is expensive (it loads the plugins metadata and checks the installed plugins),
+    so the builder is created on the first use and reused until an explicit :meth:`reload`
+    or :meth:`invalidate`::
+
+        >>> registry = Lv2EffectBuilderRegistry.default()
+        >>> builder = registry.get()
+        >>> registry.get() is builder
+        True
+
+    :param function factory: Function that creates a builder. Default is :class:`.Lv2EffectBuilder`
+    """
+
+    _default = None
+    _default_lock = RLock()
+
+    def __init__(self, factory=None):
+        self.factory = factory if factory is not None else Lv2EffectBuilder
+
+        self._builder = None
+        self._lock = RLock()
+
+    @classmethod
+    def default(cls):
+        """
+        :return Lv2EffectBuilderRegistry: Process-wide registry
+        """
+        with cls._default_lock:
+            if cls._default is None:
+                cls._default = cls()
+
+            return cls._default
+
+    def get(self):
+        """
+        :return Lv2EffectBuilder: Shared builder. It's created if necessary
+        """
+        with self._lock:
+            if self._builder is None:
+                self._builder = self.factory()
+
+            return self._builder
+
+    def set(self, builder):
+        """
+        Replaces the shared builder
+
+        :param Lv2EffectBuilder builder: Builder that will be shared
+        """
+        with self._lock:
+            self._builder = builder
+
+    def reload(self, metadata=None):
+        """
+        Reloads the plugins metadata of the shared builder.
+
+        :param list metadata: lv2 audio plugins metadata (see :meth:`.Lv2EffectBuilder.reload`).
+                              If ``None``, a new builder is created, checking again the installed plugins
+        :return Lv2EffectBuilder: Shared builder
+        """
+        with self._lock:
+            if metadata is None:
+                self._builder = self.factory()
+            else:
+                self.get().reload(metadata)
+
+            return self._builder
+
+    def invalidate(self):
+        """
+        Discards the shared builder. The next :meth:`get` creates a new builder
+        """
+        with self._lock:
+            self._builder = None
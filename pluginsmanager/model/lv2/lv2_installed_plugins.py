@@ -0,0 +1,267 @@
+# Copyright 2017 SrMouraSilva
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import hashlib
+import os
+import re
+from pathlib import Path
+from urllib.parse import urljoin
+
+
+class Lv2InstalledPlugins(object):
+    """
+    Discovers the installed lv2 plugins by the bundles manifests (``manifest.ttl``)
+    in the ``LV2_PATH`` directories, without lilv or the ``lv2ls`` binary::
+
+        >>> installed = Lv2InstalledPlugins()
+        >>> 'http://calf.sourceforge.net/plugins/Reverb' in installed.uris
+        True
+
+    The plugins of each bundle are cached and the manifest is parsed again
+    only when it changes (modification time or size).
+
+    :param list[string] lv2_path: Directories that contains lv2 bundles.
+                                  Default is the ``LV2_PATH`` environment variable
+                                  or :attr:`DEFAULT_LV2_PATH`
+    """
+
+    DEFAULT_LV2_PATH = ('~/.lv2', '/usr/local/lib/lv2', '/usr/lib/lv2')
+    """Directories used when ``LV2_PATH`` isn't defined"""
+
+    MANIFEST = 'manifest.ttl'
+
+    RDF_TYPE = 'http://www.w3.org/1999/02/22-rdf-syntax-ns#type'
+    LV2_PLUGIN = 'http://lv2plug.in/ns/lv2core#Plugin'
+
+    def __init__(self, lv2_path=None):
+        self._lv2_path = lv2_path
+        self._bundles = {}
+
+    @property
+    def lv2_path(self):
+        """
+        :return list[string]: Directories that contains lv2 bundles
+        """
+        if self._lv2_path is not None:
+            return self._lv2_path
+
+        lv2_path = os.environ.get('LV2_PATH')
+        if lv2_path:
+            return lv2_path.split(os.pathsep)
+
+        return self.DEFAULT_LV2_PATH
+
+    @property
+    def uris(self):
+        """
+        :return set[string]: Uri of the installed plugins
+        """
+        uris = set()
+        for plugins in self.bundles.values():
+            uris |= plugins
+
+        return uris
+
+    @property
+    def bundles(self):
+        """
+        :return dict: Installed bundles path -> frozenset with the uri of its plugins
+        """
+        bundles = {}
+
+        for bundle, manifest in self._manifests():
+            try:
+                stat = os.stat(manifest)
+            except OSError:
+                continue
+
+            fingerprint = (stat.st_mtime_ns, stat.st_size)
+            cached = self._bundles.get(bundle)
+
+            if cached is not None and cached[0] == fingerprint:
+                plugins = cached[1]
+            else:
+                plugins = self._read_manifest(manifest)
+
+            bundles[bundle] = (fingerprint, plugins)
+
+        self._bundles = bundles
+        return {bundle: plugins for bundle, (fingerprint, plugins) in bundles.items()}
+
+    @staticmethod
+    def fingerprint(bundle):
+        """
+        Identifies the bundle state by the modification time and size of its turtle files.
+
+        :param string bundle: Bundle path
+        :return string: Bundle fingerprint. Changes when any turtle file is added, removed or changed
+        """
+        files = []
+        for directory, directories, names in os.walk(bundle):
+            directories.sort()
+            for name in sorted(names):
+                if not name.endswith('.ttl'):
+                    continue
+
+                path = os.path.join(directory, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+
+                files.append('{}:{}:{}'.format(os.path.relpath(path, bundle), stat.st_mtime_ns, stat.st_size))
+
+        return hashlib.sha1('\n'.join(files).encode('utf-8')).hexdigest()
+
+    def _manifests(self):
+        for directory in self.lv2_path:
+            try:
+                entries = list(os.scandir(os.path.expanduser(directory)))
+            except OSError:
+                continue
+
+            for entry in entries:
+                if entry.is_dir():
+                    yield entry.path, os.path.join(entry.path, self.MANIFEST)
+
+    def _read_manifest(self, manifest):
+        try:
+            with open(manifest, encoding='utf-8') as file:
+                data = file.read()
+        except (OSError, UnicodeDecodeError):
+            return frozenset()
+
+        return frozenset(self.plugins(data, Path(manifest).absolute().as_uri()))
+
+    @classmethod
+    def plugins(cls, turtle, base=''):
+        """
+        Finds the plugins declared (``<uri> a lv2:Plugin``) in a turtle document.
+
+        It's a minimal turtle parser: only the statements of the top level are considered.
+
+        :param string turtle: Turtle document
+        :param string base: Base uri for resolve the relative uris
+        :return list[string]: Plugins uri
+        """
+        plugins = []
+        prefixes = {}
+
+        tokens = _tokenize(turtle)
+        depth = 0
+        expect = _SUBJECT
+        expect_before_bracket = None
+        subject = predicate = None
+
+        for token in tokens:
+            if token in ('@prefix', 'PREFIX', 'prefix'):
+                name, uri = next(tokens, ''), next(tokens, '<>')
+                prefixes[name[:-1]] = urljoin(base, uri[1:-1])
+                continue
+
+            if token in ('@base', 'BASE', 'base'):
+                base = urljoin(base, next(tokens, '<>')[1:-1])
+                continue
+
+            if token in ('[', '('):
+                if depth == 0:
+                    expect_before_bracket = expect
+                depth += 1
+                continue
+
+            if token in (']', ')'):
+                depth -= 1
+                if depth == 0:
+                    # A blank node or a collection is a term
+                    if expect_before_bracket == _SUBJECT:
+                        subject, expect = None, _PREDICATE
+                    elif expect_before_bracket == _PREDICATE:
+                        expect = _OBJECT
+                    else:
+                        expect = None
+                continue
+
+            if depth > 0:
+                continue
+
+            if token == '.':
+                expect = _SUBJECT
+            elif token == ';':
+                expect = _PREDICATE
+            elif token == ',':
+                expect = _OBJECT
+            elif expect == _SUBJECT:
+                subject, expect = cls._term(token, prefixes, base), _PREDICATE
+            elif expect == _PREDICATE:
+                predicate, expect = cls._term(token, prefixes, base), _OBJECT
+            elif expect == _OBJECT:
+                if subject is not None \
+                and predicate == cls.RDF_TYPE \
+                and cls._term(token, prefixes, base) == cls.LV2_PLUGIN:
+                    plugins.append(subject)
+                expect = None
+
+        return plugins
+
+    @classmethod
+    def _term(cls, token, prefixes, base):
+        if token.startswith('<'):
+            return urljoin(base, token[1:-1])
+        if token == 'a':
+            return cls.RDF_TYPE
+        if token.startswith(('"', "'")):
+            return None
+
+        prefix, separator, local = token.partition(':')
+        if separator and prefix in prefixes:
+            return prefixes[prefix] + local
+
+        return None
+
+
+_SUBJECT, _PREDICATE, _OBJECT = range(3)
+
+_TOKENS = re.compile(r'''
+      \s+
+    | \#[^\n]*
+    | (?P<iri><[^>]*>)
+    | (?P<string>"""[\s\S]*?"""|\'\'\'[\s\S]*?\'\'\'|"(?:[^"\\\n]|\\.)*"|'(?:[^'\\\n]|\\.)*')
+    | (?P<punctuation>[;,\[\]()])
+    | (?P<word>[^\s<>"';,\[\]()#]+)
+''', re.VERBOSE)
+
+
+def _tokenize(turtle):
+    for match in _TOKENS.finditer(turtle):
+        kind = match.lastgroup
+        if kind is None:
+            continue
+
+        token = match.group(kind)
+
+        # The statement terminator can be glued in a word: "lv2:Plugin."
+        if kind == 'word' and token.endswith('.') and not _is_number(token):
+            if len(token) > 1:
+                yield token[:-1]
+            yield '.'
+        else:
+            yield token
+
+
+def _is_number(token):
+    try:
+        float(token)
+        return True
+    except ValueError:
+        return False
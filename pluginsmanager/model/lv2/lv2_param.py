@@ -22,7 +22,9 @@ class Lv2Param(Param):
     For general input use, see :class:`.Param` class documentation.
 
     :param Lv2Effect effect: Effect that contains the param
-    :param dict data: *input control port* json representation
+    :param dict data: *input control port* json representation. The :class:`.Lv2EffectBuilder`
+                      informs a compact representation (see :meth:`.Lv2PluginsCache.record`).
+                      The complete port data is in the plugin json (:attr:`.Lv2Plugin.json`)
 
     .. _input control port: http://lv2plug.in/ns/lv2core/#Parameter
     """
@@ -14,26 +14,73 @@
 
 
 class Lv2Plugin(object):
+    """
+    Lv2 audio plugin metadata.
 
-    def __init__(self, json):
+    :param dict json: Plugin metadata based in moddevices `lilvlib`_. Can be a compact
+                      record (see :meth:`.Lv2PluginsCache.record`)
+    :param function full_json: Function that returns the complete plugin metadata.
+                               Used when ``json`` is a compact record for load the complete
+                               metadata on demand. The complete metadata isn't kept
+
+    .. _lilvlib: https://github.com/moddevices/lilvlib
+    """
+
+    def __init__(self, json, full_json=None):
         self._json = json
+        self._full_json = full_json
+        self._ports_templates = {}
 
     def __getitem__(self, key):
         """
         :param string key: Property key
         :return: Returns a Plugin property
         """
-        return self.json[key]
+        try:
+            return self._json[key]
+        except KeyError:
+            if self._full_json is None:
+                raise
+
+        return self._full_json()[key]
 
     @property
     def json(self):
         """
         :return: Json decodable representation of this plugin based in moddevices `lilvlib`_.
 
+        .. note::
+
+            With a compact record, the complete metadata is read in each access
+
         .. _lilvlib: https://github.com/moddevices/lilvlib
         """
+        if self._full_json is not None:
+            return self._full_json()
+
         return self._json
 
+    def ports_template(self, port_type, direction):
+        """
+        Port data shared by all effects of this plugin. It's computed in the first request.
+
+        :param string port_type: ``'audio'``, ``'control'`` or ``'midi'``
+        :param string direction: ``'input'`` or ``'output'``
+        :return tuple(tuple, dict): Ports data and the symbol -> position index (see :class:`.DictTuple`)
+        """
+        key = (port_type, direction)
+
+        try:
+            return self._ports_templates[key]
+        except KeyError:
+            pass
+
+        ports = tuple(self['ports'][port_type][direction])
+        index = {port['symbol']: position for position, port in enumerate(ports)}
+
+        self._ports_templates[key] = template = (ports, index)
+        return template
+
     @property
     def data(self):
         """
@@ -55,4 +102,4 @@ class Lv2Plugin(object):
 
     @property
     def version(self):
-        return '' if 'version' not in self.json else self.json['version']
+        return self._json.get('version', '')
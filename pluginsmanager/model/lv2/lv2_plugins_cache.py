@@ -0,0 +1,307 @@
+# Copyright 2017 SrMouraSilva
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import hashlib
+import json
+import os
+import pickle
+import sys
+from pathlib import Path
+
+
+class Lv2PluginsCache(object):
+    """
+    Precompiled cache of the lv2 plugins metadata.
+
+    The lv2 plugins metadata file (like *plugins.json*) contains many data that
+    aren't necessary for instantiate effects (gui, presets, bundles, ...).
+    The cache persists a compact record (see :meth:`record`) of each plugin in a
+    binary file, so that it's not necessary parse the metadata file::
+
+        >>> cache = Lv2PluginsCache(Lv2EffectBuilder.plugins_json_file)
+        >>> records = cache.load()
+
+    The cache file is regenerated when the metadata file changes (size or modification time)
+    or when the cache format version changes.
+
+    The complete metadata of each plugin is persisted too, after the records, so that
+    it can be read on demand (see :meth:`read_json`) without parse the metadata file.
+
+    File format: ``MAGIC``, a pickled header (version, source fingerprint, the records
+    length and the indexes ``uri -> (offset, length)`` of the records and of the complete
+    metadata), the pickled records and the pickled complete metadata.
+
+    :param Path source: Lv2 plugins metadata json file
+    :param Path path: Cache file path. Default is in the user cache directory (see :meth:`default_directory`)
+    """
+
+    VERSION = 4
+    """Cache format version. Caches with other version are regenerated"""
+
+    MAGIC = b'PMLV2CACHE'
+
+    def __init__(self, source, path=None):
+        self.source = Path(source)
+        self.path = Path(path) if path is not None else self.default_path(self.source)
+
+        self._index = None
+        self._json_index = None
+        self._records_offset = None
+        self._records_length = None
+        # Data region, when the cache isn't persisted
+        self._memory = None
+
+    @staticmethod
+    def default_directory():
+        """
+        :return Path: ``$XDG_CACHE_HOME/pluginsmanager`` or ``~/.cache/pluginsmanager``
+        """
+        cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+        return Path(cache_home) / 'pluginsmanager'
+
+    @classmethod
+    def default_path(cls, source):
+        """
+        :param Path source: Lv2 plugins metadata json file
+        :return Path: Cache file path for the source
+        """
+        identifier = hashlib.sha1(str(Path(source).resolve()).encode('utf-8')).hexdigest()[:16]
+        return cls.default_directory() / 'lv2_plugins_{}.cache'.format(identifier)
+
+    @property
+    def fingerprint(self):
+        """
+        :return list: Identifies the source file state
+        """
+        stat = self.source.stat()
+        return [self.VERSION, str(self.source.resolve()), stat.st_size, stat.st_mtime_ns]
+
+    @classmethod
+    def record(cls, plugin):
+        """
+        Projects the plugin metadata in a compact runtime representation.
+        Only the data used by the model, the persistence and the hosts are kept:
+
+         - ``uri``, ``name`` and ``version``;
+         - ``brand``, ``label`` and ``category``, used for search the plugins (see :class:`.Lv2PluginsIndex`);
+         - ``ports``: by type and direction (like the `lilvlib`_ metadata),
+           only with ``index``, ``name``, ``symbol`` and, for the control ports, ``ranges``.
+
+        The uri and the symbols are interned.
+
+        :param dict plugin: Plugin metadata, based in moddevices `lilvlib`_
+        :return dict: Plugin data necessary for instantiate effects
+
+        .. _lilvlib: https://github.com/moddevices/lilvlib
+        """
+        return {
+            'uri': sys.intern(plugin['uri']),
+            'name': plugin['name'],
+            'version': plugin.get('version', ''),
+            'brand': plugin.get('brand', ''),
+            'label': plugin.get('label', ''),
+            'category': [sys.intern(category) for category in plugin.get('category', [])],
+            'ports': {
+                port_type: {
+                    direction: [cls._port_record(port, port_type == 'control') for port in ports]
+                    for direction, ports in directions.items()
+                }
+                for port_type, directions in plugin['ports'].items()
+            },
+        }
+
+    @staticmethod
+    def _port_record(port, control):
+        record = {
+            'index': port['index'],
+            'name': port['name'],
+            'symbol': sys.intern(port['symbol']),
+        }
+
+        if control:
+            ranges = port['ranges']
+            record['ranges'] = {
+                'default': ranges['default'],
+                'maximum': ranges['maximum'],
+                'minimum': ranges['minimum'],
+            }
+
+        return record
+
+    @property
+    def index(self):
+        """
+        :return dict: Plugins uri -> ``(offset, length)`` of the record in the cache file.
+                      The cache is regenerated if it's invalid
+        """
+        if self._index is None:
+            self._load_header()
+
+        return self._index
+
+    def load(self):
+        """
+        :return list[dict]: Records of all plugins (see :meth:`record`).
+                            The cache is regenerated if it's invalid
+        """
+        index = self.index
+        data = self._read_region(0, self._records_length)
+
+        return [pickle.loads(data[offset:offset+length]) for offset, length in index.values()]
+
+    def read(self, uri):
+        """
+        :param string uri: Plugin uri
+        :return dict: Plugin record
+        :raise KeyError: If the plugin isn't in the cache
+        """
+        offset, length = self.index[uri]
+        return pickle.loads(self._read_region(offset, length))
+
+    def read_json(self, uri):
+        """
+        Reads only the complete metadata of the plugin. It isn't kept in memory.
+
+        :param string uri: Plugin uri
+        :return dict: Plugin metadata, based in moddevices `lilvlib`_
+        :raise KeyError: If the plugin isn't in the cache
+
+        .. _lilvlib: https://github.com/moddevices/lilvlib
+        """
+        if self._index is None:
+            self._load_header()
+
+        offset, length = self._json_index[uri]
+        return pickle.loads(self._read_region(offset, length))
+
+    @classmethod
+    def from_metadata(cls, plugins):
+        """
+        Generates a cache kept in memory (not persisted), for metadata
+        that isn't in a file, like the metadata obtained by a scan.
+
+        The records and the complete metadata are kept serialized, so they
+        occupy much less memory than the metadata dicts.
+
+        :param list[dict] plugins: Plugins metadata, based in moddevices `lilvlib`_
+        :return Lv2PluginsCache: Cache of the plugins
+
+        .. _lilvlib: https://github.com/moddevices/lilvlib
+        """
+        cache = cls.__new__(cls)
+        cache.source = None
+        cache.path = None
+
+        header, data = cls._serialize(plugins)
+        cache._set_header(header)
+        cache._memory = data
+
+        return cache
+
+    def rebuild(self):
+        """
+        Regenerates the cache file based in the source file
+        """
+        with open(str(self.source)) as data_file:
+            plugins = json.load(data_file)
+
+        header, data = self._serialize(plugins, self.fingerprint)
+
+        try:
+            self._write(header, data)
+        except OSError:
+            # Read-only cache directory: keeps the cache in memory
+            self._set_header(header)
+            self._memory = data
+            return
+
+        self._load_header()
+
+    @classmethod
+    def _serialize(cls, plugins, fingerprint=None):
+        records = [pickle.dumps(cls.record(plugin), pickle.HIGHEST_PROTOCOL) for plugin in plugins]
+        jsons = [pickle.dumps(plugin, pickle.HIGHEST_PROTOCOL) for plugin in plugins]
+
+        index = {}
+        offset = 0
+        for plugin, record in zip(plugins, records):
+            index[plugin['uri']] = (offset, len(record))
+            offset += len(record)
+
+        records_length = offset
+
+        json_index = {}
+        for plugin, data in zip(plugins, jsons):
+            json_index[plugin['uri']] = (offset, len(data))
+            offset += len(data)
+
+        header = {
+            'version': cls.VERSION,
+            'fingerprint': fingerprint,
+            'index': index,
+            'json_index': json_index,
+            'records_length': records_length
+        }
+
+        return header, b''.join(records + jsons)
+
+    def _write(self, header, data):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        temporary = self.path.with_name(self.path.name + '.tmp')
+        with open(str(temporary), 'wb') as file:
+            file.write(self.MAGIC)
+            pickle.dump(header, file, pickle.HIGHEST_PROTOCOL)
+            file.write(data)
+
+        os.replace(str(temporary), str(self.path))
+
+    def _read_region(self, offset, length):
+        """
+        :return bytes: Data region of the records and complete metadata
+        """
+        if self._memory is not None:
+            return self._memory[offset:offset+length]
+
+        with open(str(self.path), 'rb') as file:
+            file.seek(self._records_offset + offset)
+            return file.read(length)
+
+    def _set_header(self, header):
+        self._index = header['index']
+        self._json_index = header['json_index']
+        self._records_length = header['records_length']
+
+    def _load_header(self):
+        header = self._read_header()
+
+        if header is None or header['version'] != self.VERSION or header['fingerprint'] != self.fingerprint:
+            self.rebuild()
+            return
+
+        self._set_header(header)
+
+    def _read_header(self):
+        try:
+            with open(str(self.path), 'rb') as file:
+                if file.read(len(self.MAGIC)) != self.MAGIC:
+                    return None
+
+                header = pickle.load(file)
+                self._records_offset = file.tell()
+
+                return header
+
+        except (OSError, EOFError, pickle.UnpicklingError, ValueError, KeyError):
+            return None
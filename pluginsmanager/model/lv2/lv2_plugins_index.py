@@ -0,0 +1,138 @@
+# Copyright 2017 SrMouraSilva
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import re
+from bisect import bisect_left
+
+
+class Lv2PluginsIndex(object):
+    """
+    Search index of lv2 plugins.
+
+    The plugins are searched by the tokens (words) of their name, brand, label and category.
+    A query token matches the tokens that starts with it, so it's possible search while the user types.
+    The plugins can also be filtered by the number of ports (facets)::
+
+        >>> index = Lv2PluginsIndex(builder.all.values())
+        >>> # Stereo reverbs
+        >>> index.search('reverb', audio_inputs=2, audio_outputs=2)
+        ['http://calf.sourceforge.net/plugins/Reverb', ...]
+
+    Use :meth:`.Lv2EffectBuilder.search` for search the plugins of a builder.
+
+    :param list[Lv2Plugin] plugins: Plugins that will be indexed
+    """
+
+    FACETS = {
+        'audio_inputs': ('audio', 'input'),
+        'audio_outputs': ('audio', 'output'),
+        'midi_inputs': ('midi', 'input'),
+        'midi_outputs': ('midi', 'output'),
+        'params': ('control', 'input'),
+    }
+    """Facet name -> port type and direction that are counted"""
+
+    FIELDS = ('name', 'brand', 'label', 'category')
+    """Plugin fields that are tokenized"""
+
+    def __init__(self, plugins):
+        self._tokens = {}
+        self._facets = {facet: {} for facet in self.FACETS}
+        self._order = {}
+
+        plugins = list(plugins)
+        for plugin in plugins:
+            self._add(plugin)
+
+        self._sorted_tokens = sorted(self._tokens)
+
+        ordered = sorted(plugins, key=lambda plugin: (plugin['name'].lower(), plugin['uri']))
+        self._order = {plugin['uri']: position for position, plugin in enumerate(ordered)}
+
+    def _add(self, plugin):
+        uri = plugin['uri']
+
+        for field in self.FIELDS:
+            for token in self.tokenize(self._value(plugin, field)):
+                self._tokens.setdefault(token, set()).add(uri)
+
+        ports = plugin['ports']
+        for facet, (port_type, direction) in self.FACETS.items():
+            total = len(ports.get(port_type, {}).get(direction, []))
+            self._facets[facet].setdefault(total, set()).add(uri)
+
+    @staticmethod
+    def _value(plugin, field):
+        try:
+            value = plugin[field]
+        except KeyError:
+            return ''
+
+        if isinstance(value, (list, tuple)):
+            return ' '.join(value)
+
+        return value or ''
+
+    @staticmethod
+    def tokenize(text):
+        """
+        :param string text: Text
+        :return list[string]: Lower case words of the text
+        """
+        return re.findall(r'\w+', text.lower())
+
+    def __len__(self):
+        return len(self._order)
+
+    def search(self, text='', **facets):
+        """
+        Searches the plugins.
+
+        :param string text: Query. A plugin matches when all query tokens
+                            are prefix of some token of the plugin
+        :param int facets: Number of ports required. See :attr:`FACETS`
+        :return list[string]: Uri of the plugins found, ordered by the plugins name
+        :raise KeyError: If a facet is unknown
+        """
+        results = None
+
+        for token in self.tokenize(text):
+            results = self._intersection(results, self._prefixed(token))
+
+        for facet, total in facets.items():
+            if facet not in self._facets:
+                raise KeyError('Unknown facet: {}'.format(facet))
+            results = self._intersection(results, self._facets[facet].get(total, set()))
+
+        if results is None:
+            results = self._order.keys()
+
+        return sorted(results, key=self._order.__getitem__)
+
+    def _prefixed(self, prefix):
+        uris = set()
+
+        position = bisect_left(self._sorted_tokens, prefix)
+        while position < len(self._sorted_tokens) and self._sorted_tokens[position].startswith(prefix):
+            uris |= self._tokens[self._sorted_tokens[position]]
+            position += 1
+
+        return uris
+
+    @staticmethod
+    def _intersection(results, uris):
+        if results is None:
+            return uris
+
+        return results & uris
@@ -14,7 +14,7 @@
 
 from abc import ABCMeta, abstractmethod
 
-from unittest.mock import MagicMock
+from pluginsmanager.observer.null_observer import NullObserver
 
 
 class ParamError(Exception):
@@ -56,7 +56,7 @@ class Param(metaclass=ABCMeta):
         self._value = default
         self._default = default
 
-        self.observer = MagicMock()
+        self.observer = NullObserver()
 
     @property
     def effect(self):
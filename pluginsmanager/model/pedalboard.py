@@ -15,11 +15,12 @@
 from pluginsmanager.model.effects_list import EffectsList
 from pluginsmanager.model.connections_list import ConnectionsList
 from pluginsmanager.observer.update_type import UpdateType, CustomChange
+from pluginsmanager.observer.autosaver.indexable import Indexable
 
-from unittest.mock import MagicMock
+from pluginsmanager.observer.null_observer import NullObserver
 
 
-class Pedalboard(object):
+class Pedalboard(Indexable):
     """
     Pedalboard is a patch representation: your structure contains
     :class:`.Effect` and :class:`~pluginsmanager.model.connection.Connection`::
@@ -63,6 +64,8 @@ class Pedalboard(object):
     :param string name: Pedalboard name
     """
     def __init__(self, name):
+        super(Pedalboard, self).__init__()
+
         self._name = name
         self._effects = EffectsList()
         self._connections = ConnectionsList(self)
@@ -70,7 +73,7 @@ class Pedalboard(object):
         self.effects.observer = self._effects_observer
         self.connections.observer = self._connections_observer
 
-        self._observer = MagicMock()
+        self._observer = NullObserver()
 
         self.bank = None
 
@@ -115,7 +118,7 @@ class Pedalboard(object):
             self.connections.remove_silently(connection)
 
         effect.pedalboard = None
-        effect.observer = MagicMock()
+        effect.observer = NullObserver()
 
     def _connections_observer(self, update_type, connection, index, **kwargs):
         self.observer.on_connection_updated(connection, update_type, pedalboard=self, **kwargs)
@@ -238,6 +241,10 @@ class Pedalboard(object):
 
         return self.bank.pedalboards.index(self)
 
+    @property
+    def simple_identifier(self):
+        return self.name
+
     def connect(self, output_port, input_port):
         """
         Connect two :class:`.Effect` instances in this pedalboard.
@@ -14,7 +14,7 @@
 
 from abc import ABCMeta, abstractmethod
 
-from unittest.mock import MagicMock
+from pluginsmanager.observer.null_observer import NullObserver
 
 
 class Port(metaclass=ABCMeta):
@@ -26,7 +26,7 @@ class Port(metaclass=ABCMeta):
 
     def __init__(self, effect):
         self._effect = effect
-        self.observer = MagicMock()
+        self.observer = NullObserver()
 
     @property
     @abstractmethod
@@ -12,12 +12,18 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import threading
+import time
+from collections import OrderedDict
 from pathlib import Path
 
 from pluginsmanager.banks_manager import BanksManager
 from pluginsmanager.observer.autosaver.banks_files import BanksFiles
 from pluginsmanager.observer.autosaver.index_file import IndexFile
-from pluginsmanager.observer.update_type import UpdateType
+from pluginsmanager.observer.autosaver.journal import Journal
+from pluginsmanager.observer.autosaver.lazy_bank import LazyBank
+from pluginsmanager.observer.autosaver.split_banks_files import SplitBanksFiles
+from pluginsmanager.observer.update_type import UpdateType, CustomChange
 from pluginsmanager.observer.updates_observer import UpdatesObserver
 
 
@@ -68,98 +74,392 @@ class Autosaver(UpdatesObserver):
         >>> autosaver.auto_save = False
         >>> autosaver.save(banks_manager)  # save() method saves all banks data
 
+    Each change rewrites the bank file. For reduce the disk writes, is possible
+    save the changed banks later (write-behind): the changed banks are saved
+    after ``save_delay`` seconds without changes, but the changes are never kept
+    unsaved for more than ``max_save_delay`` seconds::
+
+        >>> autosaver = Autosaver('my/path/data/', save_delay=1, max_save_delay=5)
+        >>> # Saves now the changed banks
+        >>> autosaver.flush()
+        >>> # Saves the changed banks and stops the timer
+        >>> autosaver.close()
+
+    The banks removal is always persisted immediately.
+
+    With ``split_pedalboards``, each bank is persisted in a directory with a file per
+    pedalboard (see :class:`.SplitBanksFiles`), so a pedalboard change only rewrites
+    the pedalboard file::
+
+        >>> autosaver = Autosaver('my/path/data/', split_pedalboards=True)
+
+    With ``journal``, each change is appended as a small record in a journal file
+    (see :class:`.Journal`) instead of rewrite the bank. After ``journal_compaction``
+    records, on :meth:`flush` and on :meth:`close`, the changed banks are saved and the
+    journal is cleared (compaction). :meth:`load` replays the journal over the banks saved::
+
+        >>> autosaver = Autosaver('my/path/data/', journal=True)
+        >>> # Changes history
+        >>> autosaver.journal.records()
+
+    Each record is synchronized with the disk (``fsync``) before the change is considered
+    persisted, so every param change costs a disk synchronization. Group frequent changes
+    (like a knob turn) with :meth:`.BanksManager.batch`: the records of a batch are
+    synchronized once.
+
     :param string data_path: Path that banks will be saved (each bank in one file)
     :param bool auto_save: Auto save any change?
+    :param float save_delay: Seconds without changes before save the changed banks.
+                             ``None`` (default) saves the banks immediately
+    :param float max_save_delay: Maximum seconds that a change can be kept unsaved.
+                                 Default is ``10 * save_delay``
+    :param bool split_pedalboards: Persists each pedalboard in its own file?
+                                   The data_path should be used always with the same layout
+    :param bool journal: Appends the changes in a journal? ``save_delay`` is ignored with it
+    :param int journal_compaction: Number of journal records that causes the compaction
+    :param int load_workers: Number of processes used for read the banks files in :meth:`load`.
+                             ``None`` uses the number of processors
+    :param Lv2EffectBuilderRegistry builder_registry: Provides the lv2 effects builder used in :meth:`load`.
+                                                      Default is :meth:`.Lv2EffectBuilderRegistry.default`
     """
-    def __init__(self, data_path, auto_save=True):
+    def __init__(self, data_path, auto_save=True, save_delay=None, max_save_delay=None, split_pedalboards=False,
+                 journal=False, journal_compaction=1000, load_workers=1, builder_registry=None):
         super().__init__()
         self.data_path = Path(data_path)
+        self.builder_registry = builder_registry
 
         self.index_file = IndexFile(self.data_path / Path('index_file'))
-        self.banks_files = BanksFiles(self.data_path)
+        if split_pedalboards:
+            self.banks_files = SplitBanksFiles(self.data_path, load_workers, builder_registry)
+        else:
+            self.banks_files = BanksFiles(self.data_path, load_workers, builder_registry)
 
         self.auto_save = auto_save
 
-    def load(self, system_effect):
+        self.save_delay = save_delay
+        if max_save_delay is None and save_delay is not None:
+            max_save_delay = 10 * save_delay
+        self.max_save_delay = max_save_delay
+
+        self.journal = Journal(self.data_path / Path('journal')) if journal else None
+        self.journal_compaction = journal_compaction
+
+        self._changes = self._empty_changes()
+        self._first_change = None
+        self._last_change = None
+        self._timer = None
+        self._lock = threading.RLock()
+
+        self._batching = False
+        self._batch_manager = None
+        self._batch_records = []
+
+    def load(self, system_effect, lazy=False):
         """
         Return a :class:`.BanksManager` instance contains the banks present in
         :attr:`~pluginsmanager.observer.autosaver.autosaver.Autosaver.data_path`
 
+        With ``lazy``, only the banks headers are loaded: the pedalboards of a bank
+        are loaded in the first access (see :class:`.LazyBank`)::
+
+            >>> banks_manager = autosaver.load(system_effect, lazy=True)
+            >>> bank = banks_manager.banks[0]
+            >>> bank.pedalboards_names  # Fast
+            ['Californication', 'Dark Necessities']
+            >>> bank.pedalboards  # Loads the pedalboards
+            [<Pedalboard object as Californication at 0x7fa3bcb49be0>, <Pedalboard object as Dark Necessities at 0x7fa3bcb49c50>]
+
         :param SystemEffect system_effect: SystemEffect used in pedalboards
+        :param bool lazy: Loads the banks pedalboards only when they are used?
         :return BanksManager: :class:`.BanksManager` with banks persisted in
                 :attr:`~pluginsmanager.observer.autosaver.autosaver.Autosaver.data_path`
         """
-        banks = self.banks_files.load(system_effect)
+        if lazy:
+            banks = self._load_lazy(system_effect)
+        else:
+            banks = self.banks_files.load(system_effect)
+
+        if self.journal is not None:
+            banks = self._replay_journal(banks, system_effect)
+
         banks_ordered = self.index_file.load(banks)
 
         manager = BanksManager()
-        manager.register(self)
 
         for bank in banks_ordered:
             manager.append(bank)
             bank.manager = manager
 
+        # Registered after, because the banks loaded are already persisted
+        manager.register(self)
+
         return manager
 
+    def _load_lazy(self, system_effect):
+        self.banks_files.recover()
+
+        headers = dict(self.index_file.headers())
+        loader = lambda uuid: self.banks_files.load_bank(uuid, system_effect)
+
+        banks = []
+        for uuid in self.banks_files.banks_uuids():
+            header = headers.get(uuid)
+
+            # Index file persisted by an older version
+            if header is None:
+                banks.append(loader(uuid))
+            else:
+                banks.append(LazyBank(uuid, header, loader))
+
+        return banks
+
     def save(self, banks_manager):
         """
         Save all data from a banks_manager
 
         :param BanksManager banks_manager: BanksManager that your banks data will be persisted
         """
+        with self._lock:
+            self._changes = self._empty_changes()
+
         self.banks_files.delete_all_banks()
         self.banks_files.save(banks_manager)
         self.index_file.save(banks_manager)
 
+        if self.journal is not None:
+            self.journal.clear()
+
+    def flush(self):
+        """
+        Saves immediately the changed banks not saved yet.
+        With ``journal``, compacts the journal.
+        """
+        with self._lock:
+            self._cancel_timer()
+
+            changes = self._changes
+            self._changes = self._empty_changes()
+
+            if any(changes.values()):
+                self.banks_files.save_changes(**{kind: list(items) for kind, items in changes.items()})
+
+            if self.journal is not None:
+                self.journal.clear()
+
+    def close(self):
+        """
+        Saves the changed banks not saved yet. Use it before the application exits
+        """
+        self.flush()
+
+    def on_batch(self, changes):
+        """
+        The changed banks (and the index file) are saved once, after all changes of the batch
+        """
+        if not self.auto_save:
+            return
+
+        with self._lock:
+            self._batching = True
+            try:
+                super(Autosaver, self).on_batch(changes)
+            finally:
+                self._batching = False
+
+                # The records of the batch are synchronized with the disk once
+                records, self._batch_records = self._batch_records, []
+                if records:
+                    self.journal.append(*records)
+
+            if self.journal is not None:
+                self._compact_journal()
+
+            if self.journal is None and self.save_delay is None:
+                self.flush()
+
+            manager, self._batch_manager = self._batch_manager, None
+            if manager is not None:
+                self.index_file.save(manager)
+
     def on_bank_updated(self, bank, update_type, index, origin, **kwargs):
         if not self.auto_save:
             return
 
         if update_type == UpdateType.DELETED:
-            self.banks_files.delete_bank(bank)
+            self._delete_bank(bank)
 
         elif update_type == UpdateType.CREATED:
-            self.banks_files.save_bank(bank)
+            self._save(lambda: Journal.bank_record(bank), banks=[bank])
 
         elif update_type == UpdateType.UPDATED:
-            self.banks_files.save_bank(bank)
+            self._save(lambda: Journal.bank_record(bank), banks=[bank])
             old_bank = kwargs['old']
 
             if old_bank.manager is None:
-                self.banks_files.delete_bank(old_bank)
+                self._delete_bank(old_bank)
 
-        self.index_file.save(origin)
+        self._save_index(origin)
 
     def on_pedalboard_updated(self, pedalboard, update_type, index, origin, **kwargs):
         if not self.auto_save:
             return
 
         if update_type == UpdateType.DELETED:
-            self.banks_files.save_bank(origin)
+            self._save(lambda: Journal.bank_record(origin), manifests=[origin])
         else:
-            self.banks_files.save_bank(pedalboard.bank)
+            self._save(lambda: Journal.bank_record(pedalboard.bank), pedalboards=[pedalboard], manifests=[pedalboard.bank])
+
+        # Pedalboards names are in the index file (bank header)
+        if origin.manager is not None:
+            self._save_index(origin.manager)
 
     def on_effect_updated(self, effect, update_type, index, origin, **kwargs):
         if not self.auto_save:
             return
 
         pedalboard = origin
-        self.banks_files.save_bank(pedalboard.bank)
+        self._save(lambda: Journal.pedalboard_record(pedalboard), pedalboards=[pedalboard])
 
     def on_effect_status_toggled(self, effect, **kwargs):
         if not self.auto_save:
             return
 
-        self.banks_files.save_bank(effect.pedalboard.bank)
+        self._save(lambda: Journal.status_record(effect), pedalboards=[effect.pedalboard])
 
     def on_param_value_changed(self, param, **kwargs):
         if not self.auto_save:
             return
 
-        self.banks_files.save_bank(param.effect.pedalboard.bank)
+        self._save(lambda: Journal.param_record(param), pedalboards=[param.effect.pedalboard])
 
     def on_connection_updated(self, connection, update_type, pedalboard, **kwargs):
         if not self.auto_save:
             return
 
-        self.banks_files.save_bank(pedalboard.bank)
+        self._save(lambda: Journal.pedalboard_record(pedalboard), pedalboards=[pedalboard])
+
+    def on_custom_change(self, identifier, *args, **kwargs):
+        if not self.auto_save:
+            return
+
+        if identifier in (CustomChange.PEDALBOARD_NAME, CustomChange.PEDALBOARD_DATA):
+            pedalboard = kwargs['pedalboard']
+            if pedalboard.bank is not None:
+                self._save(lambda: Journal.pedalboard_record(pedalboard), pedalboards=[pedalboard])
+
+            if identifier == CustomChange.PEDALBOARD_NAME and pedalboard.bank is not None:
+                self._save_index(pedalboard.bank.manager)
+
+        elif identifier == CustomChange.BANK_NAME:
+            bank = kwargs['bank']
+            if bank.manager is not None:
+                self._save(lambda: Journal.bank_record(bank), manifests=[bank])
+                self._save_index(bank.manager)
+
+    @staticmethod
+    def _empty_changes():
+        return {'banks': OrderedDict(), 'manifests': OrderedDict(), 'pedalboards': OrderedDict()}
+
+    def _save(self, record, **changes):
+        """
+        :param record: Function that generates the journal record of the change
+        :param changes: Changed items by kind (see :meth:`.BanksFiles.save_changes`)
+        """
+        if self.journal is not None:
+            self._append_record(record(), changes)
+            return
+
+        if self.save_delay is None and not self._batching:
+            self.banks_files.save_changes(**changes)
+            return
+
+        with self._lock:
+            now = time.monotonic()
+            if not any(self._changes.values()):
+                self._first_change = now
+
+            self._last_change = now
+
+            for kind, items in changes.items():
+                for item in items:
+                    self._changes[kind][item] = None
+
+            if self._timer is None and self.save_delay is not None:
+                self._start_timer(self.save_delay)
+
+    def _save_index(self, banks_manager):
+        if self._batching:
+            self._batch_manager = banks_manager
+        else:
+            self.index_file.save(banks_manager)
+
+    def _delete_bank(self, bank):
+        with self._lock:
+            self._changes['banks'].pop(bank, None)
+            self._changes['manifests'].pop(bank, None)
+
+            if self.journal is not None:
+                self._append_record(Journal.bank_deleted_record(bank), {})
+
+        self.banks_files.delete_bank(bank)
+
+    def _append_record(self, record, changes):
+        with self._lock:
+            if self._batching:
+                self._batch_records.append(record)
+            else:
+                self.journal.append(record)
+
+            for kind, items in changes.items():
+                for item in items:
+                    self._changes[kind][item] = None
+
+            if not self._batching:
+                self._compact_journal()
+
+    def _compact_journal(self):
+        if self.journal.total >= self.journal_compaction:
+            self.flush()
+
+    def _replay_journal(self, banks, system_effect):
+        """
+        Applies the journal over the banks and compacts it
+        """
+        replayed, changed = self.journal.replay(banks, system_effect, self.builder_registry)
+        replayed_uuids = {bank.uuid for bank in replayed}
+
+        for bank in banks:
+            if bank.uuid not in replayed_uuids:
+                self.banks_files.delete_bank(bank)
+
+        self.banks_files.save(changed)
+        self.journal.clear()
+
+        return replayed
+
+    def _start_timer(self, interval):
+        self._timer = threading.Timer(interval, self._on_timeout)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _cancel_timer(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def _on_timeout(self):
+        with self._lock:
+            # Timer cancelled or replaced
+            if self._timer is not threading.current_thread():
+                return
+
+            now = time.monotonic()
+            idle_deadline = self._last_change + self.save_delay
+            max_deadline = self._first_change + self.max_save_delay
+            deadline = min(idle_deadline, max_deadline)
+
+            # Changes occurred after the timer starts: waits the idle again
+            if deadline > now:
+                self._start_timer(deadline - now)
+            else:
+                self.flush()
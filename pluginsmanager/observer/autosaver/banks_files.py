@@ -12,7 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from collections import OrderedDict
 from glob import glob
+from itertools import chain
 from pathlib import Path
 
 from pluginsmanager.observer.autosaver.persistence import Persistence
@@ -21,11 +23,17 @@ from pluginsmanager.util.persistence_decoder import PersistenceDecoder
 
 class BanksFiles(object):
 
-    def __init__(self, data_path):
+    def __init__(self, data_path, workers=1, registry=None):
         """
         :param Path data_path: Path that contains the banks
+        :param int workers: Number of processes used for read the banks files in :meth:`load`.
+                            ``None`` uses the number of processors.
+                            See :meth:`.PersistenceDecoder.read_files`
+        :param Lv2EffectBuilderRegistry registry: Provides the lv2 effects builder used for load the banks
         """
         self.data_path = data_path
+        self.workers = workers
+        self.registry = registry
 
     def load(self, system_effect):
         """
@@ -35,20 +43,57 @@ class BanksFiles(object):
         :return list[Bank]: List with Banks persisted in
                 :attr:`~pluginsmanager.observer.autosaver.banks_files.BanksFiles.data_path`
         """
-        persistence = PersistenceDecoder(system_effect)
+        self.recover()
 
-        banks = []
+        paths = [self._bank_path(uuid=uuid) for uuid in self.banks_uuids()]
+        decoder = PersistenceDecoder(system_effect, self.registry)
 
-        for file in glob(str(self.data_path) + "/*.json"):
-            bank = persistence.read(Persistence.read(file))
-            bank._uuid = file.split('/')[-1].split('.json')[0]
-            banks.append(bank)
+        return decoder.read_files(paths, self.workers, self._read_bank_data)
+
+    def recover(self):
+        """
+        Restores the files interrupted during a write. See :meth:`.Persistence.recover`
+        """
+        Persistence.recover(self.data_path)
+
+    def banks_uuids(self):
+        """
+        :return list[string]: Uuid of the banks persisted
+        """
+        return [file.split('/')[-1].split('.json')[0] for file in glob(str(self.data_path) + "/*.json")]
 
-        return banks
+    def load_bank(self, uuid, system_effect):
+        """
+        Loads a bank persisted
 
-    def save(self, banks_manager):
-        for bank in banks_manager:
-            self.save_bank(bank)
+        :param string uuid: Bank uuid
+        :param SystemEffect system_effect: SystemEffect used in pedalboards
+        :return Bank: Bank persisted
+        """
+        decoder = PersistenceDecoder(system_effect, self.registry)
+
+        return decoder.read(self._read_bank_data(self._bank_path(uuid=uuid)))
+
+    @staticmethod
+    def _read_bank_data(path):
+        """
+        Reads the bank json data. It's executed in other processes by :meth:`load`
+
+        :param Path path: Bank path
+        :return dict: Bank json data, with the bank uuid
+        """
+        data = Persistence.read(path)
+        data['uuid'] = Path(path).stem
+
+        return data
+
+    def save(self, banks):
+        """
+        Save the banks, each in your file
+
+        :param list[Bank] banks: Banks (or a :class:`.BanksManager`) that will be persisted
+        """
+        Persistence.save_many([(self._bank_path(bank), bank.json) for bank in banks])
 
     def save_bank(self, bank):
         """
@@ -59,6 +104,46 @@ class BanksFiles(object):
         path = self._bank_path(bank)
         Persistence.save(path, bank.json)
 
+    def save_manifest(self, bank):
+        """
+        Save the bank data, except the pedalboards data.
+        Used when the bank pedalboards list changes.
+
+        In this layout, the bank is saved completely.
+
+        :param Bank bank: Bank that will be persisted
+        """
+        self.save_bank(bank)
+
+    def save_pedalboard(self, pedalboard):
+        """
+        Save the pedalboard data.
+
+        In this layout, the pedalboard bank is saved completely.
+
+        :param Pedalboard pedalboard: Pedalboard that will be persisted
+        """
+        self.save_bank(pedalboard.bank)
+
+    def save_changes(self, banks=(), manifests=(), pedalboards=()):
+        """
+        Save many changes at once
+
+        :param list[Bank] banks: Banks that will be saved completely
+        :param list[Bank] manifests: Banks that the manifests will be saved
+                                     (see :meth:`save_manifest`)
+        :param list[Pedalboard] pedalboards: Pedalboards that will be saved
+        """
+        changed = OrderedDict()
+        for bank in chain(banks, manifests, (pedalboard.bank for pedalboard in pedalboards)):
+            if bank is not None:
+                changed[bank] = None
+
+        if len(changed) == 1:
+            self.save_bank(next(iter(changed)))
+        elif changed:
+            self.save(changed)
+
     def delete_bank(self, bank):
         """
         Delete the bank's file
@@ -78,10 +163,14 @@ class BanksFiles(object):
         for file in glob(str(self.data_path) + "/*.json"):
             Persistence.delete(file)
 
-    def _bank_path(self, bank):
+    def _bank_path(self, bank=None, uuid=None):
         """
         :param Bank bank: Bank that will be generate your path
+        :param string uuid: Bank uuid, if bank isn't informed
 
         :return string: Bank path .json
         """
-        return self.data_path / Path('{}.json'.format(bank.uuid))
+        if bank is not None:
+            uuid = bank.uuid
+
+        return self.data_path / Path('{}.json'.format(uuid))
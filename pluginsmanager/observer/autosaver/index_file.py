@@ -37,6 +37,20 @@ class IndexFile(object):
 
         return self.load_data(data, indexables)
 
+    def headers(self):
+        """
+        Reads the headers persisted in the index file, ordered by index
+
+        :return list[tuple(string, dict)]: List of ``(uuid, header)``.
+                                           The header is ``None`` if it hasn't been persisted
+        """
+        try:
+            data = Persistence.read(self.path, create_file=True)
+        except ValueError:
+            data = []
+
+        return [(indexable['uuid'], indexable.get('header')) for indexable in data]
+
     def load_data(self, json_data, indexables):
         new_list = []
         indexables_hash = {uuid: bank for (uuid, bank) in map(lambda bank: (bank.uuid, bank), indexables)}
@@ -67,5 +81,10 @@ class IndexFile(object):
             'uuid': indexable.uuid,
             'identifier': indexable.simple_identifier
         }
+
+        header = indexable.header
+        if header is not None:
+            item['header'] = header
+
         return item
 
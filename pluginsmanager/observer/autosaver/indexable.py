@@ -33,3 +33,13 @@ class Indexable(object):
         :return string:
         """
         pass
+
+    @property
+    def header(self):
+        """
+        Lightweight data persisted in the index file, readable without load the
+        indexable (see :class:`.LazyBank`)
+
+        :return dict: Header data or ``None``
+        """
+        return None
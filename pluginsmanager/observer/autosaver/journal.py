@@ -0,0 +1,195 @@
+# Copyright 2017 SrMouraSilva
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import os
+from collections import OrderedDict
+
+from pluginsmanager.util.persistence_decoder import BankReader, PedalboardReader
+
+
+class Journal(object):
+    """
+    Append-only log of the changes of the banks.
+
+    Each change is persisted as a small record (a json line) instead of rewrite the
+    bank file. The records overwrite a region of a bank (a param value, an effect status,
+    a pedalboard or the whole bank), so replaying a record more than once has the same result.
+
+    The records are applied over the banks persisted (the snapshot) with :meth:`replay`.
+    After the banks changed are persisted, the journal can be cleared with :meth:`clear`
+    (compaction).
+
+    :param Path path: Journal file path
+    """
+
+    PARAM = 'param'
+    STATUS = 'status'
+    PEDALBOARD = 'pedalboard'
+    BANK = 'bank'
+    BANK_DELETED = 'bank_deleted'
+
+    def __init__(self, path):
+        self.path = path
+        self.total = len(self.records())
+
+    def append(self, *records):
+        """
+        Appends the records in the journal and synchronizes them with the disk.
+
+        The synchronization (``fsync``) is the expensive part: append the records
+        of related changes in a single call.
+
+        :param dict records: Records generated by the :class:`.Journal` record methods,
+                             like :meth:`param_record`
+        """
+        with open(str(self.path), 'a') as file:
+            for record in records:
+                file.write(json.dumps(record) + '\n')
+            file.flush()
+            os.fsync(file.fileno())
+
+        self.total += len(records)
+
+    def records(self):
+        """
+        Reads the journal records. Useful for history.
+
+        A record partially written (by a power cut) is ignored.
+
+        :return list[dict]: Records, the older first
+        """
+        if not self.path.exists():
+            return []
+
+        records = []
+        with open(str(self.path)) as file:
+            for line in file:
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    break
+
+        return records
+
+    def clear(self):
+        """
+        Removes all the records. Call it after persists the banks changed (compaction)
+        """
+        if self.path.exists():
+            os.remove(str(self.path))
+
+        self.total = 0
+
+    def replay(self, banks, system_effect, registry=None):
+        """
+        Applies the journal records over the banks
+
+        :param list[Bank] banks: Banks loaded from the snapshot
+        :param SystemEffect system_effect: SystemEffect used in pedalboards
+        :param Lv2EffectBuilderRegistry registry: Provides the lv2 effects builder
+        :return tuple(list[Bank], list[Bank]): The banks and the banks changed by the records
+        """
+        banks = OrderedDict((bank.uuid, bank) for bank in banks)
+        changed = OrderedDict()
+
+        for record in self.records():
+            try:
+                bank = self._apply(banks, record, system_effect, registry)
+            except (KeyError, IndexError, ValueError):
+                # The record can't be applied (inconsistent data). It's ignored
+                continue
+
+            if bank is not None:
+                changed[bank.uuid] = bank
+
+        return list(banks.values()), [bank for uuid, bank in changed.items() if uuid in banks]
+
+    def _apply(self, banks, record, system_effect, registry):
+        record_type = record['type']
+
+        if record_type == Journal.BANK_DELETED:
+            del banks[record['bank']]
+            return None
+
+        if record_type == Journal.BANK:
+            bank = BankReader(system_effect, registry).read(record['data'])
+            bank._uuid = record['bank']
+            banks[bank.uuid] = bank
+            return bank
+
+        bank = banks[record['bank']]
+        pedalboard = bank.pedalboards[record['pedalboard']]
+
+        if record_type == Journal.PEDALBOARD:
+            new_pedalboard = PedalboardReader(system_effect, registry).read(record['data'])
+            new_pedalboard._uuid = pedalboard.uuid
+            bank.pedalboards[record['pedalboard']] = new_pedalboard
+
+        elif record_type == Journal.STATUS:
+            pedalboard.effects[record['effect']].active = record['active']
+
+        elif record_type == Journal.PARAM:
+            pedalboard.effects[record['effect']].params[record['param']].value = record['value']
+
+        else:
+            raise ValueError('Unknown record type: {}'.format(record_type))
+
+        return bank
+
+    @staticmethod
+    def param_record(param):
+        effect = param.effect
+        return {
+            'type': Journal.PARAM,
+            'bank': effect.pedalboard.bank.uuid,
+            'pedalboard': effect.pedalboard.index,
+            'effect': effect.index,
+            'param': effect.params.index(param),
+            'value': param.value
+        }
+
+    @staticmethod
+    def status_record(effect):
+        return {
+            'type': Journal.STATUS,
+            'bank': effect.pedalboard.bank.uuid,
+            'pedalboard': effect.pedalboard.index,
+            'effect': effect.index,
+            'active': effect.active
+        }
+
+    @staticmethod
+    def pedalboard_record(pedalboard):
+        return {
+            'type': Journal.PEDALBOARD,
+            'bank': pedalboard.bank.uuid,
+            'pedalboard': pedalboard.index,
+            'data': pedalboard.json
+        }
+
+    @staticmethod
+    def bank_record(bank):
+        return {
+            'type': Journal.BANK,
+            'bank': bank.uuid,
+            'data': bank.json
+        }
+
+    @staticmethod
+    def bank_deleted_record(bank):
+        return {
+            'type': Journal.BANK_DELETED,
+            'bank': bank.uuid
+        }
@@ -0,0 +1,108 @@
+# Copyright 2017 SrMouraSilva
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from pluginsmanager.model.bank import Bank
+
+
+class LazyBank(Bank):
+    """
+    Bank that its pedalboards are loaded only in the first access.
+
+    Before it, only the bank header (name and pedalboards names) is available::
+
+        >>> bank = LazyBank('uuid', {'name': 'RHCP', 'pedalboards': ['Californication']}, loader)
+        >>> bank.loaded
+        False
+        >>> bank.pedalboards_names
+        ['Californication']
+        >>> bank.pedalboards[0].name  # Loads the pedalboards
+        'Californication'
+        >>> bank.loaded
+        True
+
+    :param string uuid: Bank uuid
+    :param dict header: Bank header (see :attr:`.Bank.header`)
+    :param loader: Function that receives the bank uuid and returns the bank persisted
+    """
+
+    def __init__(self, uuid, header, loader):
+        self._loader = None
+        super(LazyBank, self).__init__(header['name'])
+
+        self._uuid = uuid
+        self._header = header
+        self._loader = loader
+
+    @property
+    def loaded(self):
+        """
+        :return bool: The pedalboards has been loaded?
+        """
+        return self._loader is None
+
+    @property
+    def pedalboards(self):
+        """
+        :return ObservableList: Bank pedalboards. Loads them in the first access
+        """
+        if not self.loaded:
+            self._load()
+
+        return self._pedalboards
+
+    @pedalboards.setter
+    def pedalboards(self, pedalboards):
+        self._pedalboards = pedalboards
+
+    @property
+    def observer(self):
+        return self._observer
+
+    @observer.setter
+    def observer(self, observer):
+        self._observer = observer
+
+        # The pedalboards will receive the observer when loaded
+        if self.loaded:
+            for pedalboard in self.pedalboards:
+                pedalboard.observer = observer
+
+    @property
+    def pedalboards_names(self):
+        """
+        :return list[string]: Pedalboards names, without load the pedalboards
+        """
+        if not self.loaded:
+            return list(self._header['pedalboards'])
+
+        return [pedalboard.name for pedalboard in self.pedalboards]
+
+    @property
+    def header(self):
+        if not self.loaded:
+            return {
+                'name': self.name,
+                'pedalboards': self.pedalboards_names
+            }
+
+        return super(LazyBank, self).header
+
+    def _load(self):
+        persisted = self._loader(self.uuid)
+        self._loader = None
+
+        # The pedalboards are already persisted: the observers aren't notified
+        self._pedalboards.real_list.extend(persisted.pedalboards)
+        for pedalboard in self._pedalboards:
+            self._init_pedalboard(pedalboard)
@@ -15,20 +15,49 @@
 import asyncio
 import json
 import os
+import shutil
+from glob import glob
+from pathlib import Path
 
 
 class Persistence(object):
+    """
+    Reads and writes json data files.
+
+    The files are written atomically: the data is written in a temporary file
+    (``<file>.tmp``), synchronized with the disk and only then renamed to the file.
+    The previous version is kept as ``<file>.bak``, so a power cut during
+    the write never leaves a truncated file: :meth:`read` and :meth:`recover`
+    use the last good copy.
+    """
+
+    TEMPORARY_SUFFIX = '.tmp'
+    BACKUP_SUFFIX = '.bak'
 
     @staticmethod
     def read(path, create_file=False):
         """
-        Reads the json data in path
+        Reads the json data in path.
+
+        If the file doesn't exists or is corrupted, reads the last good copy
+        (if it exists).
 
         :param Path path: Path that json data will be readed
         :param create_file: Creates the file if it isn't exists
 
         :return: json data
         """
+        try:
+            return Persistence._read(path, create_file and not Persistence._backup_path(path).exists())
+        except (ValueError, FileNotFoundError):
+            backup = Persistence._backup_path(path)
+            if not backup.exists():
+                raise
+
+            return Persistence._read(backup)
+
+    @staticmethod
+    def _read(path, create_file=False):
         if create_file:
             with open(str(path), 'a+') as data_file:
                 data_file.seek(0)
@@ -46,33 +75,149 @@ class Persistence(object):
         :param Path path: Path that json_data will be persisted
         :param json_data: Data that will be persisted
         """
-        try:
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                asyncio.run_coroutine_threadsafe(Persistence._save(path, json_data), loop)
-            else:
-                loop.run_until_complete(Persistence._save(path, json_data))
-        except AssertionError:
-            Persistence._save(path, json_data)
-
-    @staticmethod
-    @asyncio.coroutine
-    def _save(path, json_data):
-        with open(str(path), "w+") as file:
+        Persistence.save_many([(path, json_data)])
+
+    @staticmethod
+    def save_many(items, batch_sync=False):
+        """
+        Saves many json data. The disk synchronization of the
+        directories is done once per directory, instead of once per file.
+
+        With ``batch_sync``, all the temporary files are written and synchronized
+        with the disk at once (a single ``sync``) before they are renamed, instead
+        of a ``fsync`` per file. It reduces the I/O cost when many banks are saved,
+        but the ``sync`` flushes all the file systems.
+
+        :param list[tuple(Path, object)] items: List of ``(path, json_data)``
+        :param bool batch_sync: Synchronizes all the files at once?
+        """
+        Persistence._run(Persistence._write_many, list(items), batch_sync)
+
+    @staticmethod
+    def _write_many(items, batch_sync=False):
+        paths = [Path(path) for path, json_data in items]
+        single_sync = batch_sync and hasattr(os, 'sync')
+
+        for path, (_, json_data) in zip(paths, items):
+            Persistence._write_temporary(path, json_data, sync=not single_sync)
+
+        if single_sync:
+            os.sync()
+
+        for path in paths:
+            Persistence._replace(path)
+
+        for directory in {path.parent for path in paths}:
+            Persistence._sync_directory(directory)
+
+    @staticmethod
+    def _write_temporary(path, json_data, sync=True):
+        with open(str(Persistence._temporary_path(path)), 'w') as file:
             file.write(json.dumps(json_data))
+            file.flush()
+            if sync:
+                os.fsync(file.fileno())
 
     @staticmethod
-    def delete(path):
+    def _replace(path):
+        if path.exists():
+            os.replace(str(path), str(Persistence._backup_path(path)))
+
+        os.replace(str(Persistence._temporary_path(path)), str(path))
+
+    @staticmethod
+    def _sync_directory(directory):
+        try:
+            descriptor = os.open(str(directory), os.O_RDONLY)
+        except OSError:
+            # Not supported (e.g. Windows)
+            return
+
         try:
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                asyncio.run_coroutine_threadsafe(Persistence._delete(path), loop)
-            else:
-                loop.run_until_complete(Persistence._delete(path))
-        except AssertionError:
-            Persistence._delete(str(path))
+            os.fsync(descriptor)
+        except OSError:
+            pass
+        finally:
+            os.close(descriptor)
+
+    @staticmethod
+    def delete(path):
+        """
+        Deletes the file and its last good copy, if they exist
+
+        :param Path path: Path of the file that will be removed
+        """
+        Persistence._run(Persistence._delete, path)
 
     @staticmethod
-    @asyncio.coroutine
     def _delete(path):
-        os.remove(str(path))
+        path = Path(path)
+        backup = Persistence._backup_path(path)
+
+        # The backup is removed first, otherwise the file would be recovered
+        if backup.exists():
+            os.remove(str(backup))
+
+        if path.exists():
+            os.remove(str(path))
+
+    @staticmethod
+    def delete_directory(path):
+        """
+        Deletes the directory and all its files
+
+        :param Path path: Directory that will be removed
+        """
+        Persistence._run(shutil.rmtree, str(path), True)
+
+    @staticmethod
+    def recover(directory):
+        """
+        Restores the files of the directory interrupted during a write.
+        Should be called before read the files.
+
+        * Removes the temporary files (incomplete writes);
+        * Restores the last good copy of the files that were removed or that are corrupted.
+
+        :param Path directory: Directory that contains the json files
+        """
+        for temporary in glob(str(directory) + '/*' + Persistence.TEMPORARY_SUFFIX):
+            os.remove(temporary)
+
+        for backup in glob(str(directory) + '/*' + Persistence.BACKUP_SUFFIX):
+            path = Path(backup[:-len(Persistence.BACKUP_SUFFIX)])
+
+            if not path.exists() or not Persistence._is_valid(path):
+                os.replace(backup, str(path))
+
+    @staticmethod
+    def _is_valid(path):
+        try:
+            Persistence._read(path)
+            return True
+        except ValueError:
+            return False
+
+    @staticmethod
+    def _run(function, *args):
+        """
+        Runs the function in the event loop thread if there is an event loop running,
+        otherwise runs it now
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # There isn't an event loop running in the current thread
+            function(*args)
+        else:
+            loop.call_soon(function, *args)
+
+    @staticmethod
+    def _temporary_path(path):
+        path = Path(path)
+        return path.with_name(path.name + Persistence.TEMPORARY_SUFFIX)
+
+    @staticmethod
+    def _backup_path(path):
+        path = Path(path)
+        return path.with_name(path.name + Persistence.BACKUP_SUFFIX)
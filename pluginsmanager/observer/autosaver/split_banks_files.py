@@ -0,0 +1,196 @@
+# Copyright 2017 SrMouraSilva
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+from glob import glob
+from pathlib import Path
+
+from pluginsmanager.observer.autosaver.banks_files import BanksFiles
+from pluginsmanager.observer.autosaver.persistence import Persistence
+
+
+class SplitBanksFiles(BanksFiles):
+    """
+    Persists each bank in a directory, with a file per pedalboard.
+    Then, a change in a pedalboard only rewrites the pedalboard file::
+
+        data_path/
+            <bank uuid>/
+                bank.json              # Manifest: bank data and the pedalboards order
+                <pedalboard uuid>.json
+                <pedalboard uuid>.json
+
+    :param Path data_path: Path that contains the banks
+    """
+
+    MANIFEST = 'bank.json'
+
+    def banks_uuids(self):
+        """
+        :return list[string]: Uuid of the banks persisted
+        """
+        return [Path(manifest_path).parent.name for manifest_path in glob(str(self.data_path / '*' / self.MANIFEST))]
+
+    @staticmethod
+    def _read_bank_data(path):
+        """
+        Reads the bank json data, joining the manifest and the pedalboards files.
+        It's executed in other processes by :meth:`load`
+
+        :param Path path: Bank directory
+        :return dict: Bank json data, with the bank and pedalboards uuids
+        """
+        bank_path = Path(path)
+        Persistence.recover(bank_path)
+
+        data = Persistence.read(bank_path / SplitBanksFiles.MANIFEST)
+        data['uuid'] = bank_path.name
+
+        pedalboards = []
+        for pedalboard_uuid in data['pedalboards']:
+            pedalboard_path = bank_path / '{}.json'.format(pedalboard_uuid)
+            if not pedalboard_path.exists():
+                continue
+
+            pedalboard = Persistence.read(pedalboard_path)
+            pedalboard['uuid'] = pedalboard_uuid
+            pedalboards.append(pedalboard)
+
+        data['pedalboards'] = pedalboards
+
+        return data
+
+    def save(self, banks):
+        """
+        Save the banks, each in your directory
+
+        :param list[Bank] banks: Banks (or a :class:`.BanksManager`) that will be persisted
+        """
+        self.save_changes(banks=banks)
+
+    def save_bank(self, bank):
+        """
+        Save the bank manifest and all its pedalboards
+
+        :param Bank bank: Bank that will be persisted
+        """
+        self.save_changes(banks=[bank])
+
+    def save_manifest(self, bank):
+        """
+        Save the bank data and the pedalboards order.
+        The files of the pedalboards that aren't in the bank are removed.
+
+        :param Bank bank: Bank that will be persisted
+        """
+        self.save_changes(manifests=[bank])
+
+    def save_pedalboard(self, pedalboard):
+        """
+        Save the pedalboard file
+
+        :param Pedalboard pedalboard: Pedalboard that will be persisted
+        """
+        self.save_changes(pedalboards=[pedalboard])
+
+    def save_changes(self, banks=(), manifests=(), pedalboards=()):
+        banks = list(banks)
+        files = []
+        manifests_saved = []
+
+        for bank in banks:
+            files.append(self._manifest_file(bank))
+            files += [self._pedalboard_file(pedalboard) for pedalboard in bank.pedalboards]
+            manifests_saved.append(bank)
+
+        for bank in manifests:
+            if bank not in manifests_saved:
+                files.append(self._manifest_file(bank))
+                manifests_saved.append(bank)
+
+        for pedalboard in pedalboards:
+            if pedalboard.bank is not None and pedalboard.bank not in banks:
+                files.append(self._pedalboard_file(pedalboard))
+
+        for bank in manifests_saved:
+            os.makedirs(str(self._bank_path(bank)), exist_ok=True)
+
+        Persistence.save_many(files)
+
+        for bank in manifests_saved:
+            self._delete_removed_pedalboards(bank)
+
+    def delete_bank(self, bank):
+        """
+        Delete the bank's directory
+
+        :param Bank bank: Bank that will be removed
+        """
+        self._delete_directory(self._bank_path(bank))
+
+    def delete_all_banks(self):
+        """
+        Delete all banks directories.
+
+        Util for manual save, because isn't possible know which banks
+        were removed
+        """
+        for manifest_path in glob(str(self.data_path / '*' / self.MANIFEST)):
+            self._delete_directory(Path(manifest_path).parent)
+
+    def _delete_directory(self, bank_path):
+        # Without the manifest, the directory is ignored if the removal is interrupted
+        manifest_path = bank_path / self.MANIFEST
+        if manifest_path.exists():
+            Persistence.delete(manifest_path)
+
+        Persistence.delete_directory(bank_path)
+
+    def _delete_removed_pedalboards(self, bank):
+        bank_path = self._bank_path(bank)
+        current = {'{}.json'.format(pedalboard.uuid) for pedalboard in bank.pedalboards}
+        current.add(self.MANIFEST)
+
+        for file in glob(str(bank_path / '*.json')):
+            if Path(file).name not in current:
+                Persistence.delete(file)
+
+    def _manifest_file(self, bank):
+        try:
+            index = bank.index
+        except IndexError:
+            index = -1
+
+        data = {
+            'index': index,
+            'name': bank.name,
+            'pedalboards': [pedalboard.uuid for pedalboard in bank.pedalboards]
+        }
+
+        return self._bank_path(bank) / self.MANIFEST, data
+
+    def _pedalboard_file(self, pedalboard):
+        return self._bank_path(pedalboard.bank) / '{}.json'.format(pedalboard.uuid), pedalboard.json
+
+    def _bank_path(self, bank=None, uuid=None):
+        """
+        :param Bank bank: Bank that will be generate your path
+        :param string uuid: Bank uuid, if bank isn't informed
+
+        :return Path: Bank directory
+        """
+        if bank is not None:
+            uuid = bank.uuid
+
+        return self.data_path / Path(uuid)
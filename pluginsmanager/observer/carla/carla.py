@@ -109,7 +109,7 @@ class Carla(HostObserver):
                 PLUGIN_LV2,
                 None,#"/usr/lib/lv2/gx_echo.lv2/gx_echo.so",  # Fixme
                 "effect_{}".format(effect.index),
-                effect.plugin.json['uri'],
+                effect.plugin['uri'],
                 0,
                 None,
                 0):
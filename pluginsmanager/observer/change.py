@@ -0,0 +1,39 @@
+# Copyright 2017 SrMouraSilva
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from collections import namedtuple
+
+
+class Change(namedtuple('Change', ['method', 'args', 'kwargs'])):
+    """
+    A change notified to the observers. It's used for deliver the changes
+    of a batch (see :meth:`.UpdatesObserver.on_batch`)::
+
+        >>> change
+        Change(method='on_param_value_changed', args=(<Lv2Param object as value=0.5 [0.0 - 1.0] at 0x7f...>,), kwargs={})
+        >>> change.notify(observer)  # observer.on_param_value_changed(param)
+
+    :param string method: :class:`.UpdatesObserver` method that notifies the change
+    :param tuple args: Method positional arguments
+    :param dict kwargs: Method keyword arguments
+    """
+    __slots__ = ()
+
+    def notify(self, observer):
+        """
+        Notifies the change for the observer
+
+        :param UpdatesObserver observer: Observer
+        """
+        getattr(observer, self.method)(*self.args, **self.kwargs)
@@ -13,10 +13,13 @@
 # limitations under the License.
 
 from abc import ABCMeta, abstractmethod
+from contextlib import contextmanager
 
 from pluginsmanager.observer.update_type import UpdateType
 from pluginsmanager.observer.updates_observer import UpdatesObserver
+from pluginsmanager.observer.host_observer.standby_pool import StandbyPool
 from pluginsmanager.util.pairs_list import PairsList
+from pluginsmanager.util.pedalboard_diff import PedalboardDiff
 
 
 class HostError(Exception):
@@ -32,9 +35,24 @@ class HostObserver(UpdatesObserver, metaclass=ABCMeta):
     pedalboard changes transparently.
 
     HostObserver contains an algorithm for improve the change of the
-    current pedalboard. Also, HostObserver process the updates and define
-    abstract methods that hosts needs to implements, usually only with the
-    important part.
+    current pedalboard: only the differences between the current and the new
+    pedalboard are applied (see :class:`.PedalboardDiff`). Also, HostObserver
+    process the updates and define abstract methods that hosts needs to
+    implements, usually only with the important part.
+
+    Pedalboards can be preloaded in the host ("warm standby"): their effects are
+    instantiated, but kept bypassed and disconnected. Changing the current pedalboard to a
+    preloaded pedalboard only requires to rewire the connections::
+
+        >>> host.standby.max_pedalboards = 2
+        >>> host.standby.max_effects = 30
+        >>> host.pedalboard = bank.pedalboards[0]
+        >>> host.preload_next()
+        >>> # Fast: bank.pedalboards[1] has been preloaded
+        >>> host.pedalboard = bank.pedalboards[1]
+
+    The previous pedalboard is kept in standby while the :attr:`standby` limits
+    (a :class:`.StandbyPool`) are respected.
     """
     
     def __init__(self):
@@ -42,6 +60,9 @@ class HostObserver(UpdatesObserver, metaclass=ABCMeta):
         self._pedalboard = None
 
         self.pairs_list = PairsList(lambda effect: effect.plugin['uri'])
+        self.pedalboard_diff = PedalboardDiff(self.pairs_list)
+
+        self.standby = StandbyPool()
 
     def start(self):
         """
@@ -82,37 +103,112 @@ class HostObserver(UpdatesObserver, metaclass=ABCMeta):
         """
         Remove the audio plugins loaded and closes connection with the host.
         """
+        for pedalboard in self.standby:
+            self.unload(pedalboard)
+
         self.pedalboard = None
 
+    def preload(self, pedalboard):
+        """
+        Loads the pedalboard effects in the host, but bypassed and disconnected,
+        so that a later change of the current pedalboard to it only rewires the connections.
+
+        The pedalboard isn't loaded if :attr:`standby` doesn't accept it.
+
+        :param Pedalboard pedalboard: Pedalboard that will be preloaded
+        """
+        if pedalboard is self.pedalboard:
+            return
+
+        if pedalboard in self.standby:
+            for evicted in self.standby.append(pedalboard):
+                self._unload_effects(evicted)
+            return
+
+        if not self.standby.accepts(pedalboard):
+            return
+
+        with self._batch():
+            for effect in pedalboard.effects:
+                self._load_standby_effect(effect)
+
+            for evicted in self.standby.append(pedalboard):
+                self._unload_effects(evicted)
+
+    def preload_next(self, total=None):
+        """
+        Preloads the pedalboards after the current pedalboard in its bank
+
+        :param int total: Number of pedalboards that will be preloaded.
+                          Default is ``standby.max_pedalboards``
+        """
+        if self.pedalboard is None or self.pedalboard.bank is None:
+            return
+
+        if total is None:
+            total = self.standby.max_pedalboards
+
+        index = self.pedalboard.index
+        next_pedalboards = self.pedalboard.bank.pedalboards[index+1:index+1+total]
+
+        # The nearest pedalboard will be the most recently used
+        for pedalboard in reversed(next_pedalboards):
+            self.preload(pedalboard)
+
+    def unload(self, pedalboard):
+        """
+        Removes from the host the effects of a preloaded pedalboard
+
+        :param Pedalboard pedalboard: Pedalboard in standby
+        """
+        if pedalboard not in self.standby:
+            return
+
+        self.standby.remove(pedalboard)
+        self._unload_effects(pedalboard)
+
     ####################################
     # Observer
     ####################################
     def on_current_pedalboard_changed(self, pedalboard, **kwargs):
-        if self.pedalboard is not None and pedalboard is not None:
-            self._replace_pedalboard(self.pedalboard, pedalboard)
-        else:
-            self._change_pedalboard(pedalboard)
+        with self._batch():
+            if pedalboard is not None and pedalboard in self.standby:
+                self._activate_standby(pedalboard)
+            elif self.pedalboard is not None and pedalboard is not None:
+                self._replace_pedalboard(self.pedalboard, pedalboard)
+            else:
+                self._change_pedalboard(pedalboard)
 
     def on_bank_updated(self, bank, update_type, **kwargs):
-        if (self.pedalboard is not None
-        and bank != self.pedalboard.bank):
-            return
-        pass
+        if update_type == UpdateType.DELETED:
+            for pedalboard in self.standby:
+                if pedalboard.bank == bank:
+                    self.unload(pedalboard)
 
     def on_pedalboard_updated(self, pedalboard, update_type, **kwargs):
+        if update_type == UpdateType.DELETED:
+            self.unload(pedalboard)
+        elif update_type == UpdateType.UPDATED and kwargs['old'].bank is None:
+            self.unload(kwargs['old'])
+
         if pedalboard != self.pedalboard:
             return
 
         self.on_current_pedalboard_changed(pedalboard)
 
     def on_effect_updated(self, effect, update_type, index, origin, **kwargs):
+        if origin in self.standby:
+            self._on_standby_effect_updated(effect, update_type)
+            return
+
         if origin != self.pedalboard:
             return
 
         if update_type == UpdateType.CREATED:
-            self._add_effect(effect)
-            self._load_params_of(effect)
-            self.on_effect_status_toggled(effect)
+            with self._batch():
+                self._add_effect(effect)
+                self._load_params_of(effect)
+                self.on_effect_status_toggled(effect)
 
         if update_type == UpdateType.DELETED:
             self._remove_effect(effect)
@@ -126,6 +222,13 @@ class HostObserver(UpdatesObserver, metaclass=ABCMeta):
             if param.value != param.default:
                 self._set_param_value(param)
 
+    def on_batch(self, changes):
+        """
+        The host commands of all changes are grouped (see :meth:`_batch`)
+        """
+        with self._batch():
+            super(HostObserver, self).on_batch(changes)
+
     def on_effect_status_toggled(self, effect, **kwargs):
         if effect.pedalboard != self.pedalboard:
             return
@@ -133,6 +236,10 @@ class HostObserver(UpdatesObserver, metaclass=ABCMeta):
         self._set_effect_status(effect)
 
     def on_param_value_changed(self, param, **kwargs):
+        if param.effect.pedalboard in self.standby:
+            self._set_param_value(param)
+            return
+
         if param.effect.pedalboard != self.pedalboard:
             return
 
@@ -151,30 +258,92 @@ class HostObserver(UpdatesObserver, metaclass=ABCMeta):
     # Private methods
     ####################################
     def _replace_pedalboard(self, current, pedalboard):
-        # Replace effects with equal plugins
-        result = self.pairs_list.calculate(current.effects, pedalboard.effects)
+        plan = self.pedalboard_diff.calculate(current, pedalboard)
 
-        for current_effect, new_effect in result.pairs:
+        # Reuses the effects with equal plugins
+        for current_effect, new_effect in plan.effects_pairs:
             new_effect.instance = current_effect.instance
 
-            for parameter_old_effect, parameter_new_effect in zip(current_effect.params, new_effect.params):
-                if parameter_new_effect.value != parameter_old_effect.value:
-                    self._set_param_value(parameter_new_effect)
-
-        # Remove not equal plugins
-        current_will_remove = result.elements_not_added_a
+        for connection in plan.connections_to_remove:
+            self._disconnect(connection)
 
-        self._remove_connections_of(current)
-        self._remove_effects(current_will_remove)
+        self._remove_effects(plan.effects_to_remove)
 
         self._pedalboard = pedalboard
 
-        # Remove not equal plugins
         # Changes are only updated if self._pedalboard = pedalboard
-        pedalboard_will_add = result.elements_not_added_b
+        self._add_effects(plan.effects_to_add)
+
+        for param in plan.params_to_set:
+            self._set_param_value(param)
+
+        for effect in plan.effects_status_to_set:
+            self._set_effect_status(effect)
+
+        for connection in plan.connections_to_add:
+            self._connect(connection)
+
+    def _activate_standby(self, pedalboard):
+        self.standby.remove(pedalboard)
+        current = self.pedalboard
+
+        if current is not None:
+            for connection in current.connections:
+                self._disconnect(connection)
+
+            self._deactivate(current)
+
+        self._pedalboard = pedalboard
+
+        for effect in pedalboard.effects:
+            self._set_effect_status(effect)
+
+        for connection in pedalboard.connections:
+            self._connect(connection)
+
+    def _deactivate(self, pedalboard):
+        """
+        Puts the pedalboard (disconnected) in standby or removes it
+        """
+        if not self.standby.accepts(pedalboard):
+            for effect in pedalboard.effects:
+                self._remove_effect(effect)
+            return
+
+        for effect in pedalboard.effects:
+            self._bypass_effect(effect)
+
+        for evicted in self.standby.append(pedalboard):
+            self._unload_effects(evicted)
 
-        self._add_effects(pedalboard_will_add)
-        self._add_connections_of(pedalboard)
+    def _on_standby_effect_updated(self, effect, update_type):
+        if update_type == UpdateType.CREATED:
+            self._load_standby_effect(effect)
+            self._apply_standby_limits(effect.pedalboard)
+
+        elif update_type == UpdateType.DELETED:
+            self._remove_effect(effect)
+
+    def _apply_standby_limits(self, pedalboard):
+        """
+        The pedalboards in standby can grow: the pool limits are applied again
+        """
+        if not self.standby.accepts(pedalboard):
+            self.unload(pedalboard)
+
+        for evicted in self.standby.evict():
+            self._unload_effects(evicted)
+
+    def _load_standby_effect(self, effect):
+        with self._batch():
+            self._add_effect(effect)
+            self._load_params_of(effect)
+            self._bypass_effect(effect)
+
+    def _unload_effects(self, pedalboard):
+        with self._batch():
+            for effect in pedalboard.effects:
+                self._remove_effect(effect)
 
     def _change_pedalboard(self, pedalboard):
         if self.pedalboard is not None:
@@ -210,6 +379,16 @@ class HostObserver(UpdatesObserver, metaclass=ABCMeta):
     ####################################
     # Implementation
     ####################################
+    @contextmanager
+    def _batch(self):
+        """
+        Groups the host commands generated inside the ``with`` block.
+
+        Hosts that can send many commands at once (like :class:`.ModHost`)
+        should override it.
+        """
+        yield
+
     @abstractmethod
     def _add_effect(self, effect):
         pass
@@ -233,3 +412,12 @@ class HostObserver(UpdatesObserver, metaclass=ABCMeta):
     @abstractmethod
     def _set_effect_status(self, effect):
         pass
+
+    def _bypass_effect(self, effect):
+        """
+        Disables the effect processing, independently of ``effect.active``.
+        Used for the effects of the pedalboards in standby.
+
+        Hosts should override it, otherwise the effects in standby keep consuming processing.
+        """
+        pass
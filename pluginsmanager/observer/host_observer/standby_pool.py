@@ -0,0 +1,99 @@
+# Copyright 2017 SrMouraSilva
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from collections import OrderedDict
+
+
+class StandbyPool(object):
+    """
+    Pedalboards kept loaded ("warm standby") in a host, but not being played.
+
+    The pool is a LRU: when it exceeds ``max_pedalboards`` or the total of effects
+    exceeds ``max_effects`` (the memory budget), the least recently used
+    pedalboards are evicted.
+
+    :param int max_pedalboards: Maximum pedalboards in standby. ``0`` disables the pool
+    :param int max_effects: Maximum effects (plugins instances) of all the pedalboards
+                            in standby or ``None`` for unlimited
+    """
+
+    def __init__(self, max_pedalboards=0, max_effects=None):
+        self.max_pedalboards = max_pedalboards
+        self.max_effects = max_effects
+
+        self._pedalboards = OrderedDict()
+
+    def __contains__(self, pedalboard):
+        return pedalboard in self._pedalboards
+
+    def __iter__(self):
+        """
+        :return: Iterator of the pedalboards, the least recently used first
+        """
+        return iter(list(self._pedalboards))
+
+    def __len__(self):
+        return len(self._pedalboards)
+
+    @property
+    def total_effects(self):
+        """
+        :return int: Total of effects of the pedalboards in standby
+        """
+        return sum(len(pedalboard.effects) for pedalboard in self._pedalboards)
+
+    def accepts(self, pedalboard):
+        """
+        :param Pedalboard pedalboard:
+        :return bool: Is possible put the pedalboard in the pool?
+        """
+        return self.max_pedalboards > 0 \
+            and (self.max_effects is None or len(pedalboard.effects) <= self.max_effects)
+
+    def append(self, pedalboard):
+        """
+        Put the pedalboard as the most recently used
+
+        :param Pedalboard pedalboard: Pedalboard loaded in standby
+        :return list[Pedalboard]: Pedalboards evicted for respect the limits
+        """
+        self._pedalboards[pedalboard] = None
+        self._pedalboards.move_to_end(pedalboard)
+
+        return self.evict()
+
+    def evict(self):
+        """
+        Evicts the least recently used pedalboards while the limits are exceeded.
+        Use it when the pedalboards in standby change (like an effect added).
+
+        :return list[Pedalboard]: Pedalboards evicted for respect the limits
+        """
+        evicted = []
+        while len(self._pedalboards) > 1 and self._exceeded:
+            oldest, _ = self._pedalboards.popitem(last=False)
+            evicted.append(oldest)
+
+        return evicted
+
+    def remove(self, pedalboard):
+        """
+        :param Pedalboard pedalboard: Pedalboard that will be removed of the pool
+        """
+        del self._pedalboards[pedalboard]
+
+    @property
+    def _exceeded(self):
+        return len(self._pedalboards) > self.max_pedalboards \
+            or (self.max_effects is not None and self.total_effects > self.max_effects)
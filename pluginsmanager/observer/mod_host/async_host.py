@@ -0,0 +1,245 @@
+# Copyright 2017 SrMouraSilva
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import logging
+from collections import deque
+
+from pluginsmanager.observer.mod_host.protocol_parser import ProtocolParser
+
+
+class AsyncHost(object):
+    """
+    Bridge between *mod-host* API and *mod-host* process using :mod:`asyncio` streams.
+
+    It offers the same operations of :class:`.Host`, but the operations return
+    awaitables instead of blocking the caller until *mod-host* responds::
+
+        >>> host = AsyncHost('localhost')
+        >>> await host.open()
+        >>> await host.add(reverb)
+        >>> await asyncio.gather(*[host.set_param_value(param) for param in reverb.params])
+
+    Many commands can be in flight at the same time: they are queued in the
+    order that the operations are awaited, a single writer task sends them in
+    this order and the ``resp`` replies are matched in the same order. When
+    ``max_in_flight`` commands are waiting for their responses, the writer waits
+    for a free slot (backpressure) and the next commands wait in the queue.
+
+    :param string address: Computer mod-host process address (IP)
+    :param int port: Socket port on which mod-host should be running. Default is `5555`
+    :param int max_in_flight: Maximum number of commands sent and not yet responded
+    """
+
+    def __init__(self, address='localhost', port=5555, max_in_flight=64):
+        self.address = address
+        self.port = port
+        self.max_in_flight = max_in_flight
+
+        self.instance_index = 0
+
+        self._reader = None
+        self._writer = None
+        self._reader_task = None
+        self._writer_task = None
+        self._in_flight = None
+        self._commands = None
+        self._pending = deque()
+        self._error = None
+
+    async def open(self):
+        """
+        Opens the connection with *mod-host*
+        """
+        try:
+            self._reader, self._writer = await asyncio.open_connection(self.address, self.port)
+        except ConnectionRefusedError as e:
+            raise ConnectionRefusedError(str(e) + '. Do you starts mod-host?') from e
+
+        self._error = None
+        self._in_flight = asyncio.Semaphore(self.max_in_flight)
+        self._commands = asyncio.Queue()
+        self._reader_task = asyncio.ensure_future(self._read_responses())
+        self._writer_task = asyncio.ensure_future(self._write_commands())
+
+    @property
+    def connected(self):
+        """
+        :return bool: Is there an open connection with *mod-host*?
+        """
+        return self._writer is not None
+
+    async def send(self, message):
+        """
+        Sends message to *mod-host* and waits for its response.
+
+        :param string message: Message that will be sent for *mod-host*
+        :return bytes: *mod-host* response
+        """
+        future = asyncio.get_event_loop().create_future()
+
+        # The queue keeps the commands order while they wait for a free slot
+        self._commands.put_nowait((message, future))
+
+        return await future
+
+    async def _write_commands(self):
+        while True:
+            message, future = await self._commands.get()
+
+            try:
+                if future.cancelled():
+                    continue
+
+                if self._error is not None:
+                    future.set_exception(self._error)
+                    continue
+
+                await self._in_flight.acquire()
+                if self._error is not None:
+                    self._in_flight.release()
+                    future.set_exception(self._error)
+                    continue
+
+                self._pending.append(future)
+                self._writer.write(message.encode('utf-8') + b'\0')
+                await self._writer.drain()
+
+            except ConnectionError as e:
+                if not future.done():
+                    future.set_exception(e)
+
+            finally:
+                self._commands.task_done()
+
+    async def _read_responses(self):
+        error = ConnectionResetError('mod-host closed the connection')
+
+        try:
+            while True:
+                response = await self._reader.readuntil(b'\0')
+
+                future = self._pending.popleft()
+                self._in_flight.release()
+                if not future.done():
+                    future.set_result(response[:-1])
+
+        except asyncio.CancelledError:
+            error = ConnectionAbortedError('The connection with mod-host has been closed')
+
+        except (asyncio.IncompleteReadError, ConnectionError) as e:
+            logging.warning('Mod-host - Connection lost: %s', e)
+
+        finally:
+            # The commands not sent yet fail too
+            self._error = error
+
+            while self._pending:
+                future = self._pending.popleft()
+                self._in_flight.release()
+                if not future.done():
+                    future.set_exception(error)
+
+    def add(self, effect):
+        """
+        Add an LV2 plugin encapsulated as a jack client
+
+        :param Lv2Effect effect: Effect that will be loaded as LV2 plugin encapsulated
+        :return: awaitable with the *mod-host* response
+        """
+        effect.instance = self.instance_index
+        self.instance_index += 1
+
+        return self.send(ProtocolParser.add(effect))
+
+    def remove(self, effect):
+        """
+        Remove an LV2 plugin instance (and also the jack client)
+
+        :param Lv2Effect effect: Effect that your jack client encapsulated will removed
+        :return: awaitable with the *mod-host* response
+        """
+        return self.send(ProtocolParser.remove(effect))
+
+    def connect(self, connection):
+        """
+        Connect two effect audio ports
+
+        :param pluginsmanager.model.connection.Connection connection: Connection with the two effect audio ports (output and input)
+        :return: awaitable with the *mod-host* response
+        """
+        return self.send(ProtocolParser.connect(connection))
+
+    def disconnect(self, connection):
+        """
+        Disconnect two effect audio ports
+
+        :param pluginsmanager.model.connection.Connection connection: Connection with the two effect audio ports (output and input)
+        :return: awaitable with the *mod-host* response
+        """
+        return self.send(ProtocolParser.disconnect(connection))
+
+    def set_param_value(self, param):
+        """
+        Set a value to given control
+
+        :param Lv2Param param: Param that the value will be updated
+        :return: awaitable with the *mod-host* response
+        """
+        return self.send(ProtocolParser.param_set(param))
+
+    def set_status(self, effect, active=None):
+        """
+        Toggle effect processing
+
+        :param Lv2Effect effect: Effect with the status updated
+        :param bool active: Status that will be applied. If ``None``, uses ``effect.active``
+        :return: awaitable with the *mod-host* response
+        """
+        return self.send(ProtocolParser.bypass(effect, active))
+
+    async def quit(self):
+        """
+        Quit the connection with mod-host and
+        stop the mod-host process
+        """
+        try:
+            await self.send(ProtocolParser.quit())
+        except ConnectionError:
+            # mod-host can be finished before responds
+            pass
+
+        await self.close()
+
+    async def close(self):
+        """
+        Waits the responses of the commands in flight and
+        quit the connection with mod-host
+        """
+        if not self.connected:
+            return
+
+        await self._commands.join()
+        if self._pending:
+            await asyncio.wait(list(self._pending))
+
+        self._writer.close()
+        self._writer = None
+
+        for task in (self._writer_task, self._reader_task):
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
@@ -0,0 +1,130 @@
+# Copyright 2017 SrMouraSilva
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import logging
+import threading
+
+from pluginsmanager.observer.host_observer.host_observer import HostObserver
+from pluginsmanager.observer.mod_host.async_host import AsyncHost
+from pluginsmanager.observer.mod_host.mod_host import ModHostError
+
+
+class AsyncModHost(HostObserver):
+    """
+    **Python port for mod-host** for :mod:`asyncio` applications.
+
+    It works like :class:`.ModHost`, but the commands are sent by an :class:`.AsyncHost`,
+    so the changes in the current pedalboard never block the event loop::
+
+        >>> mod_host = AsyncModHost('localhost')
+        >>> await mod_host.connect()
+        >>> banks_manager.register(mod_host)
+
+        >>> mod_host.pedalboard = my_awesome_pedalboard
+        >>> # Optionally, waits until mod-host applies all the changes
+        >>> await mod_host.drain()
+
+    The notifications can be made in the event loop thread or in any other thread:
+    the commands are always sent by the event loop informed in
+    :meth:`~pluginsmanager.observer.mod_host.async_mod_host.AsyncModHost.connect()`,
+    in the same order that the changes occurred.
+
+    :param string address: Computer mod-host process address (IP)
+    :param int port: Socket port on which mod-host should be running. Default is `5555`
+    :param int max_in_flight: Maximum number of commands sent and not yet responded by mod-host
+    """
+
+    def __init__(self, address='localhost', port=5555, max_in_flight=64):
+        super(AsyncModHost, self).__init__()
+        self.address = address
+        self.port = port
+
+        self.host = AsyncHost(address, port, max_in_flight)
+
+        self._loop = None
+        self._loop_thread = None
+        self._futures = set()
+        self._closed = False
+
+    async def connect(self):
+        """
+        Connect the object with mod-host with the _address_ parameter informed in
+        the constructor method. The current event loop will be used to send the commands.
+        """
+        await self.host.open()
+
+        self._loop = asyncio.get_event_loop()
+        self._loop_thread = threading.get_ident()
+
+    async def drain(self):
+        """
+        Waits until mod-host responds all the commands generated by the changes
+        """
+        while self._futures:
+            await asyncio.wait([asyncio.wrap_future(future) for future in list(self._futures)])
+
+    def close(self):
+        """
+        Remove the audio plugins loaded and closes connection with mod-host.
+        """
+        if self._loop is None:
+            raise ModHostError('There is no established connection with mod-host. '
+                               'Did you call the `connect()` method?')
+
+        if self._closed:
+            return
+
+        super(AsyncModHost, self).close()
+        self._schedule(self.host.close())
+        self._closed = True
+
+    def _schedule(self, awaitable):
+        if threading.get_ident() == self._loop_thread:
+            future = asyncio.ensure_future(awaitable, loop=self._loop)
+        else:
+            future = asyncio.run_coroutine_threadsafe(awaitable, self._loop)
+
+        self._futures.add(future)
+        future.add_done_callback(self._command_done)
+
+    def _command_done(self, future):
+        self._futures.discard(future)
+
+        if not future.cancelled() and future.exception() is not None:
+            logging.error('Mod-host - Command failed: %s', future.exception())
+
+    ####################################
+    # Observer
+    ####################################
+    def _set_param_value(self, param):
+        self._schedule(self.host.set_param_value(param))
+
+    def _remove_effect(self, effect):
+        self._schedule(self.host.remove(effect))
+
+    def _connect(self, connection):
+        self._schedule(self.host.connect(connection))
+
+    def _disconnect(self, connection):
+        self._schedule(self.host.disconnect(connection))
+
+    def _add_effect(self, effect):
+        self._schedule(self.host.add(effect))
+
+    def _set_effect_status(self, effect):
+        self._schedule(self.host.set_status(effect))
+
+    def _bypass_effect(self, effect):
+        self._schedule(self.host.set_status(effect, active=False))
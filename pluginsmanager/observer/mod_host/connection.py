@@ -12,12 +12,17 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import logging
 import socket
 
 
 class Connection(object):
     """
     Class responsible for managing an API connection to the mod-host process via socket
+
+    Messages are delimited by a null character (``\\0``), so many commands
+    can be written at once (see :meth:`~pluginsmanager.observer.mod_host.connection.Connection.send_batch()`)
+    and the *mod-host* ``resp`` replies are matched in the same order.
     """
     client = None
 
@@ -26,6 +31,8 @@ class Connection(object):
         self.client.connect((address, socket_port))
         self.client.settimeout(5)
 
+        self._buffer = b''
+
     def send(self, message):
         """
         Sends message to *mod-host*.
@@ -36,12 +43,41 @@ class Connection(object):
             As example, view :class:`.Host`
 
         :param string message: Message that will be sent for *mod-host*
+        :return bytes: *mod-host* response
+        """
+        return self.send_batch([message])[0]
+
+    def send_batch(self, messages):
         """
-        print(message.encode('utf-8'))
-        self.client.send(message.encode('utf-8'))
-        received = self.client.recv(1024)
+        Sends many messages to *mod-host* with only one write and
+        waits the responses of all of them (pipelining).
+
+        :param list[string] messages: Messages that will be sent for *mod-host*
+        :return list[bytes]: *mod-host* responses, in the same order of ``messages``
+        """
+        if not messages:
+            return []
+
+        logging.debug('Mod-host - Sending %d message(s): %s', len(messages), messages)
+
+        data = b''.join(message.encode('utf-8') + b'\0' for message in messages)
+        self.client.sendall(data)
+
+        return [self._receive() for _ in messages]
+
+    def _receive(self):
+        """
+        :return bytes: Next response (without the delimiter) sent by *mod-host*
+        """
+        while b'\0' not in self._buffer:
+            received = self.client.recv(1024)
+            if not received:
+                raise ConnectionResetError('mod-host closed the connection')
+
+            self._buffer += received
 
-        return received
+        response, self._buffer = self._buffer.split(b'\0', 1)
+        return response
 
     def close(self):
         """
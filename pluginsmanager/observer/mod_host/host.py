@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import logging
+from contextlib import contextmanager
 
 from pluginsmanager.observer.mod_host.connection import Connection
 from pluginsmanager.observer.mod_host.protocol_parser import ProtocolParser
@@ -21,6 +22,15 @@ from pluginsmanager.observer.mod_host.protocol_parser import ProtocolParser
 class Host:
     """
     Bridge between *mod-host* API and *mod-host* process
+
+    Commands can be grouped in a batch. In a batch, the commands are queued
+    and are sent to *mod-host* with only one socket write, reducing
+    the round trips when many changes are applied (like a pedalboard change)::
+
+        >>> with host.batch():
+        ...     host.add(reverb)
+        ...     host.set_param_value(reverb.params[0])
+        ...     host.connect(connection)
     """
 
     def __init__(self, address='localhost', port=5555):
@@ -43,6 +53,40 @@ class Host:
 
         self.instance_index = 0
 
+        self._batch_level = 0
+        self._queue = []
+
+    @contextmanager
+    def batch(self):
+        """
+        Groups the commands sent inside the ``with`` block. They are
+        sent together (pipelined) when the outermost block finishes.
+
+        Nested batches are sent with the outermost block.
+        """
+        self._batch_level += 1
+        try:
+            yield self
+        finally:
+            self._batch_level -= 1
+            if self._batch_level == 0:
+                self.flush()
+
+    def flush(self):
+        """
+        Sends all queued commands to *mod-host*
+
+        :return list[bytes]: *mod-host* responses, in the same order of the commands
+        """
+        messages, self._queue = self._queue, []
+        return self.connection.send_batch(messages)
+
+    def _send(self, message):
+        if self._batch_level > 0:
+            self._queue.append(message)
+        else:
+            self.connection.send(message)
+
     def add(self, effect):
         """
         Add an LV2 plugin encapsulated as a jack client
@@ -52,7 +96,7 @@ class Host:
         effect.instance = self.instance_index
         self.instance_index += 1
 
-        self.connection.send(ProtocolParser.add(effect))
+        self._send(ProtocolParser.add(effect))
 
     def remove(self, effect):
         """
@@ -60,7 +104,7 @@ class Host:
 
         :param Lv2Effect effect: Effect that your jack client encapsulated will removed
         """
-        self.connection.send(ProtocolParser.remove(effect))
+        self._send(ProtocolParser.remove(effect))
 
     def connect(self, connection):
         """
@@ -68,7 +112,7 @@ class Host:
 
         :param pluginsmanager.model.connection.Connection connection: Connection with the two effect audio ports (output and input)
         """
-        self.connection.send(ProtocolParser.connect(connection))
+        self._send(ProtocolParser.connect(connection))
 
     def disconnect(self, connection):
         """
@@ -76,7 +120,7 @@ class Host:
 
         :param pluginsmanager.model.connection.Connection connection: Connection with the two effect audio ports (output and input)
         """
-        self.connection.send(ProtocolParser.disconnect(connection))
+        self._send(ProtocolParser.disconnect(connection))
 
     def set_param_value(self, param):
         """
@@ -84,22 +128,30 @@ class Host:
 
         :param Lv2Param param: Param that the value will be updated
         """
-        self.connection.send(ProtocolParser.param_set(param))
+        self._send(ProtocolParser.param_set(param))
 
-    def set_status(self, effect):
+    def set_status(self, effect, active=None):
         """
         Toggle effect processing
 
         :param Lv2Effect effect: Effect with the status updated
+        :param bool active: Status that will be applied. If ``None``, uses ``effect.active``
         """
-        self.connection.send(ProtocolParser.bypass(effect))
+        self._send(ProtocolParser.bypass(effect, active))
 
     def quit(self):
         """
         Quit the connection with mod-host and
         stop the mod-host process
         """
-        self.connection.send(ProtocolParser.quit())
+        self.flush()
+
+        try:
+            self.connection.send(ProtocolParser.quit())
+        except ConnectionError:
+            # mod-host can be finished before responds
+            pass
+
         self.close()
 
     def close(self):
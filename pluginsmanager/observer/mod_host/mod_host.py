@@ -16,7 +16,6 @@ import subprocess
 
 from pluginsmanager.observer.host_observer.host_observer import HostObserver
 from pluginsmanager.observer.mod_host.host import Host
-from pluginsmanager.util.pairs_list import PairsList
 
 
 class ModHostError(Exception):
@@ -91,8 +90,6 @@ class ModHost(HostObserver):
         self.host = None
         self._pedalboard = None
 
-        self.pairs_list = PairsList(lambda effect: effect.plugin['uri'])
-
         self._started_with_this_api = False
 
     def start(self):
@@ -169,6 +166,12 @@ class ModHost(HostObserver):
     ####################################
     # Observer
     ####################################
+    def _batch(self):
+        if self.host is None:
+            return super(ModHost, self)._batch()
+
+        return self.host.batch()
+
     def _set_param_value(self, param):
         self.host.set_param_value(param)
 
@@ -186,3 +189,6 @@ class ModHost(HostObserver):
 
     def _set_effect_status(self, effect):
         self.host.set_status(effect)
+
+    def _bypass_effect(self, effect):
+        self.host.set_status(effect, active=False)
@@ -290,7 +290,7 @@ class ProtocolParser:
         pass
 
     @staticmethod
-    def bypass(effect):
+    def bypass(effect, active=None):
         """
         ``bypass <instance_number> <bypass_value>``
 
@@ -305,10 +305,14 @@ class ProtocolParser:
 
         :param Lv2Effect effect: Effect that will be active the bypass
                or disable the bypass
+        :param bool active: Status that will be applied. If ``None``, uses ``effect.active``
         """
+        if active is None:
+            active = effect.active
+
         return 'bypass {} {}'.format(
             effect.instance,
-            1 if effect.active else 0
+            1 if active else 0
         )
 
     @staticmethod
@@ -0,0 +1,64 @@
+# Copyright 2017 SrMouraSilva
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from pluginsmanager.observer.updates_observer import UpdatesObserver
+
+
+class NullObserver(UpdatesObserver):
+    """
+    Observer that ignores all changes.
+
+    It's the observer of the model objects (:class:`.Bank`, :class:`.Pedalboard`,
+    :class:`.Effect`, :class:`.Param` and :class:`.Port`) that don't belong to
+    a :class:`.BanksManager`. It's a singleton::
+
+        >>> NullObserver() is NullObserver()
+        True
+    """
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(NullObserver, cls).__new__(cls)
+            cls._instance.manager = None
+
+        return cls._instance
+
+    def __init__(self):
+        pass
+
+    def on_bank_updated(self, bank, update_type, index, origin, **kwargs):
+        pass
+
+    def on_pedalboard_updated(self, pedalboard, update_type, index, origin, **kwargs):
+        pass
+
+    def on_effect_updated(self, effect, update_type, index, origin, **kwargs):
+        pass
+
+    def on_effect_status_toggled(self, effect, **kwargs):
+        pass
+
+    def on_param_value_changed(self, param, **kwargs):
+        pass
+
+    def on_connection_updated(self, connection, update_type, pedalboard, **kwargs):
+        pass
+
+    def on_custom_change(self, identifier, *args, **kwargs):
+        pass
+
+    def on_batch(self, changes):
+        pass
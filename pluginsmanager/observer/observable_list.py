@@ -22,24 +22,45 @@ class ObservableList(object):
     In append, in remove and in setter, the `observer` is callable with changes
     details
 
+    The items positions are cached, then :meth:`index` doesn't search
+    the item in the list while the list isn't changed. The cache is discarded
+    when :attr:`real_list` is accessed, because it can be changed directly.
+
     Based in https://www.pythonsheets.com/notes/python-basic.html#emulating-a-list
     """
 
     def __init__(self, lista=None):
-        self.real_list = lista if lista is not None else []
+        self._real_list = lista if lista is not None else []
         self.observer = lambda *args, **kwargs: ...
 
+        # id(item) -> first item position
+        self._positions = None
+
+    @property
+    def real_list(self):
+        """
+        :return list: The list. Changes made directly in it aren't notified
+        """
+        # The list can be changed by the caller: the positions cache is discarded
+        self._positions = None
+        return self._real_list
+
+    @real_list.setter
+    def real_list(self, real_list):
+        self._real_list = real_list
+        self._positions = None
+
     def __str__(self):
         """
         See :meth:`list.__repr__()` method
         """
-        return repr(self.real_list)
+        return repr(self._real_list)
 
     def __repr__(self):
         """
         See :meth:`list.__repr__()` method
         """
-        return repr(self.real_list)
+        return repr(self._real_list)
 
     def append(self, item):
         """
@@ -48,8 +69,11 @@ class ObservableList(object):
         Calls observer ``self.observer(UpdateType.CREATED, item, index)`` where
         **index** is *item position*
         """
-        self.real_list.append(item)
-        self.observer(UpdateType.CREATED, item, len(self.real_list) - 1)
+        self._real_list.append(item)
+        if self._positions is not None:
+            self._positions.setdefault(id(item), len(self._real_list) - 1)
+
+        self.observer(UpdateType.CREATED, item, len(self._real_list) - 1)
 
     def remove(self, item):
         """
@@ -59,14 +83,29 @@ class ObservableList(object):
         **index** is *item position*
         """
         index = self.index(item)
-        self.real_list.remove(item)
+        self._real_list.remove(item)
+        self._positions = None
         self.observer(UpdateType.DELETED, item, index)
 
     def index(self, x):
         """
         See :meth:`list.index()` method
+
+        The position is obtained from a cache, rebuilt after the list changes
         """
-        return self.real_list.index(x)
+        position = self._position(x)
+        if position is None:
+            return self._real_list.index(x)
+
+        return position
+
+    def _position(self, x):
+        if self._positions is None:
+            self._positions = {}
+            for position, item in enumerate(self._real_list):
+                self._positions.setdefault(id(item), position)
+
+        return self._positions.get(id(x))
 
     def insert(self, index, x):
         """
@@ -74,7 +113,8 @@ class ObservableList(object):
 
         Calls observer ``self.observer(UpdateType.CREATED, item, index)``
         """
-        self.real_list.insert(index, x)
+        self._real_list.insert(index, x)
+        self._positions = None
         self.observer(UpdateType.CREATED, x, index)
 
     def pop(self, index=None):
@@ -89,7 +129,7 @@ class ObservableList(object):
         :return: item removed
         """
         if index is None:
-            index = len(self.real_list) - 1
+            index = len(self._real_list) - 1
 
         item = self[index]
         del self[index]
@@ -100,13 +140,13 @@ class ObservableList(object):
         """
         See :meth:`list.__len__()` method
         """
-        return len(self.real_list)
+        return len(self._real_list)
 
     def __getitem__(self, index):
         """
         See :meth:`list.__getitem__()` method
         """
-        return self.real_list[index]
+        return self._real_list[index]
 
     def __setitem__(self, index, val):
         """
@@ -118,8 +158,9 @@ class ObservableList(object):
         if val == self[index]:
             return
 
-        old = self.real_list[index]
-        self.real_list[index] = val
+        old = self._real_list[index]
+        self._real_list[index] = val
+        self._positions = None
 
         self.observer(UpdateType.UPDATED, val, index, old=old)
 
@@ -130,21 +171,22 @@ class ObservableList(object):
         Calls observer ``self.observer(UpdateType.DELETED, item, index)``
         where **item** is `self[index]`
         """
-        item = self.real_list[sliced]
-        del self.real_list[sliced]
+        item = self._real_list[sliced]
+        del self._real_list[sliced]
+        self._positions = None
         self.observer(UpdateType.DELETED, item, sliced)
 
     def __contains__(self, item):
         """
         See :meth:`list.__contains__()` method
         """
-        return item in self.real_list
+        return item in self._real_list
 
     def __iter__(self):
         """
         See :meth:`list.__iter__()` method
         """
-        return iter(self.real_list)
+        return iter(self._real_list)
 
     def move(self, item, new_position):
         """
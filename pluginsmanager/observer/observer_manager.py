@@ -12,16 +12,64 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+
+from pluginsmanager.observer.change import Change
+from pluginsmanager.observer.queued_dispatcher import QueuedDispatcher
 from pluginsmanager.observer.scope import ManagerScopes
 from pluginsmanager.observer.updates_observer import UpdatesObserver
 
 
 class ObserverManager(UpdatesObserver):
-    def __init__(self):
+    """
+    Notifies the registered observers about the changes.
+
+    Controllers like expression pedals generates many param changes per second.
+    If ``param_flush_interval`` is informed, the param changes are coalesced:
+    only the last value of each param (by effect and symbol) is notified, at most once
+    per ``param_flush_interval`` seconds. Any other change notifies the pending
+    param changes before, so the observers receives the changes in the order.
+
+    Inside a :meth:`batch`, the changes are buffered and delivered together
+    for each observer by :meth:`.UpdatesObserver.on_batch` when the batch finishes.
+
+    Observers appended with ``asynchronous`` are notified in a worker thread
+    (see :class:`.QueuedDispatcher`). The synchronous observers are notified first,
+    by descending ``priority``, so a slow observer doesn't delay the host::
+
+        >>> manager.append(mod_host, priority=10)
+        >>> manager.append(autosaver, asynchronous=True)
+
+    An observer can be notified only about some events and only about
+    the changes of a bank or pedalboard (see :class:`.Subscription`). The observers
+    of each event are precomputed, so the other observers don't cost the notification::
+
+        >>> manager.append(leds, subscription=Subscription(['on_effect_status_toggled']))
+
+    :param float param_flush_interval: Seconds between the notifications of the param changes.
+                                       ``None`` (default) notifies them immediately
+    """
+
+    def __init__(self, param_flush_interval=None):
         super(ObserverManager, self).__init__()
         self.observers = []
         self._scope = ManagerScopes()
 
+        self.param_flush_interval = param_flush_interval
+        self._pending_params = OrderedDict()
+        self._timer = None
+        self._lock = threading.RLock()
+
+        self._batch_level = 0
+        self._batch_changes = []
+
+        self._priorities = {}
+        self._dispatchers = {}
+        self._subscriptions = {}
+        self._subscribers_cache = {}
+
     def enter_scope(self, observer):
         """
         Open a observer scope.
@@ -43,40 +91,221 @@ class ObserverManager(UpdatesObserver):
     def scope(self):
         return self._scope.current.identifier
 
-    def append(self, observer):
+    def append(self, observer, asynchronous=False, priority=0, max_queue_size=1000, subscription=None):
+        """
+        :param UpdatesObserver observer: Observer that will be notified
+        :param bool asynchronous: Notifies the observer in a worker thread?
+        :param int priority: Synchronous observers with greater priority are notified first
+        :param int max_queue_size: Asynchronous observer: maximum of changes enqueued
+        :param Subscription subscription: Changes that the observer is interested.
+                                          ``None`` for all changes
+        """
         self.observers.append(observer)
+        self._subscribers_cache = {}
+
+        if subscription is not None:
+            self._subscriptions[observer] = subscription
+        if priority != 0:
+            self._priorities[observer] = priority
+        if asynchronous:
+            self._dispatchers[observer] = QueuedDispatcher(observer, max_queue_size)
+
+    def remove(self, observer):
+        """
+        Removes the observer. If it's asynchronous, waits for the notification
+        of the changes enqueued
+
+        :param UpdatesObserver observer: Observer that will not be notified anymore
+        """
+        self.observers.remove(observer)
+        self._subscribers_cache = {}
+        self._priorities.pop(observer, None)
+        self._subscriptions.pop(observer, None)
+
+        dispatcher = self._dispatchers.pop(observer, None)
+        if dispatcher is not None:
+            dispatcher.close()
+
+    def join(self):
+        """
+        Waits until the asynchronous observers are notified about all changes occurred
+        """
+        for dispatcher in list(self._dispatchers.values()):
+            dispatcher.join()
+
+    def close(self):
+        """
+        Waits for the notification of the changes enqueued and
+        stops the asynchronous observers threads
+        """
+        self.flush()
+
+        dispatchers = self._dispatchers
+        self._dispatchers = {}
+
+        for dispatcher in dispatchers.values():
+            dispatcher.close()
+
+    @property
+    def _notification_order(self):
+        if not self._priorities and not self._dispatchers:
+            return self.observers
+
+        return sorted(
+            self.observers,
+            key=lambda observer: (observer in self._dispatchers, -self._priorities.get(observer, 0))
+        )
+
+    def _subscribers(self, event):
+        """
+        :return list[UpdatesObserver]: Observers subscribed to the event, in the notification order
+        """
+        subscribers = self._subscribers_cache.get(event)
+
+        if subscribers is None:
+            subscribers = [
+                observer for observer in self._notification_order
+                if observer not in self._subscriptions or self._subscriptions[observer].subscribed(event)
+            ]
+            self._subscribers_cache[event] = subscribers
+
+        return subscribers
+
+    def _accepts(self, observer, change, scope):
+        if observer == scope:
+            return False
+
+        subscription = self._subscriptions.get(observer)
+        return subscription is None or subscription.accepts(change)
+
+    def _dispatch(self, scope, method, *args, **kwargs):
+        change = None
+
+        for observer in self._subscribers(method):
+            if observer == scope:
+                continue
+
+            subscription = self._subscriptions.get(observer)
+            if subscription is not None and subscription.filtered:
+                if change is None:
+                    change = Change(method, args, kwargs)
+                if not subscription.accepts(change):
+                    continue
+
+            self._deliver(observer, method, *args, **kwargs)
+
+    def _deliver(self, observer, method, *args, **kwargs):
+        dispatcher = self._dispatchers.get(observer)
+
+        if dispatcher is None:
+            getattr(observer, method)(*args, **kwargs)
+        else:
+            dispatcher.put(Change(method, args, kwargs))
+
+    def flush(self):
+        """
+        Notifies immediately the pending param changes
+        """
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+            pending = self._pending_params
+            self._pending_params = OrderedDict()
+
+            for param, scope, kwargs in pending.values():
+                self._notify_param_value_changed(param, scope, **kwargs)
+
+    @contextmanager
+    def batch(self):
+        """
+        Buffers the changes notified inside the ``with`` block. When the outermost
+        batch finishes, each observer receives its changes by :meth:`.UpdatesObserver.on_batch`.
+
+        Only the last change of each param value is delivered.
+        """
+        with self._lock:
+            self._batch_level += 1
+
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._batch_level -= 1
+                if self._batch_level == 0:
+                    self._notify_batch()
+
+    def _notify_batch(self):
+        changes = self._coalesce_params(self._batch_changes)
+        self._batch_changes = []
+
+        for observer in self._notification_order:
+            observer_changes = [change for change, scope in changes if self._accepts(observer, change, scope)]
+            if observer_changes:
+                self._deliver(observer, 'on_batch', observer_changes)
+
+    @staticmethod
+    def _coalesce_params(changes):
+        last = {}
+        for position, (change, scope) in enumerate(changes):
+            if change.method == 'on_param_value_changed':
+                param = change.args[0]
+                last[(param.effect, param.symbol)] = position
+
+        positions = set(last.values())
+
+        return [
+            (change, scope) for position, (change, scope) in enumerate(changes)
+            if change.method != 'on_param_value_changed' or position in positions
+        ]
+
+    @contextmanager
+    def _notifying(self):
+        with self._lock:
+            if self._pending_params:
+                self.flush()
+            yield
+
+    def _notify(self, method, *args, **kwargs):
+        with self._notifying():
+            if self._batch_level > 0:
+                self._batch_changes.append((Change(method, args, kwargs), self.scope))
+                return
+
+            self._dispatch(self.scope, method, *args, **kwargs)
 
     def on_bank_updated(self, bank, update_type, index, origin, **kwargs):
-        for observer in self.observers:
-            if observer != self.scope:
-                observer.on_bank_updated(bank, update_type, index=index, origin=origin, **kwargs)
+        self._notify('on_bank_updated', bank, update_type, index=index, origin=origin, **kwargs)
 
     def on_pedalboard_updated(self, pedalboard, update_type, index, origin, **kwargs):
-        for observer in self.observers:
-            if observer != self.scope:
-                observer.on_pedalboard_updated(pedalboard, update_type, index=index, origin=origin, **kwargs)
+        self._notify('on_pedalboard_updated', pedalboard, update_type, index=index, origin=origin, **kwargs)
 
     def on_effect_updated(self, effect, update_type, index, origin, **kwargs):
-        for observer in self.observers:
-            if observer != self.scope:
-                observer.on_effect_updated(effect, update_type, index=index, origin=origin, **kwargs)
+        self._notify('on_effect_updated', effect, update_type, index=index, origin=origin, **kwargs)
 
     def on_effect_status_toggled(self, effect, **kwargs):
-        for observer in self.observers:
-            if observer != self.scope:
-                observer.on_effect_status_toggled(effect, **kwargs)
+        self._notify('on_effect_status_toggled', effect, **kwargs)
 
     def on_param_value_changed(self, param, **kwargs):
-        for observer in self.observers:
-            if observer != self.scope:
-                observer.on_param_value_changed(param, **kwargs)
+        if self.param_flush_interval is None or self._batch_level > 0:
+            self._notify('on_param_value_changed', param, **kwargs)
+            return
+
+        with self._lock:
+            key = (param.effect, param.symbol)
+            self._pending_params[key] = (param, self.scope, kwargs)
+
+            if self._timer is None:
+                self._timer = threading.Timer(self.param_flush_interval, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def _notify_param_value_changed(self, param, scope, **kwargs):
+        self._dispatch(scope, 'on_param_value_changed', param, **kwargs)
 
     def on_connection_updated(self, connection, update_type, pedalboard, **kwargs):
-        for observer in self.observers:
-            if observer != self.scope:
-                observer.on_connection_updated(connection, update_type, pedalboard=pedalboard, **kwargs)
+        self._notify('on_connection_updated', connection, update_type, pedalboard=pedalboard, **kwargs)
 
     def on_custom_change(self, identifier, *args, **kwargs):
-        for observer in self.observers:
-            if observer != self.scope:
-                observer.on_custom_change(identifier, *args, **kwargs)
+        self._notify('on_custom_change', identifier, *args, **kwargs)
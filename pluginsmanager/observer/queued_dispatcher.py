@@ -0,0 +1,87 @@
+# Copyright 2017 SrMouraSilva
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+import threading
+from queue import Queue
+
+
+class QueuedDispatcher(object):
+    """
+    Notifies the changes for an observer in a worker thread.
+
+    The changes are enqueued (see :class:`.Change`) in a bounded queue and
+    notified in the same order that they occurred. When the queue is full,
+    the notifier waits (so the memory usage is limited).
+
+    It's used by :class:`.ObserverManager` for the observers registered
+    with ``asynchronous=True``, so slow observers (like disk or network based)
+    doesn't delay the other observers.
+
+    .. note::
+
+        The model objects are shared with the caller thread. The observer
+        receives the objects and not a copy of them at the change time.
+
+    :param UpdatesObserver observer: Observer that will be notified
+    :param int max_size: Maximum of changes enqueued
+    """
+
+    _STOP = object()
+
+    def __init__(self, observer, max_size=1000):
+        self.observer = observer
+        self.queue = Queue(max_size)
+
+        self._thread = threading.Thread(target=self._run, name='QueuedDispatcher-{}'.format(observer))
+        self._thread.daemon = True
+        self._thread.start()
+
+    def put(self, change):
+        """
+        Enqueues a change. Blocks while the queue is full
+
+        :param Change change: Change that will be notified
+        """
+        self.queue.put(change)
+
+    def join(self):
+        """
+        Waits until all changes enqueued are notified
+        """
+        self.queue.join()
+
+    def close(self):
+        """
+        Notifies the changes enqueued and stops the worker thread
+        """
+        self.queue.put(QueuedDispatcher._STOP)
+        if self._thread is not threading.current_thread():
+            self._thread.join()
+
+    def _run(self):
+        while True:
+            change = self.queue.get()
+
+            try:
+                if change is QueuedDispatcher._STOP:
+                    return
+
+                change.notify(self.observer)
+
+            except Exception:
+                logging.exception('Error notifying {} to {}'.format(change.method, self.observer))
+
+            finally:
+                self.queue.task_done()
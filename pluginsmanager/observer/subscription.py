@@ -0,0 +1,111 @@
+# Copyright 2017 SrMouraSilva
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+class Subscription(object):
+    """
+    Restricts the changes notified for an observer (see :meth:`.BanksManager.register`)::
+
+        >>> # Only the effects status changes of the pedalboard
+        >>> Subscription(events=['on_effect_status_toggled'], pedalboard=pedalboard)
+
+    :param list[string] events: :class:`.UpdatesObserver` methods (see :attr:`EVENTS`)
+                                that the observer is interested. ``None`` for all
+    :param Bank bank: Only the changes of this bank (and of its pedalboards)
+    :param Pedalboard pedalboard: Only the changes of this pedalboard (its effects, params and connections)
+    :raise ValueError: If an event is unknown
+    """
+
+    EVENTS = (
+        'on_bank_updated',
+        'on_pedalboard_updated',
+        'on_effect_updated',
+        'on_effect_status_toggled',
+        'on_param_value_changed',
+        'on_connection_updated',
+        'on_custom_change',
+    )
+    """Events that can be subscribed"""
+
+    def __init__(self, events=None, bank=None, pedalboard=None):
+        if events is not None:
+            events = frozenset(events)
+            unknown = events - set(Subscription.EVENTS)
+            if unknown:
+                raise ValueError('Unknown events: {}'.format(', '.join(sorted(unknown))))
+
+        self.events = events
+        self.bank = bank
+        self.pedalboard = pedalboard
+
+    @property
+    def filtered(self):
+        """
+        :return bool: Are the changes filtered by bank or pedalboard?
+        """
+        return self.bank is not None or self.pedalboard is not None
+
+    def subscribed(self, event):
+        """
+        :param string event: :class:`.UpdatesObserver` method
+        :return bool: Is the event type subscribed?
+        """
+        return self.events is None or event in self.events
+
+    def accepts(self, change):
+        """
+        :param Change change: Change
+        :return bool: Does the change should be notified?
+        """
+        if not self.subscribed(change.method):
+            return False
+
+        if not self.filtered:
+            return True
+
+        bank, pedalboard = self.context(change)
+
+        if self.pedalboard is not None and pedalboard is not self.pedalboard:
+            return False
+
+        return self.bank is None or bank is self.bank
+
+    @staticmethod
+    def context(change):
+        """
+        :param Change change: Change
+        :return tuple(Bank, Pedalboard): Bank and pedalboard that the change occurs
+        """
+        method, args, kwargs = change
+
+        if method == 'on_bank_updated':
+            return args[0], None
+
+        if method == 'on_pedalboard_updated':
+            return kwargs.get('origin'), args[0]
+
+        if method == 'on_effect_updated':
+            pedalboard = kwargs.get('origin')
+        elif method == 'on_effect_status_toggled':
+            pedalboard = args[0].pedalboard
+        elif method == 'on_param_value_changed':
+            pedalboard = args[0].effect.pedalboard
+        elif method == 'on_connection_updated':
+            pedalboard = kwargs.get('pedalboard')
+        else:
+            pedalboard = kwargs.get('pedalboard')
+            if pedalboard is None:
+                return kwargs.get('bank'), None
+
+        return (pedalboard.bank if pedalboard is not None else None), pedalboard
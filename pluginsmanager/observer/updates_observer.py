@@ -106,6 +106,19 @@ class UpdatesObserver(metaclass=ABCMeta):
         """
         pass
 
+    def on_batch(self, changes):
+        """
+        Called when a batch finishes (see :meth:`.BanksManager.batch`) with all the changes
+        occurred inside it, in order.
+
+        The default implementation notifies each change by its method.
+        Observers can override it for treat the changes together (like save or send them once).
+
+        :param list[Change] changes: Changes occurred in the batch
+        """
+        for change in changes:
+            change.notify(self)
+
     def on_custom_change(self, identifier, *args, **kwargs):
         """
         Called in specific changes that do not fit the other methods. See :class:`.CustomChange` for more details.
@@ -22,25 +22,54 @@ class DictTuple(tuple):
 
     Based in http://jfine-python-classes.readthedocs.io/en/latest/subclass-tuple.html
 
+    Many dict tuples with the same keys can share a precomputed ``index``
+    (key -> element position) instead of compute it by the ``key_function``::
+
+        >>> index = {'a': 0, 'b': 1}
+        >>> DictTuple(['A', 'B'], index=index)['b']
+        'B'
+
     :param iterable elements: Elements for the tuple
     :param lambda key_function: Function mapper: it obtains an element and
                                 returns your key.
+    :param dict index: Key -> element position. If informed, ``key_function`` isn't used
     """
 
-    def __new__(cls, elements, key_function):
+    def __new__(cls, elements, key_function=None, index=None):
         return tuple.__new__(DictTuple, tuple(elements))
 
-    def __init__(self, elements, key_function):
-        self._dict = dict(
-            (key_function(element), element) for element in elements
-        )
+    def __init__(self, elements, key_function=None, index=None):
+        if index is None:
+            index = dict(
+                (key_function(element), position) for position, element in enumerate(self)
+            )
+
+        self._index = index
+        # id(element) -> first element position
+        self._positions = None
 
     def __getitem__(self, index):
-        if isinstance(index, int):
+        if isinstance(index, (int, slice)):
             return super(DictTuple, self).__getitem__(index)
 
         else:
-            return self._dict[index]
+            return super(DictTuple, self).__getitem__(self._index[index])
 
     def __contains__(self, item):
-        return item in self._dict
+        return item in self._index
+
+    def index(self, element, *args):
+        """
+        See :meth:`tuple.index()` method. The positions are computed once,
+        in the first call.
+        """
+        if self._positions is None:
+            self._positions = {}
+            for position, item in enumerate(self):
+                self._positions.setdefault(id(item), position)
+
+        position = self._positions.get(id(element))
+        if position is None or args:
+            return super(DictTuple, self).index(element, *args)
+
+        return position
@@ -15,6 +15,7 @@
 import sys
 from pathlib import Path
 
+from pluginsmanager.model.lv2.lv2_effect_builder_registry import Lv2EffectBuilderRegistry
 from pluginsmanager.model.pedalboard import Pedalboard
 from pluginsmanager.model.system.system_effect import SystemEffect
 
@@ -55,6 +56,10 @@ class ModPedalboardConverter(object):
     >>> pedalboard_info = converter.get_pedalboard_info(pedalboard_path)
     >>> system_effect = converter.discover_system_effect(pedalboard_info)
 
+    If the ``builder`` isn't informed, the builder shared by the ``registry`` is used::
+
+        >>> converter = ModPedalboardConverter(path)
+
     .. [#] `MOD`_, an awesome music enterprise, create the `mod-ui`_, a visual interface
            that enable create pedalboards in a simple way.
     .. [#] See the docs: https://github.com/moddevices/mod-ui#install
@@ -65,13 +70,30 @@ class ModPedalboardConverter(object):
     :param Path mod_ui_path: path that mod_ui has in the computer.
     :param Lv2EffectBuilder builder: Builder for generate the lv2 effects
     :param bool ignore_errors: Ignore pedalboard problems like connections with undefined ports
+    :param Lv2EffectBuilderRegistry registry: Provides the builder when ``builder`` is ``None``.
+                                              Default is :meth:`.Lv2EffectBuilderRegistry.default`
     """
 
-    def __init__(self, mod_ui_path, builder, ignore_errors=False):
+    def __init__(self, mod_ui_path, builder=None, ignore_errors=False, registry=None):
         self._load_mod_ui_libraries(mod_ui_path)
-        self.builder = builder
+        self._builder = builder
+        self.registry = registry if registry is not None else Lv2EffectBuilderRegistry.default()
         self.ignore_errors = ignore_errors
 
+    @property
+    def builder(self):
+        """
+        :return Lv2EffectBuilder: Builder for generate the lv2 effects
+        """
+        if self._builder is not None:
+            return self._builder
+
+        return self.registry.get()
+
+    @builder.setter
+    def builder(self, builder):
+        self._builder = builder
+
     def _load_mod_ui_libraries(self, path):
         """
         :param Path path:
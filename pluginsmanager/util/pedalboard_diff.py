@@ -0,0 +1,127 @@
+# Copyright 2017 SrMouraSilva
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+class PedalboardDiff(object):
+    """
+    Calculates the minimal set of operations that transforms a pedalboard
+    (the pedalboard loaded in a host) into another pedalboard.
+
+    Effects are paired by the ``pairs_list`` similarity key (usually the plugin uri):
+    a paired effect of the new pedalboard reuses the instance of the current
+    pedalboard effect, so only its different params and status need be updated.
+
+    Connections are treated as edges keyed by the effect instance and
+    port symbol of their endpoints. Because paired effects share the same instance,
+    a connection present in both pedalboards is preserved::
+
+        >>> diff = PedalboardDiff(PairsList(lambda effect: effect.plugin['uri']))
+        >>> plan = diff.calculate(current_pedalboard, new_pedalboard)
+        >>> plan.connections_to_add
+        [<Connection object as 'Calf Reverb.Out L -> system.playback_1' at 0x7f60f45dacc0>]
+
+    :param PairsList pairs_list: PairsList used for pair the effects of both pedalboards
+    """
+
+    def __init__(self, pairs_list):
+        self.pairs_list = pairs_list
+
+    def calculate(self, current, pedalboard):
+        """
+        :param Pedalboard current: Pedalboard loaded
+        :param Pedalboard pedalboard: Pedalboard that will be loaded
+        :return PedalboardDiffPlan: Operations necessary for change ``current`` to ``pedalboard``
+        """
+        plan = PedalboardDiffPlan()
+
+        result = self.pairs_list.calculate(current.effects, pedalboard.effects)
+
+        plan.effects_pairs = result.pairs
+        plan.effects_to_remove = result.elements_not_added_a
+        plan.effects_to_add = result.elements_not_added_b
+
+        equivalents = {}
+
+        for current_effect, new_effect in result.pairs:
+            equivalents[new_effect] = current_effect
+
+            for current_param, new_param in zip(current_effect.params, new_effect.params):
+                if current_param.value != new_param.value:
+                    plan.params_to_set.append(new_param)
+
+            if current_effect.active != new_effect.active:
+                plan.effects_status_to_set.append(new_effect)
+
+        current_edges = {self._edge(connection, {}) for connection in current.connections}
+        new_edges = {self._edge(connection, equivalents) for connection in pedalboard.connections}
+
+        plan.connections_to_remove = [
+            connection for connection in current.connections
+            if self._edge(connection, {}) not in new_edges
+        ]
+        plan.connections_to_add = [
+            connection for connection in pedalboard.connections
+            if self._edge(connection, equivalents) not in current_edges
+        ]
+
+        return plan
+
+    def _edge(self, connection, equivalents):
+        output_effect = equivalents.get(connection.output.effect, connection.output.effect)
+        input_effect = equivalents.get(connection.input.effect, connection.input.effect)
+
+        return (
+            type(connection),
+            id(output_effect), connection.output.symbol,
+            id(input_effect), connection.input.symbol
+        )
+
+
+class PedalboardDiffPlan(object):
+    """
+    Operations calculated by :class:`.PedalboardDiff`.
+
+    The operations should be applied in the attributes declaration order:
+    first the removal of the connections and effects, after the addition of the
+    effects, the params and status changes and finally the addition of the connections.
+    """
+
+    def __init__(self):
+        self.effects_pairs = []
+        """list[tuple(Effect, Effect)]: Effects (current, new) that will be reused"""
+
+        self.connections_to_remove = []
+        """list[Connection]: Connections of the current pedalboard that will be disconnected"""
+        self.effects_to_remove = []
+        """list[Effect]: Effects of the current pedalboard that will be removed"""
+
+        self.effects_to_add = []
+        """list[Effect]: Effects of the new pedalboard that will be added"""
+        self.params_to_set = []
+        """list[Param]: Params of paired effects with different values"""
+        self.effects_status_to_set = []
+        """list[Effect]: Paired effects with different status (active or bypass)"""
+        self.connections_to_add = []
+        """list[Connection]: Connections of the new pedalboard that will be connected"""
+
+    def __len__(self):
+        """
+        :return int: Total operations
+        """
+        return len(self.connections_to_remove) \
+            + len(self.effects_to_remove) \
+            + len(self.effects_to_add) \
+            + len(self.params_to_set) \
+            + len(self.effects_status_to_set) \
+            + len(self.connections_to_add)
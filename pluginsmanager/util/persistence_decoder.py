@@ -12,8 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import json
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
 from pluginsmanager.model.bank import Bank
-from pluginsmanager.model.lv2.lv2_effect_builder import Lv2EffectBuilder as Lv2LilvEffectBuilder
+from pluginsmanager.model.lv2.lv2_effect_builder_registry import Lv2EffectBuilderRegistry
 from pluginsmanager.model.pedalboard import Pedalboard
 from pluginsmanager.util.builder.lv2_json_builder import Lv2AudioPortBuilder, Lv2EffectBuilder
 from pluginsmanager.util.builder.system_json_builder import SystemAudioPortBuilder
@@ -24,19 +28,103 @@ class PersistenceDecoderError(Exception):
 
 
 class PersistenceDecoder(object):
+    """
+    Generates the banks by its json data.
+
+    The lv2 effects are generated by the builder shared in ``registry``, so
+    the plugins metadata isn't loaded again for each bank or pedalboard read.
 
-    def __init__(self, system_effect):
+    :param SystemEffect system_effect: SystemEffect used in pedalboards
+    :param Lv2EffectBuilderRegistry registry: Provides the lv2 effects builder.
+                                              Default is :meth:`.Lv2EffectBuilderRegistry.default`
+    """
+
+    def __init__(self, system_effect, registry=None):
         self.system_effect = system_effect
+        self.registry = registry
 
     def read(self, json):
-        reader = BankReader(self.system_effect)
+        reader = BankReader(self.system_effect, self.registry)
 
         return reader.read(json)
 
+    def read_files(self, paths, workers=None, loader=None):
+        """
+        Reads many bank files.
+
+        The files are parsed and validated (see :meth:`validate`) in parallel by ``workers``
+        processes. Then, the banks are generated in the current process::
+
+            >>> decoder = PersistenceDecoder(system_effect)
+            >>> banks = decoder.read_files(['data/bank1.json', 'data/bank2.json'], workers=4)
+
+        :param list[Path] paths: Bank files paths
+        :param int workers: Number of processes. ``None`` uses the number of processors.
+                            With ``1``, the files are read in the current process
+        :param loader: Function that reads a path and returns its json data.
+                       It needs to be picklable (like a module function).
+                       Default uses :func:`json.load`
+        :return list[Bank]: Banks, in the paths order
+        """
+        parse = partial(_parse_bank_file, loader or _load_json)
+
+        if workers == 1 or len(paths) <= 1:
+            data = list(map(parse, paths))
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                data = list(executor.map(parse, paths))
+
+        return [self.read(json) for json in data]
+
+    @staticmethod
+    def validate(json):
+        """
+        Checks if the bank json data contains the structure expected
+
+        :param dict json: Bank json data
+        :raise PersistenceDecoderError: If the structure is invalid
+        """
+        _require(json, 'bank', ('name', 'pedalboards'))
+
+        for pedalboard in json['pedalboards']:
+            _require(pedalboard, 'pedalboard', ('name', 'effects', 'connections'))
+
+            for effect in pedalboard['effects']:
+                _require(effect, 'effect', ('technology', 'plugin', 'params', 'active'))
+
+            for connection in pedalboard['connections']:
+                _require(connection, 'connection', ('type', 'output', 'input'))
+
+
+def _require(json, name, keys):
+    if not isinstance(json, dict):
+        raise PersistenceDecoderError('Invalid {}: {}'.format(name, json))
+
+    for key in keys:
+        if key not in json:
+            raise PersistenceDecoderError("Invalid {}: '{}' not found".format(name, key))
+
+
+def _load_json(path):
+    with open(str(path)) as data_file:
+        return json.load(data_file)
+
+
+def _parse_bank_file(loader, path):
+    data = loader(path)
+
+    try:
+        PersistenceDecoder.validate(data)
+    except PersistenceDecoderError as e:
+        raise PersistenceDecoderError('{}: {}'.format(path, e))
+
+    return data
+
 
 class Reader(object):
-    def __init__(self, system_effect):
+    def __init__(self, system_effect, registry=None):
         self.system_effect = system_effect
+        self.registry = registry if registry is not None else Lv2EffectBuilderRegistry.default()
 
     def read(self, json):
         pass
@@ -46,8 +134,10 @@ class BankReader(Reader):
 
     def read(self, json):
         bank = Bank(json['name'])
+        if 'uuid' in json:
+            bank._uuid = json['uuid']
 
-        pedalboard_reader = PedalboardReader(self.system_effect)
+        pedalboard_reader = PedalboardReader(self.system_effect, self.registry)
         for pedalboard_json in json['pedalboards']:
             bank.append(pedalboard_reader.read(pedalboard_json))
 
@@ -58,8 +148,10 @@ class PedalboardReader(Reader):
 
     def read(self, json):
         pedalboard = Pedalboard(json['name'])
+        if 'uuid' in json:
+            pedalboard._uuid = json['uuid']
 
-        effect_reader = EffectReader(self.system_effect)
+        effect_reader = EffectReader(self.system_effect, self.registry)
         for effect_json in json['effects']:
             pedalboard.append(effect_reader.read(effect_json))
 
@@ -76,9 +168,12 @@ class PedalboardReader(Reader):
 
 class EffectReader(Reader):
 
-    def __init__(self, system_effect):
-        super(EffectReader, self).__init__(system_effect)
-        self.builder = Lv2LilvEffectBuilder()
+    @property
+    def builder(self):
+        """
+        :return Lv2EffectBuilder: Builder shared by the registry
+        """
+        return self.registry.get()
 
     def read(self, json):
         return self.generate_builder(json).build(json)
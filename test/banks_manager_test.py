@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import threading
 import unittest
 from unittest.mock import MagicMock, call
 
@@ -21,6 +22,7 @@ from pluginsmanager.model.connection import Connection
 from pluginsmanager.model.lv2.lv2_effect_builder import Lv2EffectBuilder
 from pluginsmanager.model.pedalboard import Pedalboard
 from pluginsmanager.observer.update_type import UpdateType
+from pluginsmanager.observer.updates_observer import UpdatesObserver
 
 
 class BanksManagerTest(unittest.TestCase):
@@ -149,3 +151,190 @@ class BanksManagerTest(unittest.TestCase):
         self.assertIn(observer, manager.observers)
         manager.unregister(observer)
         self.assertNotIn(observer, manager.observers)
+
+    def test_param_flush_interval(self):
+        observer = MagicMock()
+
+        manager = BanksManager(param_flush_interval=60)
+        manager.register(observer)
+
+        bank = Bank('Bank 1')
+        pedalboard = Pedalboard('Rocksmith')
+        reverb = Lv2EffectBuilder().build('http://calf.sourceforge.net/plugins/Reverb')
+        bank.append(pedalboard)
+        pedalboard.append(reverb)
+        manager.append(bank)
+
+        param = reverb.params[0]
+        for value in (param.minimum, param.maximum, param.default):
+            param.value = value
+
+        observer.on_param_value_changed.assert_not_called()
+
+        manager.flush()
+        observer.on_param_value_changed.assert_called_once_with(param)
+
+    def test_param_flush_interval_other_changes(self):
+        observer = MagicMock()
+
+        manager = BanksManager(param_flush_interval=60)
+        manager.register(observer)
+
+        bank = Bank('Bank 1')
+        pedalboard = Pedalboard('Rocksmith')
+        reverb = Lv2EffectBuilder().build('http://calf.sourceforge.net/plugins/Reverb')
+        bank.append(pedalboard)
+        pedalboard.append(reverb)
+        manager.append(bank)
+
+        param = reverb.params[0]
+        param.value = param.maximum
+        # Pending changes are notified before the other changes
+        reverb.toggle()
+
+        self.assertEqual(['on_param_value_changed', 'on_effect_status_toggled'],
+                         [name for name, args, kwargs in observer.method_calls][-2:])
+
+    def test_batch(self):
+        observer = MagicMock()
+        scope_observer = MagicMock()
+
+        manager = BanksManager()
+        manager.register(observer)
+        manager.register(scope_observer)
+
+        bank = Bank('Bank 1')
+        pedalboard = Pedalboard('Rocksmith')
+        reverb = Lv2EffectBuilder().build('http://calf.sourceforge.net/plugins/Reverb')
+
+        with manager.batch():
+            manager.append(bank)
+            bank.append(pedalboard)
+
+            with manager.batch():
+                pedalboard.append(reverb)
+
+            param = reverb.params[0]
+            for value in (param.minimum, param.maximum):
+                param.value = value
+
+            # The changes caused by scope_observer are not delivered for it
+            manager.enter_scope(scope_observer)
+            reverb.toggle()
+            manager.exit_scope()
+
+            observer.on_bank_updated.assert_not_called()
+            observer.on_batch.assert_not_called()
+
+        observer.on_batch.assert_called_once()
+        changes = observer.on_batch.call_args[0][0]
+
+        self.assertEqual(
+            ['on_bank_updated', 'on_pedalboard_updated', 'on_effect_updated',
+             'on_param_value_changed', 'on_effect_status_toggled'],
+            [change.method for change in changes]
+        )
+        self.assertEqual((param, ), changes[3].args)
+        self.assertEqual({'index': 0, 'origin': manager}, changes[0].kwargs)
+
+        scope_changes = scope_observer.on_batch.call_args[0][0]
+        self.assertEqual(4, len(scope_changes))
+        self.assertNotIn('on_effect_status_toggled', [change.method for change in scope_changes])
+
+        # Default on_batch implementation notifies each change
+        another_observer = MagicMock()
+        UpdatesObserver.on_batch(another_observer, changes)
+        another_observer.on_param_value_changed.assert_called_once_with(param)
+
+    def test_asynchronous_observer(self):
+        threads = []
+        values = []
+
+        observer = MagicMock()
+        observer.on_param_value_changed.side_effect = lambda param: (
+            threads.append(threading.current_thread()), values.append(param.value)
+        )
+
+        manager = BanksManager()
+        manager.register(observer, asynchronous=True)
+
+        bank = Bank('Bank 1')
+        pedalboard = Pedalboard('Rocksmith')
+        reverb = Lv2EffectBuilder().build('http://calf.sourceforge.net/plugins/Reverb')
+        bank.append(pedalboard)
+        pedalboard.append(reverb)
+        manager.append(bank)
+
+        param = reverb.params[0]
+        expected = []
+        for value in (param.minimum, param.maximum, param.minimum):
+            param.value = value
+            expected.append(param.value)
+            manager.join()
+
+        self.assertEqual(expected, values)
+        self.assertNotIn(threading.current_thread(), threads)
+
+        manager.unregister(observer)
+        self.assertNotIn(observer, manager.observers)
+
+    def test_observers_priority(self):
+        calls = []
+
+        def observer(name):
+            mock = MagicMock()
+            mock.on_bank_updated.side_effect = lambda *args, **kwargs: calls.append(name)
+            return mock
+
+        manager = BanksManager()
+        manager.register(observer('autosaver'), asynchronous=True)
+        manager.register(observer('websocket'))
+        manager.register(observer('host'), priority=10)
+
+        manager.append(Bank('Bank 1'))
+        manager.join()
+
+        self.assertEqual(['host', 'websocket', 'autosaver'], calls)
+        manager.close()
+
+    def test_subscriptions(self):
+        leds = MagicMock()
+        pedalboard_observer = MagicMock()
+
+        manager = BanksManager()
+        manager.register(leds, events=['on_effect_status_toggled'])
+
+        bank = Bank('Bank 1')
+        pedalboard = Pedalboard('Rocksmith')
+        pedalboard2 = Pedalboard('Rocksmith 2')
+        bank.append(pedalboard)
+        bank.append(pedalboard2)
+        manager.append(bank)
+
+        manager.register(pedalboard_observer, pedalboard=pedalboard2)
+
+        builder = Lv2EffectBuilder()
+        reverb = builder.build('http://calf.sourceforge.net/plugins/Reverb')
+        reverb2 = builder.build('http://calf.sourceforge.net/plugins/Reverb')
+        pedalboard.append(reverb)
+        pedalboard2.append(reverb2)
+
+        reverb.toggle()
+        reverb.params[0].value = reverb.params[0].maximum
+        reverb2.params[0].value = reverb2.params[0].maximum
+
+        self.assertEqual([call.on_effect_status_toggled(reverb)], leds.method_calls)
+        self.assertEqual(
+            ['on_effect_updated', 'on_param_value_changed'],
+            [name for name, args, kwargs in pedalboard_observer.method_calls]
+        )
+        pedalboard_observer.on_param_value_changed.assert_called_once_with(reverb2.params[0])
+
+        with manager.batch():
+            reverb.toggle()
+            reverb2.toggle()
+
+        self.assertEqual([reverb2], [change.args[0] for change in pedalboard_observer.on_batch.call_args[0][0]])
+
+        with self.assertRaises(ValueError):
+            manager.register(MagicMock(), events=['on_unknown_event'])
@@ -0,0 +1,162 @@
+# Copyright 2017 SrMouraSilva
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import unittest
+from unittest.mock import MagicMock
+
+from pluginsmanager.banks_manager import BanksManager
+from pluginsmanager.model.bank import Bank
+from pluginsmanager.model.lv2.lv2_effect_builder import Lv2EffectBuilder
+from pluginsmanager.model.pedalboard import Pedalboard
+from pluginsmanager.observer.mod_host.async_host import AsyncHost
+from pluginsmanager.observer.mod_host.async_mod_host import AsyncModHost
+from pluginsmanager.observer.mod_host.mod_host import ModHostError
+
+
+class AsyncFakeModHost(object):
+    """
+    Responds ``resp 0`` for every message received
+    """
+
+    def __init__(self):
+        self.messages = []
+        self.server = None
+        self.port = None
+
+    async def start(self):
+        self.server = await asyncio.start_server(self._client, 'localhost', 0)
+        self.port = self.server.sockets[0].getsockname()[1]
+
+    async def _client(self, reader, writer):
+        try:
+            while True:
+                message = await reader.readuntil(b'\0')
+                self.messages.append(message[:-1].decode('utf-8'))
+
+                writer.write('resp -{}\0'.format(len(self.messages)).encode('utf-8'))
+                await writer.drain()
+        except asyncio.IncompleteReadError:
+            writer.close()
+
+    async def close(self):
+        self.server.close()
+        await self.server.wait_closed()
+
+
+class AsyncHostTest(unittest.TestCase):
+
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+
+        self.mod_host = AsyncFakeModHost()
+        self.loop.run_until_complete(self.mod_host.start())
+
+    def tearDown(self):
+        self.loop.run_until_complete(self.mod_host.close())
+        self.loop.close()
+        asyncio.set_event_loop(None)
+
+    def test_mod_host_not_started(self):
+        host = AsyncHost(port=1)
+
+        with self.assertRaises(ConnectionRefusedError):
+            self.loop.run_until_complete(host.open())
+
+    def test_send_in_flight_limit(self):
+        async def run():
+            host = AsyncHost(port=self.mod_host.port, max_in_flight=3)
+            await host.open()
+
+            effect = MagicMock()
+            effect.instance = 0
+
+            responses = await asyncio.gather(*[host.remove(effect) for _ in range(20)])
+            await host.close()
+
+            return responses
+
+        responses = self.loop.run_until_complete(run())
+
+        self.assertEqual(['resp -{}'.format(i).encode('utf-8') for i in range(1, 21)], responses)
+        self.assertEqual(['remove 0'] * 20, self.mod_host.messages)
+
+    def test_send_order(self):
+        async def run():
+            host = AsyncHost(port=self.mod_host.port, max_in_flight=1)
+            await host.open()
+
+            effects = [MagicMock() for _ in range(10)]
+            for instance, effect in enumerate(effects):
+                effect.instance = instance
+
+            commands = []
+            for effect in effects:
+                commands.append(host.remove(effect))
+                commands.append(host.send('bypass {} 1'.format(effect.instance)))
+
+            await asyncio.gather(*commands)
+            await host.close()
+
+        self.loop.run_until_complete(run())
+
+        expected = []
+        for instance in range(10):
+            expected += ['remove {}'.format(instance), 'bypass {} 1'.format(instance)]
+
+        self.assertEqual(expected, self.mod_host.messages)
+
+    def test_close_not_opened(self):
+        self.loop.run_until_complete(AsyncHost(port=self.mod_host.port).close())
+
+    def test_async_mod_host(self):
+        builder = Lv2EffectBuilder()
+
+        manager = BanksManager()
+        bank = Bank('Bank 1')
+        manager.append(bank)
+
+        pedalboard = Pedalboard('Pedalboard 1')
+        bank.append(pedalboard)
+        reverb = builder.build('http://calf.sourceforge.net/plugins/Reverb')
+        pedalboard.append(reverb)
+
+        mod_host = AsyncModHost(port=self.mod_host.port)
+        manager.register(mod_host)
+
+        async def run():
+            await mod_host.connect()
+
+            mod_host.pedalboard = pedalboard
+            reverb.toggle()
+            await mod_host.drain()
+
+            mod_host.close()
+            await mod_host.drain()
+
+        self.loop.run_until_complete(run())
+
+        self.assertEqual([
+            'add http://calf.sourceforge.net/plugins/Reverb 0',
+            'bypass 0 1',
+            'bypass 0 0',
+            'remove 0',
+        ], self.mod_host.messages)
+
+    def test_close_not_connected(self):
+        mod_host = AsyncModHost(port=self.mod_host.port)
+
+        with self.assertRaises(ModHostError):
+            mod_host.close()
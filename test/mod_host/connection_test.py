@@ -0,0 +1,88 @@
+# Copyright 2017 SrMouraSilva
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import socket
+import threading
+import unittest
+
+from pluginsmanager.observer.mod_host.connection import Connection
+
+
+class FakeModHost(object):
+    """
+    Accepts one connection and responds ``resp 0`` for every message received
+    """
+
+    def __init__(self):
+        self.server = socket.socket()
+        self.server.bind(('localhost', 0))
+        self.server.listen(1)
+        self.port = self.server.getsockname()[1]
+
+        self.messages = []
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+
+    def _run(self):
+        client, _ = self.server.accept()
+        buffer = b''
+
+        with client:
+            while True:
+                received = client.recv(1024)
+                if not received:
+                    break
+
+                buffer += received
+                *messages, buffer = buffer.split(b'\0')
+
+                responses = []
+                for message in messages:
+                    self.messages.append(message.decode('utf-8'))
+                    responses.append('resp -{}\0'.format(len(self.messages)).encode('utf-8'))
+
+                client.sendall(b''.join(responses))
+
+    def close(self):
+        self.server.close()
+
+
+class ConnectionTest(unittest.TestCase):
+
+    def setUp(self):
+        self.mod_host = FakeModHost()
+        self.connection = Connection(self.mod_host.port)
+
+    def tearDown(self):
+        self.connection.close()
+        self.mod_host.thread.join(1)
+        self.mod_host.close()
+
+    def test_send(self):
+        self.assertEqual(b'resp -1', self.connection.send('add http://lv2plug.in/plugins/eg-amp 0'))
+        self.assertEqual(b'resp -2', self.connection.send('remove 0'))
+
+        self.assertEqual(['add http://lv2plug.in/plugins/eg-amp 0', 'remove 0'], self.mod_host.messages)
+
+    def test_send_batch(self):
+        messages = ['add http://lv2plug.in/plugins/eg-amp {}'.format(i) for i in range(100)]
+
+        responses = self.connection.send_batch(messages)
+
+        self.assertEqual(messages, self.mod_host.messages)
+        self.assertEqual(['resp {}'.format(-i).encode('utf-8') for i in range(1, 101)], responses)
+
+    def test_send_batch_empty(self):
+        self.assertEqual([], self.connection.send_batch([]))
+        self.assertEqual(b'resp -1', self.connection.send('remove 0'))
@@ -13,8 +13,10 @@
 # limitations under the License.
 
 import unittest
+from unittest.mock import MagicMock
 
 from pluginsmanager.observer.mod_host.host import Host
+from test.mod_host.connection_test import FakeModHost
 
 
 class HostTest(unittest.TestCase):
@@ -22,3 +24,27 @@ class HostTest(unittest.TestCase):
     def test_mod_host_not_started(self):
         with self.assertRaises(ConnectionRefusedError):
             Host()
+
+    def test_batch(self):
+        mod_host = FakeModHost()
+        host = Host(port=mod_host.port)
+
+        effect = MagicMock()
+        effect.instance = 0
+
+        with host.batch():
+            host.remove(effect)
+            with host.batch():
+                host.set_status(effect)
+            host.remove(effect)
+
+            self.assertEqual(3, len(host._queue))
+
+        self.assertEqual(['remove 0', 'bypass 0 1', 'remove 0'], mod_host.messages)
+        self.assertEqual([], host._queue)
+
+        host.remove(effect)
+        self.assertEqual('remove 0', mod_host.messages[-1])
+
+        host.close()
+        mod_host.close()
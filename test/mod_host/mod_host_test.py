@@ -13,7 +13,7 @@
 # limitations under the License.
 
 import unittest
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, call
 
 import os
 
@@ -122,6 +122,37 @@ class ModHostTest(unittest.TestCase):
         for effect in list(pedalboard.effects):
             pedalboard.effects.remove(effect)
 
+    def test_batch(self):
+        manager = BanksManager()
+        bank = Bank('Bank 1')
+        manager.append(bank)
+
+        mod_host = ModHost('localhost')
+        mod_host.host = MagicMock()
+        manager.register(mod_host)
+
+        pedalboard = Pedalboard('Rocksmith')
+        bank.append(pedalboard)
+        mod_host.pedalboard = pedalboard
+        mod_host.host.reset_mock()
+
+        reverb = self.builder.build('http://calf.sourceforge.net/plugins/Reverb')
+        reverb2 = self.builder.build('http://calf.sourceforge.net/plugins/Reverb')
+
+        with manager.batch():
+            pedalboard.append(reverb)
+            pedalboard.append(reverb2)
+            pedalboard.connect(reverb.outputs[0], reverb2.inputs[0])
+            reverb.params[0].value = reverb.params[0].maximum
+
+            mod_host.host.add.assert_not_called()
+
+        # All commands are sent inside the outermost host batch
+        self.assertEqual(call.batch(), mod_host.host.mock_calls[0])
+        self.assertEqual(2, mod_host.host.add.call_count)
+        mod_host.host.connect.assert_called_once()
+        mod_host.host.set_param_value.assert_any_call(reverb.params[0])
+
     def test_set_pedalboard(self):
         """Test only coverage"""
         manager = BanksManager()
@@ -219,6 +250,134 @@ class ModHostTest(unittest.TestCase):
 
         pedalboard2.connect(pedalboard2.effects[0].outputs[0], pedalboard2.effects[1].inputs[0])
 
+    def test_replace_pedalboard_apply_only_differences(self):
+        sys_effect = SystemEffect('system', ('capture_1', 'capture_2'), ('playback_1', 'playback_2'))
+
+        def generate_pedalboard(name):
+            pedalboard = Pedalboard(name)
+            reverb = self.builder.build('http://calf.sourceforge.net/plugins/Reverb')
+            pedalboard.append(reverb)
+            pedalboard.connect(sys_effect.outputs[0], reverb.inputs[0])
+            pedalboard.connect(reverb.outputs[0], sys_effect.inputs[0])
+
+            return pedalboard
+
+        pedalboard = generate_pedalboard('test_replace_pedalboard_1')
+        pedalboard2 = generate_pedalboard('test_replace_pedalboard_2')
+        reverb2 = pedalboard2.effects[0]
+        reverb2.params[0].value = reverb2.params[0].maximum
+        pedalboard2.connect(reverb2.outputs[1], sys_effect.inputs[1])
+
+        mod_host = ModHost('localhost')
+        mod_host.host = MagicMock()
+
+        mod_host.pedalboard = pedalboard
+        mod_host.host.reset_mock()
+
+        mod_host.pedalboard = pedalboard2
+
+        self.assertEqual(pedalboard.effects[0].instance, reverb2.instance)
+        mod_host.host.add.assert_not_called()
+        mod_host.host.remove.assert_not_called()
+        mod_host.host.disconnect.assert_not_called()
+        mod_host.host.set_param_value.assert_called_once_with(reverb2.params[0])
+        mod_host.host.connect.assert_called_once_with(pedalboard2.connections[-1])
+        mod_host.host.batch.assert_called_once_with()
+
+    def test_change_to_preloaded_pedalboard(self):
+        sys_effect = SystemEffect('system', ('capture_1', 'capture_2'), ('playback_1', 'playback_2'))
+
+        bank = Bank('test_change_to_preloaded_pedalboard')
+        for uri in ('http://calf.sourceforge.net/plugins/Reverb', 'http://guitarix.sourceforge.net/plugins/gx_fuzzfacefm_#_fuzzfacefm_'):
+            pedalboard = Pedalboard(uri)
+            effect = self.builder.build(uri)
+            pedalboard.append(effect)
+            pedalboard.connect(sys_effect.outputs[0], effect.inputs[0])
+            pedalboard.connect(effect.outputs[0], sys_effect.inputs[0])
+            bank.append(pedalboard)
+
+        pedalboard1, pedalboard2 = bank.pedalboards
+
+        mod_host = ModHost('localhost')
+        mod_host.host = MagicMock()
+        mod_host.standby.max_pedalboards = 1
+
+        mod_host.pedalboard = pedalboard1
+        mod_host.preload_next()
+
+        self.assertIn(pedalboard2, mod_host.standby)
+        mod_host.host.add.assert_called_with(pedalboard2.effects[0])
+        mod_host.host.set_status.assert_called_with(pedalboard2.effects[0], active=False)
+        mod_host.host.reset_mock()
+
+        mod_host.pedalboard = pedalboard2
+
+        # Only the connections and status are changed
+        mod_host.host.add.assert_not_called()
+        mod_host.host.remove.assert_not_called()
+        self.assertEqual(2, mod_host.host.disconnect.call_count)
+        self.assertEqual(2, mod_host.host.connect.call_count)
+        mod_host.host.set_status.assert_any_call(pedalboard1.effects[0], active=False)
+        mod_host.host.set_status.assert_any_call(pedalboard2.effects[0])
+
+        # The previous pedalboard is now in standby
+        self.assertIn(pedalboard1, mod_host.standby)
+        self.assertNotIn(pedalboard2, mod_host.standby)
+
+        mod_host.host.reset_mock()
+        bank.pedalboards.remove(pedalboard1)
+        mod_host.unload(pedalboard1)
+        mod_host.host.remove.assert_called_once_with(pedalboard1.effects[0])
+
+    def test_standby_eviction_unloads_effects(self):
+        reverb = 'http://calf.sourceforge.net/plugins/Reverb'
+
+        manager = BanksManager()
+        bank = Bank('test_standby_eviction_unloads_effects')
+        manager.append(bank)
+
+        for name in ('1', '2', '3'):
+            pedalboard = Pedalboard(name)
+            pedalboard.append(self.builder.build(reverb))
+            bank.append(pedalboard)
+
+        pedalboard1, pedalboard2, pedalboard3 = bank.pedalboards
+
+        mod_host = ModHost('localhost')
+        mod_host.host = MagicMock()
+        mod_host.standby.max_pedalboards = 2
+        mod_host.standby.max_effects = 3
+        manager.register(mod_host)
+
+        loaded = set()
+        mod_host.host.add.side_effect = lambda effect: loaded.add(effect)
+        mod_host.host.remove.side_effect = lambda effect: loaded.discard(effect)
+
+        def assert_no_leaked_instances():
+            expected = {effect for pedalboard in mod_host.standby for effect in pedalboard.effects}
+            expected |= set(mod_host.pedalboard.effects)
+            self.assertEqual(expected, loaded)
+
+        mod_host.pedalboard = pedalboard1
+        mod_host.preload(pedalboard2)
+        mod_host.preload(pedalboard3)
+        assert_no_leaked_instances()
+
+        # The standby pedalboard grows over the budget: pedalboard 2 is evicted
+        pedalboard3.append(self.builder.build(reverb))
+        pedalboard3.append(self.builder.build(reverb))
+        self.assertNotIn(pedalboard2, mod_host.standby)
+        assert_no_leaked_instances()
+
+        # Exceeds the budget alone
+        pedalboard3.append(self.builder.build(reverb))
+        self.assertNotIn(pedalboard3, mod_host.standby)
+        assert_no_leaked_instances()
+
+        mod_host.preload(pedalboard2)
+        mod_host.preload(pedalboard2)
+        assert_no_leaked_instances()
+
     @unittest.skip
     def test_system_midi_port(self):
         from pluginsmanager.observer.mod_host.mod_host import ModHost
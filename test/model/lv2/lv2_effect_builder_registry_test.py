@@ -0,0 +1,86 @@
+# Copyright 2017 SrMouraSilva
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+from unittest.mock import MagicMock
+
+from pluginsmanager.model.bank import Bank
+from pluginsmanager.model.lv2.lv2_effect_builder import Lv2EffectBuilder
+from pluginsmanager.model.lv2.lv2_effect_builder_registry import Lv2EffectBuilderRegistry
+from pluginsmanager.model.pedalboard import Pedalboard
+from pluginsmanager.model.system.system_effect import SystemEffect
+from pluginsmanager.util.persistence_decoder import PersistenceDecoder
+
+
+class Lv2EffectBuilderRegistryTest(unittest.TestCase):
+
+    def test_get(self):
+        factory = MagicMock(side_effect=lambda: object())
+        registry = Lv2EffectBuilderRegistry(factory)
+
+        factory.assert_not_called()
+
+        builder = registry.get()
+        self.assertIs(builder, registry.get())
+        factory.assert_called_once_with()
+
+    def test_set(self):
+        registry = Lv2EffectBuilderRegistry(MagicMock())
+        builder = object()
+
+        registry.set(builder)
+        self.assertIs(builder, registry.get())
+
+    def test_reload(self):
+        factory = MagicMock(side_effect=lambda: MagicMock())
+        registry = Lv2EffectBuilderRegistry(factory)
+
+        builder = registry.get()
+        registry.reload(['metadata'])
+        self.assertIs(builder, registry.get())
+        builder.reload.assert_called_once_with(['metadata'])
+
+        new_builder = registry.reload()
+        self.assertIsNot(builder, new_builder)
+        self.assertIs(new_builder, registry.get())
+
+    def test_invalidate(self):
+        factory = MagicMock(side_effect=lambda: object())
+        registry = Lv2EffectBuilderRegistry(factory)
+
+        builder = registry.get()
+        registry.invalidate()
+
+        self.assertIsNot(builder, registry.get())
+        self.assertEqual(2, factory.call_count)
+
+    def test_default(self):
+        self.assertIs(Lv2EffectBuilderRegistry.default(), Lv2EffectBuilderRegistry.default())
+
+    def test_persistence_decoder_shares_builder(self):
+        builder = Lv2EffectBuilder()
+        factory = MagicMock(return_value=builder)
+        registry = Lv2EffectBuilderRegistry(factory)
+
+        bank = Bank('Bank')
+        for name in ('Pedalboard 1', 'Pedalboard 2', 'Pedalboard 3'):
+            pedalboard = Pedalboard(name)
+            pedalboard.append(builder.build('http://calf.sourceforge.net/plugins/Reverb'))
+            bank.append(pedalboard)
+
+        system_effect = SystemEffect('system', ('capture_1', ), ('playback_1', ))
+        bank_read = PersistenceDecoder(system_effect, registry).read(bank.json)
+
+        self.assertEqual(bank.json, bank_read.json)
+        factory.assert_called_once_with()
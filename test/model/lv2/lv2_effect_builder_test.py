@@ -12,10 +12,19 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import json
+import os
+import shutil
+import sys
+import tempfile
 import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
 
 from pluginsmanager.model.lv2.lv2_effect_builder import Lv2EffectBuilder
 from pluginsmanager.model.lv2.lv2_effect_builder import Lv2EffectBuilderError
+from pluginsmanager.model.lv2.lv2_installed_plugins import Lv2InstalledPlugins
+from pluginsmanager.model.lv2.lv2_plugins_cache import Lv2PluginsCache
 
 
 class Lv2EffecBuilderTest(unittest.TestCase):
@@ -24,3 +33,122 @@ class Lv2EffecBuilderTest(unittest.TestCase):
         builder = Lv2EffectBuilder()
         with self.assertRaises(Lv2EffectBuilderError):
             builder.build('nonexistent_effect')
+
+    def test_incremental_lv2_plugins_data(self):
+        directory = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, str(directory))
+
+        with open(str(Lv2EffectBuilder.plugins_json_file)) as data_file:
+            plugins = json.load(data_file)[:2]
+
+        def install(plugin, name):
+            bundle = directory / 'lv2' / name
+            bundle.mkdir(parents=True, exist_ok=True)
+            with open(str(bundle / 'manifest.ttl'), 'w') as file:
+                file.write('<{}> a <http://lv2plug.in/ns/lv2core#Plugin> .'.format(plugin['uri']))
+            return str(bundle)
+
+        first = install(plugins[0], 'first.lv2')
+        second = install(plugins[1], 'second.lv2')
+
+        source = directory / 'plugins.json'
+        with open(str(source), 'w') as data_file:
+            json.dump(plugins, data_file)
+
+        builder = Lv2EffectBuilder(source, ignore_unsupported_plugins=False, use_cache=False)
+        builder.installed_plugins = Lv2InstalledPlugins([str(directory / 'lv2')])
+        scan_path = directory / 'scan.json'
+
+        lilvlib = MagicMock()
+        lilvlib.get_plugins_info.side_effect = lambda bundles, **options: [plugins[[first, second].index(bundle)] for bundle in bundles]
+
+        with patch.dict(sys.modules, {'lilvlib': lilvlib}):
+            data = builder.lv2_plugins_data(incremental=True, scan_path=scan_path)
+            lilvlib.get_plugins_info.assert_called_once_with([first, second])
+            self.assertEqual(sorted(plugins, key=lambda plugin: plugin['uri']), data)
+
+            # The metadata is obtained from the last scan, not from the builder
+            lilvlib.get_plugins_info.reset_mock()
+            empty = directory / 'empty.json'
+            with open(str(empty), 'w') as data_file:
+                json.dump([], data_file)
+
+            other = Lv2EffectBuilder(empty, ignore_unsupported_plugins=False, use_cache=False)
+            other.installed_plugins = builder.installed_plugins
+
+            data = other.lv2_plugins_data(incremental=True, scan_path=scan_path)
+            lilvlib.get_plugins_info.assert_not_called()
+            self.assertEqual(sorted(plugins, key=lambda plugin: plugin['uri']), data)
+
+            manifest = os.path.join(second, 'manifest.ttl')
+            stat = os.stat(manifest)
+            os.utime(manifest, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+            data = builder.lv2_plugins_data(incremental=True, scan_path=scan_path)
+            lilvlib.get_plugins_info.assert_called_once_with([second])
+            self.assertEqual(2, len(data))
+
+            os.utime(manifest, ns=(stat.st_atime_ns, stat.st_mtime_ns + 2 * 10**9))
+
+            lilvlib.get_plugins_info.reset_mock()
+            builder.lv2_plugins_data(incremental=True, scan_path=scan_path, workers=4)
+            lilvlib.get_plugins_info.assert_called_once_with([second], workers=4)
+
+    def test_incremental_lv2_plugins_data_bundle_without_plugins(self):
+        directory = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, str(directory))
+
+        bundle = directory / 'lv2' / 'unsupported.lv2'
+        bundle.mkdir(parents=True)
+        with open(str(bundle / 'manifest.ttl'), 'w') as file:
+            file.write('<http://example.org/unsupported> a <http://lv2plug.in/ns/lv2core#Plugin> .')
+
+        builder = Lv2EffectBuilder(ignore_unsupported_plugins=False)
+        builder.installed_plugins = Lv2InstalledPlugins([str(directory / 'lv2')])
+        scan_path = directory / 'scan.json'
+
+        lilvlib = MagicMock()
+        lilvlib.get_plugins_info.side_effect = Exception('get_plugins_info() - selected bundles have no plugins')
+
+        with patch.dict(sys.modules, {'lilvlib': lilvlib}):
+            self.assertEqual([], builder.lv2_plugins_data(incremental=True, scan_path=scan_path))
+
+            lilvlib.get_plugins_info.reset_mock()
+            self.assertEqual([], builder.lv2_plugins_data(incremental=True, scan_path=scan_path))
+            lilvlib.get_plugins_info.assert_not_called()
+
+            # Other lilvlib errors aren't hidden
+            lilvlib.get_plugins_info.side_effect = Exception('lilv error')
+            scan_path.unlink()
+            with self.assertRaises(Exception):
+                builder.lv2_plugins_data(incremental=True, scan_path=scan_path)
+
+    def test_reload_keeps_compact_records(self):
+        with open(str(Lv2EffectBuilder.plugins_json_file)) as data_file:
+            plugin = next(plugin for plugin in json.load(data_file) if plugin['uri'] == 'http://calf.sourceforge.net/plugins/Reverb')
+
+        builder = Lv2EffectBuilder(ignore_unsupported_plugins=False)
+        builder.reload([plugin], ignore_unsupported_plugins=False)
+
+        lv2_plugin = builder.all[plugin['uri']]
+        self.assertEqual(Lv2PluginsCache.record(plugin), lv2_plugin._json)
+        self.assertEqual(plugin, lv2_plugin.json)
+
+        reverb = builder.build(plugin['uri'])
+        self.assertEqual({'index', 'name', 'symbol', 'ranges'}, set(reverb.params[0].data.keys()))
+
+    def test_effects_share_ports_template(self):
+        builder = Lv2EffectBuilder(ignore_unsupported_plugins=False)
+
+        reverb = builder.build('http://calf.sourceforge.net/plugins/Reverb')
+        reverb2 = builder.build('http://calf.sourceforge.net/plugins/Reverb')
+
+        self.assertIsNot(reverb.params[0], reverb2.params[0])
+        self.assertIs(reverb.params[0].data, reverb2.params[0].data)
+        self.assertIs(reverb.outputs[1].data, reverb2.outputs[1].data)
+
+        for param in reverb.params:
+            self.assertIs(param, reverb.params[param.symbol])
+
+        reverb.params[0].value = reverb.params[0].maximum
+        self.assertEqual(reverb2.params[0].default, reverb2.params[0].value)
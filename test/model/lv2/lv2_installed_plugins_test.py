@@ -0,0 +1,112 @@
+# Copyright 2017 SrMouraSilva
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from pluginsmanager.model.lv2.lv2_installed_plugins import Lv2InstalledPlugins
+
+
+MANIFEST = '''
+@prefix lv2:  <http://lv2plug.in/ns/lv2core#> .
+@prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
+@prefix pset: <http://lv2plug.in/ns/ext/presets#> .
+
+# <http://example.org/commented> a lv2:Plugin .
+<http://example.org/{name}>
+    a lv2:Plugin, lv2:ReverbPlugin ;
+    lv2:binary <{name}.so> ;
+    rdfs:label "A label with . ; a lv2:Plugin" ;
+    rdfs:seeAlso <{name}.ttl>.
+
+<presets/default.ttl>
+    a pset:Preset ;
+    lv2:appliesTo <http://example.org/{name}> .
+'''
+
+
+class Lv2InstalledPluginsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.installed = Lv2InstalledPlugins([self.directory, os.path.join(self.directory, 'nonexistent')])
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def install(self, name, manifest=None):
+        bundle = os.path.join(self.directory, name + '.lv2')
+        os.makedirs(bundle, exist_ok=True)
+
+        with open(os.path.join(bundle, 'manifest.ttl'), 'w') as file:
+            file.write(manifest if manifest is not None else MANIFEST.format(name=name))
+
+        return bundle
+
+    def test_uris(self):
+        self.install('reverb')
+        self.install('delay')
+        os.makedirs(os.path.join(self.directory, 'without_manifest.lv2'))
+
+        self.assertEqual({'http://example.org/reverb', 'http://example.org/delay'}, self.installed.uris)
+
+    def test_uninstall(self):
+        self.install('reverb')
+        bundle = self.install('delay')
+        self.assertEqual(2, len(self.installed.uris))
+
+        shutil.rmtree(bundle)
+        self.assertEqual({'http://example.org/reverb'}, self.installed.uris)
+
+    def test_manifest_parsed_only_when_changed(self):
+        bundle = self.install('reverb')
+        self.installed.uris
+
+        with patch.object(self.installed, '_read_manifest', wraps=self.installed._read_manifest) as read_manifest:
+            self.assertEqual({'http://example.org/reverb'}, self.installed.uris)
+            read_manifest.assert_not_called()
+
+            self.install('reverb', MANIFEST.format(name='reverb2'))
+            stat = os.stat(os.path.join(bundle, 'manifest.ttl'))
+            os.utime(os.path.join(bundle, 'manifest.ttl'), ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+            self.assertEqual({'http://example.org/reverb2'}, self.installed.uris)
+            read_manifest.assert_called_once_with(os.path.join(bundle, 'manifest.ttl'))
+
+    def test_lv2_path_environment(self):
+        with patch.dict(os.environ, {'LV2_PATH': os.pathsep.join(['/a', '/b'])}):
+            self.assertEqual(['/a', '/b'], Lv2InstalledPlugins().lv2_path)
+
+        with patch.dict(os.environ, {'LV2_PATH': ''}):
+            self.assertEqual(Lv2InstalledPlugins.DEFAULT_LV2_PATH, Lv2InstalledPlugins().lv2_path)
+
+    def test_plugins(self):
+        turtle = '''
+            @prefix lv2: <http://lv2plug.in/ns/lv2core#> .
+            @base <http://example.org/> .
+
+            <relative> a lv2:Plugin .
+            [ a lv2:Plugin ] .
+            <other> rdfs:seeAlso [ a lv2:Plugin ] ;
+                <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://lv2plug.in/ns/lv2core#Plugin> .
+            <number> lv2:default 1.5 ; a lv2:Plugin.
+        '''
+
+        self.assertEqual(
+            ['http://example.org/relative', 'http://example.org/other', 'http://example.org/number'],
+            Lv2InstalledPlugins.plugins(turtle)
+        )
@@ -0,0 +1,170 @@
+# Copyright 2017 SrMouraSilva
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+from pluginsmanager.model.lv2.lv2_effect_builder import Lv2EffectBuilder
+from pluginsmanager.model.lv2.lv2_plugins_cache import Lv2PluginsCache
+
+
+class Lv2PluginsCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = Path(tempfile.mkdtemp())
+        self.source = self.directory / 'plugins.json'
+        self.cache_path = self.directory / 'cache' / 'plugins.cache'
+
+        with open(str(Lv2EffectBuilder.plugins_json_file)) as data_file:
+            self.plugins = json.load(data_file)[:5]
+
+        self.write_source(self.plugins)
+
+        self.xdg_cache_home = os.environ.get('XDG_CACHE_HOME')
+        os.environ['XDG_CACHE_HOME'] = str(self.directory)
+
+    def tearDown(self):
+        if self.xdg_cache_home is None:
+            del os.environ['XDG_CACHE_HOME']
+        else:
+            os.environ['XDG_CACHE_HOME'] = self.xdg_cache_home
+
+        shutil.rmtree(str(self.directory))
+
+    def write_source(self, plugins):
+        with open(str(self.source), 'w') as data_file:
+            json.dump(plugins, data_file)
+
+    def test_load(self):
+        cache = Lv2PluginsCache(self.source, self.cache_path)
+        records = cache.load()
+
+        self.assertTrue(self.cache_path.exists())
+        self.assertEqual([Lv2PluginsCache.record(plugin) for plugin in self.plugins], records)
+        self.assertNotIn('gui', records[0])
+
+        plugin = self.plugins[2]
+        self.assertEqual(Lv2PluginsCache.record(plugin), Lv2PluginsCache(self.source, self.cache_path).read(plugin['uri']))
+
+    def test_read_json(self):
+        cache = Lv2PluginsCache(self.source, self.cache_path)
+
+        for plugin in self.plugins:
+            self.assertEqual(plugin, cache.read_json(plugin['uri']))
+
+        with self.assertRaises(KeyError):
+            cache.read_json('nonexistent')
+
+        file = self.directory / 'file'
+        file.touch()
+
+        unwritable = Lv2PluginsCache(self.source, file / 'plugins.cache')
+        self.assertEqual(self.plugins[1], unwritable.read_json(self.plugins[1]['uri']))
+
+    def test_from_metadata(self):
+        cache = Lv2PluginsCache.from_metadata(self.plugins)
+
+        self.assertEqual([Lv2PluginsCache.record(plugin) for plugin in self.plugins], cache.load())
+        self.assertEqual(Lv2PluginsCache.record(self.plugins[3]), cache.read(self.plugins[3]['uri']))
+        self.assertEqual(self.plugins[3], cache.read_json(self.plugins[3]['uri']))
+        self.assertFalse((self.directory / 'pluginsmanager').exists())
+
+    def test_record(self):
+        with open(str(Lv2EffectBuilder.plugins_json_file)) as data_file:
+            plugin = next(plugin for plugin in json.load(data_file) if plugin['uri'] == 'http://calf.sourceforge.net/plugins/Reverb')
+
+        record = Lv2PluginsCache.record(plugin)
+
+        param = record['ports']['control']['input'][0]
+        self.assertEqual({'index', 'name', 'symbol', 'ranges'}, set(param.keys()))
+        self.assertEqual(plugin['ports']['control']['input'][0]['ranges'], param['ranges'])
+
+        audio_input = record['ports']['audio']['input'][0]
+        self.assertEqual({'index', 'name', 'symbol'}, set(audio_input.keys()))
+        self.assertEqual(len(plugin['ports']['audio']['output']), len(record['ports']['audio']['output']))
+
+    def test_not_rebuild_valid_cache(self):
+        Lv2PluginsCache(self.source, self.cache_path).load()
+        modified = self.cache_path.stat().st_mtime_ns
+
+        cache = Lv2PluginsCache(self.source, self.cache_path)
+        cache.load()
+
+        self.assertEqual(modified, self.cache_path.stat().st_mtime_ns)
+
+    def test_rebuild_when_source_changes(self):
+        Lv2PluginsCache(self.source, self.cache_path).load()
+
+        self.write_source(self.plugins[:2])
+        records = Lv2PluginsCache(self.source, self.cache_path).load()
+
+        self.assertEqual(2, len(records))
+
+    def test_rebuild_corrupted_cache(self):
+        self.cache_path.parent.mkdir()
+        with open(str(self.cache_path), 'wb') as file:
+            file.write(Lv2PluginsCache.MAGIC + b'corrupted')
+
+        records = Lv2PluginsCache(self.source, self.cache_path).load()
+
+        self.assertEqual(len(self.plugins), len(records))
+
+    def test_unwritable_cache_directory(self):
+        file = self.directory / 'file'
+        file.touch()
+
+        cache = Lv2PluginsCache(self.source, file / 'plugins.cache')
+
+        self.assertEqual(len(self.plugins), len(cache.load()))
+        self.assertEqual(Lv2PluginsCache.record(self.plugins[0]), cache.read(self.plugins[0]['uri']))
+
+    def test_default_path(self):
+        path = Lv2PluginsCache.default_path(self.source)
+        self.assertEqual(self.directory / 'pluginsmanager', path.parent)
+
+    def test_builder_full_json_on_demand(self):
+        builder = Lv2EffectBuilder(self.source, ignore_unsupported_plugins=False)
+
+        expected = self.plugins[0]
+        plugin = builder.all[expected['uri']]
+
+        self.assertEqual(expected['name'], plugin['name'])
+        self.assertEqual(expected['bundles'], plugin['bundles'])
+        self.assertEqual(expected, plugin.json)
+
+        # The complete metadata isn't kept
+        self.assertNotIn('bundles', plugin._json)
+        self.assertIsNot(plugin.json, plugin.json)
+
+    def test_builder_lazy(self):
+        builder = Lv2EffectBuilder(self.source, ignore_unsupported_plugins=False, lazy=True, max_loaded_plugins=2)
+
+        self.assertEqual({plugin['uri'] for plugin in self.plugins}, builder.plugins)
+        self.assertEqual(0, len(builder._lazy_plugins))
+
+        first, second, third = (plugin['uri'] for plugin in self.plugins[:3])
+
+        effect = builder.build(first)
+        self.assertEqual(self.plugins[0]['name'], str(effect))
+        self.assertIs(effect.plugin, builder.build(first).plugin)
+
+        builder.build(second)
+        builder.build(first)
+        builder.build(third)
+
+        self.assertEqual([first, third], list(builder._lazy_plugins.keys()))
@@ -0,0 +1,75 @@
+# Copyright 2017 SrMouraSilva
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+from pluginsmanager.model.lv2.lv2_effect_builder import Lv2EffectBuilder
+from pluginsmanager.model.lv2.lv2_plugins_index import Lv2PluginsIndex
+
+
+class Lv2PluginsIndexTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.builder = Lv2EffectBuilder(ignore_unsupported_plugins=False)
+        cls.plugins = list(cls.builder.all.values())
+        cls.index = Lv2PluginsIndex(cls.plugins)
+
+    def linear_search(self, predicate):
+        found = [plugin for plugin in self.plugins if predicate(plugin)]
+        return sorted(found, key=lambda plugin: (plugin['name'].lower(), plugin['uri']))
+
+    def test_search_all(self):
+        self.assertEqual(len(self.plugins), len(self.index))
+        self.assertEqual(
+            [plugin['uri'] for plugin in self.linear_search(lambda plugin: True)],
+            self.index.search()
+        )
+
+    def test_search_text(self):
+        expected = self.linear_search(lambda plugin: 'Reverb' in plugin['category'])
+
+        found = self.index.search('reverb')
+        for plugin in expected:
+            self.assertIn(plugin['uri'], found)
+
+        self.assertIn('http://calf.sourceforge.net/plugins/Reverb', self.index.search('Calf rever'))
+        self.assertEqual([], self.index.search('calf nonexistent'))
+
+    def test_search_facets(self):
+        def stereo_reverb(plugin):
+            return 'reverb' in Lv2PluginsIndex.tokenize(plugin['name'] + ' ' + ' '.join(plugin['category'])) \
+               and len(plugin['ports']['audio']['input']) == 2 \
+               and len(plugin['ports']['audio']['output']) == 2
+
+        expected = [plugin['uri'] for plugin in self.linear_search(stereo_reverb)]
+
+        self.assertNotEqual([], expected)
+        self.assertEqual(expected, [
+            uri for uri in self.index.search('reverb', audio_inputs=2, audio_outputs=2)
+            if uri in expected
+        ])
+
+        for uri in self.index.search('reverb', audio_inputs=2, audio_outputs=2):
+            plugin = self.builder.all[uri]
+            self.assertEqual(2, len(plugin['ports']['audio']['input']))
+            self.assertEqual(2, len(plugin['ports']['audio']['output']))
+
+    def test_unknown_facet(self):
+        with self.assertRaises(KeyError):
+            self.index.search(cv_inputs=1)
+
+    def test_builder_search(self):
+        plugins = self.builder.search('calf reverb', audio_inputs=2)
+        self.assertIn(self.builder.all['http://calf.sourceforge.net/plugins/Reverb'], plugins)
@@ -12,8 +12,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import tempfile
+import threading
 import unittest
-from unittest.mock import MagicMock
+from pathlib import Path
+from unittest.mock import ANY, MagicMock, patch
 
 from pluginsmanager.banks_manager import BanksManager
 from pluginsmanager.model.bank import Bank
@@ -21,6 +24,7 @@ from pluginsmanager.model.lv2.lv2_effect_builder import Lv2EffectBuilder
 from pluginsmanager.model.pedalboard import Pedalboard
 from pluginsmanager.model.system.system_effect import SystemEffect
 from pluginsmanager.observer.autosaver.autosaver import Autosaver
+from pluginsmanager.observer.autosaver.persistence import Persistence
 
 
 class AutoSaverTest(unittest.TestCase):
@@ -205,3 +209,246 @@ class AutoSaverTest(unittest.TestCase):
 
         while manager.banks:
             manager.banks.pop()
+
+    def test_save_delay(self):
+        save_mock = MagicMock()
+        delete_mock = MagicMock()
+
+        observer = Autosaver('test/autosaver_data/', save_delay=60)
+        observer.banks_files.save_changes = save_mock
+        observer.banks_files.delete_bank = delete_mock
+
+        manager = BanksManager()
+        manager.register(observer)
+
+        bank = Bank('Bank 1')
+        bank2 = Bank('Bank 2')
+        manager.append(bank)
+        manager.append(bank2)
+        bank.append(Pedalboard('Rocksmith'))
+        bank.append(Pedalboard('Rocksmith 2'))
+
+        save_mock.assert_not_called()
+
+        # Removal is immediate
+        manager.banks.remove(bank2)
+        delete_mock.assert_called_once_with(bank2)
+
+        observer.close()
+        save_mock.assert_called_once_with(banks=[bank], manifests=[bank], pedalboards=list(bank.pedalboards))
+
+    def test_batch(self):
+        observer = self.autosaver()
+        observer.banks_files.save_changes = MagicMock()
+        observer.index_file.save = MagicMock()
+
+        manager = BanksManager()
+        manager.register(observer)
+
+        bank = Bank('Bank 1')
+        builder = Lv2EffectBuilder()
+
+        with manager.batch():
+            manager.append(bank)
+            for name in ('Pedalboard 1', 'Pedalboard 2'):
+                pedalboard = Pedalboard(name)
+                bank.append(pedalboard)
+                pedalboard.append(builder.build('http://calf.sourceforge.net/plugins/Reverb'))
+                pedalboard.effects[0].params[0].value = pedalboard.effects[0].params[0].maximum
+
+        observer.banks_files.save_changes.assert_called_once_with(
+            banks=[bank], manifests=[bank], pedalboards=list(bank.pedalboards)
+        )
+        observer.index_file.save.assert_called_once_with(manager)
+
+    def test_save_delay_timeout(self):
+        saved = threading.Event()
+
+        observer = Autosaver('test/autosaver_data/', save_delay=0.01)
+        observer.banks_files.save_changes = MagicMock(side_effect=lambda **changes: saved.set())
+
+        manager = BanksManager()
+        manager.register(observer)
+
+        bank = Bank('Bank 1')
+        manager.append(bank)
+
+        self.assertTrue(saved.wait(5))
+        observer.banks_files.save_changes.assert_called_once_with(banks=[bank], manifests=[], pedalboards=[])
+
+    def test_split_pedalboards(self):
+        builder = Lv2EffectBuilder()
+
+        with tempfile.TemporaryDirectory() as data_path:
+            observer = Autosaver(data_path, split_pedalboards=True)
+
+            manager = BanksManager()
+            manager.register(observer)
+
+            bank = Bank('Bank 1')
+            manager.append(bank)
+
+            pedalboard1 = Pedalboard('Rocksmith')
+            pedalboard2 = Pedalboard('Rocksmith 2')
+            bank.append(pedalboard1)
+            bank.append(pedalboard2)
+
+            reverb = builder.build('http://calf.sourceforge.net/plugins/Reverb')
+            pedalboard1.append(reverb)
+
+            bank_path = Path(data_path) / bank.uuid
+            self.assertTrue((bank_path / 'bank.json').exists())
+            self.assertTrue((bank_path / '{}.json'.format(pedalboard2.uuid)).exists())
+
+            # Only the pedalboard file is rewritten
+            with patch.object(Persistence, 'save_many', wraps=Persistence.save_many) as save_many:
+                reverb.params[0].value = reverb.params[0].maximum
+
+                files = save_many.call_args[0][0]
+                self.assertEqual([bank_path / '{}.json'.format(pedalboard1.uuid)], [path for path, data in files])
+
+            persisted = Autosaver(data_path, split_pedalboards=True).load(None)
+            self.assertEqual(manager.banks[0].json, persisted.banks[0].json)
+            self.assertEqual(pedalboard1.uuid, persisted.banks[0].pedalboards[0].uuid)
+
+            bank.pedalboards.remove(pedalboard2)
+            self.assertFalse((bank_path / '{}.json'.format(pedalboard2.uuid)).exists())
+
+            manager.banks.remove(bank)
+            self.assertFalse(bank_path.exists())
+
+    def test_journal(self):
+        builder = Lv2EffectBuilder()
+
+        with tempfile.TemporaryDirectory() as data_path:
+            observer = Autosaver(data_path, journal=True)
+
+            manager = BanksManager()
+            manager.register(observer)
+
+            bank = Bank('Bank 1')
+            pedalboard = Pedalboard('Rocksmith')
+            reverb = builder.build('http://calf.sourceforge.net/plugins/Reverb')
+            pedalboard.append(reverb)
+            bank.append(pedalboard)
+            manager.append(bank)
+
+            observer.flush()
+            self.assertEqual([], observer.journal.records())
+
+            # Changes are appended, the bank file isn't rewritten
+            with patch.object(Persistence, 'save_many', wraps=Persistence.save_many) as save_many:
+                reverb.params[0].value = reverb.params[0].minimum
+                reverb.params[0].value = reverb.params[0].maximum
+                reverb.toggle()
+                pedalboard.name = 'Rocksmith 2'
+
+                saved = [path.name for call in save_many.call_args_list for path, data in call[0][0]]
+                self.assertNotIn('{}.json'.format(bank.uuid), saved)
+
+            self.assertEqual(['param', 'param', 'status', 'pedalboard'],
+                             [record['type'] for record in observer.journal.records()])
+
+            bank2 = Bank('Bank 2')
+            manager.append(bank2)
+            manager.banks.remove(bank2)
+
+            # Replays the journal over the bank saved
+            persisted = Autosaver(data_path, journal=True).load(None)
+
+            self.assertEqual(1, len(persisted.banks))
+            self.assertEqual(bank.json, persisted.banks[0].json)
+            self.assertEqual([], observer.journal.records())
+
+    def test_journal_compaction(self):
+        builder = Lv2EffectBuilder()
+
+        with tempfile.TemporaryDirectory() as data_path:
+            observer = Autosaver(data_path, journal=True, journal_compaction=3)
+
+            manager = BanksManager()
+            manager.register(observer)
+
+            bank = Bank('Bank 1')
+            pedalboard = Pedalboard('Rocksmith')
+            reverb = builder.build('http://calf.sourceforge.net/plugins/Reverb')
+            pedalboard.append(reverb)
+            bank.append(pedalboard)
+            manager.append(bank)
+
+            reverb.params[0].value = reverb.params[0].minimum
+            self.assertEqual(2, len(observer.journal.records()))
+
+            reverb.params[0].value = reverb.params[0].maximum
+            self.assertEqual([], observer.journal.records())
+
+            persisted = Autosaver(data_path).load(None)
+            self.assertEqual(bank.json, persisted.banks[0].json)
+
+    def test_journal_batch(self):
+        builder = Lv2EffectBuilder()
+
+        with tempfile.TemporaryDirectory() as data_path:
+            observer = Autosaver(data_path, journal=True)
+
+            manager = BanksManager()
+            manager.register(observer)
+
+            bank = Bank('Bank 1')
+            pedalboard = Pedalboard('Rocksmith')
+            reverb = builder.build('http://calf.sourceforge.net/plugins/Reverb')
+            pedalboard.append(reverb)
+            bank.append(pedalboard)
+            manager.append(bank)
+            observer.flush()
+
+            # The records of a batch are synchronized with the disk once
+            with patch('os.fsync') as fsync:
+                with manager.batch():
+                    reverb.params[0].value = reverb.params[0].minimum
+                    reverb.params[1].value = reverb.params[1].minimum
+                    reverb.toggle()
+
+                fsync.assert_called_once_with(ANY)
+
+            self.assertEqual(['param', 'param', 'status'],
+                             [record['type'] for record in observer.journal.records()])
+
+            # The records kept from a previous execution are counted for the compaction
+            self.assertEqual(3, Autosaver(data_path, journal=True).journal.total)
+
+    def test_lazy_load(self):
+        builder = Lv2EffectBuilder()
+
+        with tempfile.TemporaryDirectory() as data_path:
+            observer = Autosaver(data_path)
+
+            manager = BanksManager()
+            manager.register(observer)
+
+            bank = Bank('Bank 1')
+            manager.append(bank)
+            bank.append(Pedalboard('Rocksmith'))
+            bank.append(Pedalboard('Rocksmith 2'))
+            bank.pedalboards[0].name = 'Rocksmith 1'
+            bank.pedalboards[1].append(builder.build('http://calf.sourceforge.net/plugins/Reverb'))
+
+            autosaver = Autosaver(data_path)
+            with patch.object(autosaver.banks_files, 'load_bank', wraps=autosaver.banks_files.load_bank) as load_bank:
+                persisted = autosaver.load(None, lazy=True)
+                persisted_bank = persisted.banks[0]
+
+                load_bank.assert_not_called()
+                self.assertFalse(persisted_bank.loaded)
+                self.assertEqual('Bank 1', persisted_bank.name)
+                self.assertEqual(['Rocksmith 1', 'Rocksmith 2'], persisted_bank.pedalboards_names)
+
+                self.assertEqual(bank.json, persisted_bank.json)
+                load_bank.assert_called_once_with(bank.uuid, None)
+                self.assertTrue(persisted_bank.loaded)
+
+            # Pedalboards loaded are observed
+            reverb = persisted_bank.pedalboards[1].effects[0]
+            reverb.toggle()
+
+            self.assertEqual(persisted_bank.json, Autosaver(data_path).load(None).banks[0].json)
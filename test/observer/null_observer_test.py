@@ -0,0 +1,66 @@
+# Copyright 2017 SrMouraSilva
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+from unittest.mock import MagicMock
+
+from pluginsmanager.banks_manager import BanksManager
+from pluginsmanager.model.bank import Bank
+from pluginsmanager.model.pedalboard import Pedalboard
+from pluginsmanager.observer.null_observer import NullObserver
+from pluginsmanager.observer.update_type import UpdateType
+
+
+class NullObserverTest(unittest.TestCase):
+
+    def test_singleton(self):
+        self.assertIs(NullObserver(), NullObserver())
+
+    def test_ignore_changes(self):
+        observer = NullObserver()
+
+        observer.on_bank_updated(None, UpdateType.CREATED, index=0, origin=None)
+        observer.on_pedalboard_updated(None, UpdateType.CREATED, index=0, origin=None)
+        observer.on_effect_updated(None, UpdateType.CREATED, index=0, origin=None)
+        observer.on_effect_status_toggled(None)
+        observer.on_param_value_changed(None)
+        observer.on_connection_updated(None, UpdateType.CREATED, pedalboard=None)
+        observer.on_custom_change('identifier', 1, key='value')
+        observer.on_batch([])
+
+    def test_default_observer(self):
+        bank = Bank('Bank 1')
+        pedalboard = Pedalboard('Pedalboard 1')
+
+        self.assertIs(NullObserver(), bank.observer)
+        self.assertIs(NullObserver(), pedalboard.observer)
+
+        bank.append(pedalboard)
+        bank.pedalboards.remove(pedalboard)
+        self.assertIs(NullObserver(), pedalboard.observer)
+
+    def test_removed_bank(self):
+        observer = MagicMock()
+
+        manager = BanksManager()
+        manager.register(observer)
+
+        bank = Bank('Bank 1')
+        manager.append(bank)
+        manager.banks.remove(bank)
+        self.assertIs(NullObserver(), bank.observer)
+
+        observer.reset_mock()
+        bank.append(Pedalboard('Pedalboard 1'))
+        observer.on_pedalboard_updated.assert_not_called()
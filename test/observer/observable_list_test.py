@@ -236,3 +236,51 @@ class ObservableListTest(unittest.TestCase):
         lista.move(a, same_index)
 
         lista.observer.assert_not_called()
+
+    def test_index(self):
+        a = {'key': 'value'}
+        b = {'key2': 'value2'}
+        c = {'key3': 'value3'}
+
+        lista = ObservableList()
+        lista.append(a)
+        lista.append(b)
+        lista.append(a)
+
+        self.assertEqual(0, lista.index(a))
+        self.assertEqual(1, lista.index(b))
+        self.assertEqual(1, lista.index({'key2': 'value2'}))
+
+        lista.insert(0, c)
+        self.assertEqual(1, lista.index(a))
+        self.assertEqual(2, lista.index(b))
+
+        del lista[0]
+        lista.remove(a)
+        self.assertEqual(0, lista.index(b))
+        self.assertEqual(1, lista.index(a))
+
+        lista[0] = c
+        self.assertEqual(0, lista.index(c))
+
+        lista.real_list.insert(0, b)
+        self.assertEqual(1, lista.index(c))
+
+        with self.assertRaises(ValueError):
+            lista.index({'key4': 'value4'})
+
+    def test_index_real_list_changed(self):
+        a = {'key': 'value'}
+        b = {'key2': 'value2'}
+
+        lista = ObservableList()
+        lista.append(b)
+        lista.append(a)
+        self.assertEqual(1, lista.index(a))
+
+        lista.real_list[0] = a
+        self.assertEqual(0, lista.index(a))
+
+        lista.real_list = [b, b, a]
+        self.assertEqual(0, lista.index(b))
+        self.assertEqual(2, lista.index(a))
@@ -0,0 +1,113 @@
+# Copyright 2017 SrMouraSilva
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from pluginsmanager.observer.autosaver.persistence import Persistence
+
+
+class PersistenceTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = Path(self.directory.name) / 'bank.json'
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_save(self):
+        Persistence.save(self.path, {'name': 'Bank 1'})
+        Persistence.save(self.path, {'name': 'Bank 2'})
+
+        self.assertEqual({'name': 'Bank 2'}, Persistence.read(self.path))
+        self.assertEqual({'name': 'Bank 1'}, Persistence.read(Persistence._backup_path(self.path)))
+        self.assertFalse(Persistence._temporary_path(self.path).exists())
+
+    def test_save_many(self):
+        path2 = Path(self.directory.name) / 'bank2.json'
+
+        Persistence.save_many([(self.path, {'name': 'Bank 1'}), (path2, {'name': 'Bank 2'})])
+
+        self.assertEqual({'name': 'Bank 1'}, Persistence.read(self.path))
+        self.assertEqual({'name': 'Bank 2'}, Persistence.read(path2))
+
+    @unittest.skipUnless(hasattr(os, 'sync'), 'os.sync is required')
+    def test_save_many_batch_sync(self):
+        paths = [Path(self.directory.name) / 'bank{}.json'.format(i) for i in range(3)]
+        items = [(path, {'name': path.name}) for path in paths]
+
+        with patch('os.fsync') as fsync, patch('os.sync') as sync:
+            Persistence.save_many(items)
+            # One per file and one for the directory
+            self.assertEqual(4, fsync.call_count)
+            sync.assert_not_called()
+
+            fsync.reset_mock()
+            Persistence.save_many(items, batch_sync=True)
+            # Only the directory
+            self.assertEqual(1, fsync.call_count)
+            sync.assert_called_once_with()
+
+        for path in paths:
+            self.assertEqual({'name': path.name}, Persistence.read(path))
+            self.assertFalse(Persistence._temporary_path(path).exists())
+
+    def test_read_corrupted(self):
+        Persistence.save(self.path, {'name': 'Bank 1'})
+        Persistence.save(self.path, {'name': 'Bank 2'})
+
+        with open(str(self.path), 'w') as file:
+            file.write('{"name": "Ba')
+
+        self.assertEqual({'name': 'Bank 1'}, Persistence.read(self.path))
+
+    def test_recover(self):
+        Persistence.save(self.path, {'name': 'Bank 1'})
+        Persistence.save(self.path, {'name': 'Bank 2'})
+
+        # Power cut: new file incomplete
+        with open(str(self.path), 'w') as file:
+            file.write('{"name": "Ba')
+        with open(str(Persistence._temporary_path(self.path)), 'w') as file:
+            file.write('{"na')
+
+        Persistence.recover(self.directory.name)
+
+        self.assertEqual({'name': 'Bank 1'}, Persistence.read(self.path))
+        self.assertFalse(Persistence._temporary_path(self.path).exists())
+
+    def test_recover_file_not_replaced(self):
+        Persistence.save(self.path, {'name': 'Bank 1'})
+        Persistence.save(self.path, {'name': 'Bank 2'})
+
+        # Power cut: after the file has been moved to the backup
+        Persistence._backup_path(self.path).unlink()
+        self.path.rename(Persistence._backup_path(self.path))
+
+        Persistence.recover(self.directory.name)
+
+        self.assertEqual({'name': 'Bank 2'}, Persistence.read(self.path))
+
+    def test_delete(self):
+        Persistence.save(self.path, {'name': 'Bank 1'})
+        Persistence.save(self.path, {'name': 'Bank 2'})
+
+        Persistence.delete(self.path)
+
+        self.assertFalse(self.path.exists())
+        self.assertFalse(Persistence._backup_path(self.path).exists())
@@ -0,0 +1,98 @@
+# Copyright 2017 SrMouraSilva
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+from pluginsmanager.model.pedalboard import Pedalboard
+from pluginsmanager.model.lv2.lv2_effect_builder import Lv2EffectBuilder
+from pluginsmanager.observer.host_observer.standby_pool import StandbyPool
+
+
+class StandbyPoolTest(unittest.TestCase):
+    builder = None
+
+    @classmethod
+    def setUpClass(cls):
+        cls.builder = Lv2EffectBuilder()
+
+    def generate_pedalboard(self, name, total_effects):
+        pedalboard = Pedalboard(name)
+        for i in range(total_effects):
+            pedalboard.append(self.builder.build('http://calf.sourceforge.net/plugins/Reverb'))
+
+        return pedalboard
+
+    def test_disabled_by_default(self):
+        pool = StandbyPool()
+
+        self.assertFalse(pool.accepts(Pedalboard('Pedalboard')))
+
+    def test_accepts(self):
+        pool = StandbyPool(max_pedalboards=1, max_effects=2)
+
+        self.assertTrue(pool.accepts(self.generate_pedalboard('Two', 2)))
+        self.assertFalse(pool.accepts(self.generate_pedalboard('Three', 3)))
+
+    def test_lru_max_pedalboards(self):
+        pool = StandbyPool(max_pedalboards=2)
+
+        pedalboard1 = self.generate_pedalboard('1', 1)
+        pedalboard2 = self.generate_pedalboard('2', 1)
+        pedalboard3 = self.generate_pedalboard('3', 1)
+
+        self.assertEqual([], pool.append(pedalboard1))
+        self.assertEqual([], pool.append(pedalboard2))
+        # Pedalboard 1 is now the most recently used
+        self.assertEqual([], pool.append(pedalboard1))
+        self.assertEqual([pedalboard2], pool.append(pedalboard3))
+
+        self.assertEqual([pedalboard1, pedalboard3], list(pool))
+        self.assertNotIn(pedalboard2, pool)
+
+    def test_lru_max_effects(self):
+        pool = StandbyPool(max_pedalboards=3, max_effects=4)
+
+        pedalboard1 = self.generate_pedalboard('1', 2)
+        pedalboard2 = self.generate_pedalboard('2', 1)
+        pedalboard3 = self.generate_pedalboard('3', 4)
+
+        pool.append(pedalboard1)
+        pool.append(pedalboard2)
+        self.assertEqual(3, pool.total_effects)
+
+        self.assertEqual([pedalboard1, pedalboard2], pool.append(pedalboard3))
+        self.assertEqual([pedalboard3], list(pool))
+
+    def test_remove(self):
+        pool = StandbyPool(max_pedalboards=2)
+        pedalboard = self.generate_pedalboard('1', 1)
+
+        pool.append(pedalboard)
+        pool.remove(pedalboard)
+
+        self.assertEqual(0, len(pool))
+
+    def test_evict_after_pedalboard_grows(self):
+        pool = StandbyPool(max_pedalboards=2, max_effects=3)
+
+        pedalboard1 = self.generate_pedalboard('1', 1)
+        pedalboard2 = self.generate_pedalboard('2', 1)
+        pool.append(pedalboard1)
+        pool.append(pedalboard2)
+
+        pedalboard2.append(self.builder.build('http://calf.sourceforge.net/plugins/Reverb'))
+        pedalboard2.append(self.builder.build('http://calf.sourceforge.net/plugins/Reverb'))
+
+        self.assertEqual([pedalboard1], pool.evict())
+        self.assertEqual([pedalboard2], list(pool))
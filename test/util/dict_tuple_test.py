@@ -33,3 +33,25 @@ class DictTupleTest(unittest.TestCase):
 
         self.assertTrue('ABC' in data)
         self.assertFalse('abc' in data)
+
+    def test_shared_index(self):
+        index = {'a': 0, 'b': 1}
+
+        first = DictTuple(['A', 'B'], index=index)
+        second = DictTuple(['A2', 'B2'], index=index)
+
+        self.assertEqual('B', first['b'])
+        self.assertEqual('B2', second['b'])
+        self.assertEqual(('A', ), first[:1])
+        self.assertTrue('a' in second)
+
+    def test_index(self):
+        elements = [['a'], ['b'], ['c']]
+        data = DictTuple(elements, lambda e: e[0])
+
+        for position, element in enumerate(elements):
+            self.assertEqual(position, data.index(element))
+
+        self.assertEqual(1, data.index(['b']))
+        with self.assertRaises(ValueError):
+            data.index(['d'])
@@ -0,0 +1,98 @@
+# Copyright 2017 SrMouraSilva
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+from pluginsmanager.model.lv2.lv2_effect_builder import Lv2EffectBuilder
+from pluginsmanager.model.pedalboard import Pedalboard
+from pluginsmanager.model.system.system_effect import SystemEffect
+from pluginsmanager.util.pairs_list import PairsList
+from pluginsmanager.util.pedalboard_diff import PedalboardDiff
+
+
+class PedalboardDiffTest(unittest.TestCase):
+    builder = None
+
+    @classmethod
+    def setUpClass(cls):
+        cls.builder = Lv2EffectBuilder()
+
+    def setUp(self):
+        self.diff = PedalboardDiff(PairsList(lambda effect: effect.plugin['uri']))
+        self.sys_effect = SystemEffect('system', ('capture_1', 'capture_2'), ('playback_1', 'playback_2'))
+
+    def pedalboard(self, name):
+        pedalboard = Pedalboard(name)
+        reverb = self.builder.build('http://calf.sourceforge.net/plugins/Reverb')
+        filter = self.builder.build('http://calf.sourceforge.net/plugins/Filter')
+
+        pedalboard.append(reverb)
+        pedalboard.append(filter)
+
+        pedalboard.connect(self.sys_effect.outputs[0], reverb.inputs[0])
+        pedalboard.connect(reverb.outputs[0], filter.inputs[0])
+        pedalboard.connect(filter.outputs[0], self.sys_effect.inputs[0])
+
+        return pedalboard
+
+    def test_equal_pedalboards(self):
+        plan = self.diff.calculate(self.pedalboard('A'), self.pedalboard('B'))
+
+        self.assertEqual(0, len(plan))
+        self.assertEqual(2, len(plan.effects_pairs))
+
+    def test_params_and_status(self):
+        current = self.pedalboard('A')
+        pedalboard = self.pedalboard('B')
+
+        param = pedalboard.effects[0].params[0]
+        param.value = param.maximum
+        pedalboard.effects[1].toggle()
+
+        plan = self.diff.calculate(current, pedalboard)
+
+        self.assertEqual([param], plan.params_to_set)
+        self.assertEqual([pedalboard.effects[1]], plan.effects_status_to_set)
+        self.assertEqual(2, len(plan))
+
+    def test_connections(self):
+        current = self.pedalboard('A')
+        pedalboard = self.pedalboard('B')
+
+        reverb, filter = pedalboard.effects
+        pedalboard.disconnect(reverb.outputs[0], filter.inputs[0])
+        pedalboard.connect(reverb.outputs[1], filter.inputs[0])
+
+        plan = self.diff.calculate(current, pedalboard)
+
+        self.assertEqual([current.connections[1]], plan.connections_to_remove)
+        self.assertEqual([pedalboard.connections[-1]], plan.connections_to_add)
+        self.assertEqual(2, len(plan))
+
+    def test_effects(self):
+        current = self.pedalboard('A')
+        pedalboard = self.pedalboard('B')
+
+        reverb, filter = pedalboard.effects
+        pedalboard.effects.remove(filter)
+        delay = self.builder.build('http://calf.sourceforge.net/plugins/VintageDelay')
+        pedalboard.append(delay)
+        pedalboard.connect(reverb.outputs[0], delay.inputs[0])
+
+        plan = self.diff.calculate(current, pedalboard)
+
+        self.assertEqual([current.effects[1]], plan.effects_to_remove)
+        self.assertEqual([delay], plan.effects_to_add)
+        self.assertEqual([current.connections[1], current.connections[2]], plan.connections_to_remove)
+        self.assertEqual([pedalboard.connections[-1]], plan.connections_to_add)
@@ -12,8 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import unittest
+import json
 import os
+import tempfile
+import unittest
 
 from pluginsmanager.model.bank import Bank
 from pluginsmanager.model.pedalboard import Pedalboard
@@ -103,6 +105,35 @@ class PersistenceTest(unittest.TestCase):
         with self.assertRaises(PersistenceDecoderError):
             PersistenceDecoder(system_effect).read(bank_data)
 
+    def test_read_files(self):
+        util = PersistenceDecoder(self.system_effect)
+
+        bank1 = self.bank()
+        bank2 = Bank('Bank 2')
+        bank2.append(Pedalboard('Pedalboard 1'))
+
+        with tempfile.TemporaryDirectory() as path:
+            paths = []
+            for index, bank in enumerate((bank1, bank2)):
+                paths.append(os.path.join(path, '{}.json'.format(index)))
+                with open(paths[-1], 'w') as file:
+                    json.dump(bank.json, file)
+
+            banks = util.read_files(paths, workers=2)
+
+        self.maxDiff = None
+        self.assertEqual([bank1.json, bank2.json], [bank.json for bank in banks])
+
+    def test_validate(self):
+        bank = self.bank()
+        PersistenceDecoder.validate(bank.json)
+
+        data = bank.json
+        del data['pedalboards'][0]['effects'][0]['plugin']
+
+        with self.assertRaises(PersistenceDecoderError):
+            PersistenceDecoder.validate(data)
+
     @unittest.skipIf('TRAVIS' in os.environ, 'Travis not contains audio interface')
     def test_read_system_builder(self):
         from pluginsmanager.model.system.system_effect_builder import SystemEffectBuilder